@@ -12,15 +12,17 @@ from google.adk.tools.load_memory_tool import load_memory
 from google.adk.tools.preload_memory_tool import PreloadMemoryTool
 from google.genai import types
 
-from tools_2 import (read_document, read_scratchpad_tool, write_scratchpad_tool,
+from tools_2 import (read_document_async, search_pdf_tool, read_scratchpad_tool, write_scratchpad_tool,
                               gmail_draft_tool_for_agent, gmail_read_tool_for_agent,
-                              job_tracker_add_tool, job_tracker_update_tool,
+                              job_tracker_add_tool, job_tracker_bulk_add_tool, job_tracker_update_tool,
                               job_tracker_query_tool, cover_letter_generator_tool,
                               cold_email_add_tool, cold_email_update_tool, cold_email_query_tool,
                               network_graph_tool, job_search_tool, job_opportunities_query_tool,
                               cold_email_add_tool, cold_email_update_tool, cold_email_query_tool,
                               network_graph_tool, job_search_tool, job_opportunities_query_tool,
-                              serpapi_usage_tool, job_opportunity_delete_tool, google_scholar_tool,
+                              cold_email_bulk_add_tool, cold_email_bulk_update_tool,
+                              serpapi_usage_tool, job_opportunity_delete_tool, job_description_tool,
+                              google_scholar_tool,
                               elevator_pitch_tool, company_brief_tool, qr_code_tool, portfolio_export_tool)
 
 import os
@@ -60,7 +62,7 @@ else:
 date_today = date.today()
 
 read_document_tool = FunctionTool(
-    func=read_document,
+    func=read_document_async,
     require_confirmation=False  # change to True if you want the agent to ask the user before reading
 )
 
@@ -154,7 +156,7 @@ gmail_search_agent = LlmAgent(
 # ---------------------------------------------------------
 
 read_document_tool = FunctionTool(
-    func=read_document,
+    func=read_document_async,
     require_confirmation=False
 )
 
@@ -209,7 +211,7 @@ root_agent = LlmAgent(
     - If the user asks anything about emails — reading, summarizing, finding, listing, or checking inbox — ALWAYS call the gmail_search_agent. Never answer email-related questions directly.
 
     --------------------------------------------------------------------
-    1. CV / RESUME QUESTIONS → MUST USE read_document TOOL
+    1. CV / RESUME QUESTIONS → MUST USE read_document_async TOOL
     --------------------------------------------------------------------
     If the user asks about:
     - their CV/resume
@@ -217,7 +219,7 @@ root_agent = LlmAgent(
     - tailoring a cover letter or email based on their background
     - writing job applications that depend on their qualifications
 
-    → You MUST call the read_document tool **twice** (once for each file) **before answering**.
+    → You MUST call the read_document_async tool **twice** (once for each file) **before answering**.
     
     1. {"filename": "Professional Curriculum Vitae.docx"}
     2. {"filename": "Resume.docx"}
@@ -227,6 +229,14 @@ root_agent = LlmAgent(
     - Do NOT invent details.
     - If something is missing, explicitly say so.
 
+    For questions about research papers in the user's library, call
+    search_pdf_async(query) and cite the source and page of the passages you use.
+    It returns the 8 best passages (k) without spreading them across papers, so several
+    can come from the same paper; raise k (e.g. 20) when you need a broader survey
+    of the library or the first passages are not enough.
+    For a long PDF in the documents folder, call read_document_async(filename, structure_only=True)
+    to see its outline first, then read_document_async(filename, max_pages=N) if the start is enough.
+
     --------------------------------------------------------------------
     2. GOOGLE SEARCH SUB-AGENT USAGE
     --------------------------------------------------------------------
@@ -294,6 +304,8 @@ root_agent = LlmAgent(
     - User says "I just applied to X for Y position" → call job_tracker_add_tool
     - Capture: company, position, status, date_applied, job_description (if provided)
     - Default status is "applied" unless user specifies otherwise
+    - User gives several applications at once (a list, a pasted spreadsheet) → call job_tracker_bulk_add_tool
+      ONCE with all of them instead of calling job_tracker_add_tool repeatedly
     
     **Updating Applications:**
     - User says "I have an interview at X" → call job_tracker_update_tool with status="interview_scheduled"
@@ -305,6 +317,8 @@ root_agent = LlmAgent(
     - User asks "what interviews do I have?" → job_tracker_query_tool(status="interview_scheduled")
     - User asks "show applications from this week" → job_tracker_query_tool(days_back=7)
     - User asks "what's the status of my Google application?" → job_tracker_query_tool(company="Google")
+    - User asks "which applications mentioned GIS?" → job_tracker_query_tool(text="GIS")
+    - Results come in pages of 20; if the output ends with next_cursor, pass cursor=<that value> (same filters) for more
     
     Valid statuses: applied, interview_scheduled, interviewed, rejected, offer, accepted
 
@@ -365,6 +379,11 @@ root_agent = LlmAgent(
     - User says "Add a note to Z" → call cold_email_update_tool(recipient_name="Z", notes="...")
     - User says "I was referred by A" → call cold_email_update_tool(recipient_name="...", referred_by="A")
 
+    **Batches:**
+    - User sent a mailing to several people → call cold_email_bulk_add_tool ONCE with one item per recipient
+    - Several updates at once ("A and B responded, C never replied") → call cold_email_bulk_update_tool ONCE
+      with one item per person (same fields as cold_email_update_tool)
+
 
     --------------------------------------------------------------------
     8. NETWORK GRAPH VISUALIZATION
@@ -383,7 +402,8 @@ root_agent = LlmAgent(
     When the user asks to search for jobs or monitor opportunities:
 
     **Searching for Jobs:**
-    - Use job_search_tool(query, location, date_posted, max_results)
+    - Use job_search_tool(query, location, date_posted, max_results, max_pages)
+    - max_pages (default 1) follows further result pages for broad searches; each page costs one search
     - Example: job_search_tool(query="Marine Scientist", location="Florida", date_posted="week")
     - Date options: "today", "3days", "week", "month"
     - Results are automatically saved to job_opportunities.json (deduplication built-in)
@@ -391,12 +411,17 @@ root_agent = LlmAgent(
     - The search uses SerpAPI which aggregates from LinkedIn, Indeed, Glassdoor, and more
 
     **Viewing Saved Opportunities:**
-    - Use job_opportunities_query_tool() to see all discovered job opportunities
-    - Filter by: days_back, company, title, sort_by
+    - Use job_opportunities_query_tool() to see discovered job opportunities
+    - Filter by: days_back, company, title, text (keyword search in descriptions), sort_by
     - Examples:
       - job_opportunities_query_tool(days_back=7) - jobs from last week
       - job_opportunities_query_tool(title="Marine") - filter by title
       - job_opportunities_query_tool(company="NOAA") - filter by company
+      - job_opportunities_query_tool(text="coral restoration") - keyword search, best matches first
+    - Results come in pages (limit=20 by default). If the output ends with next_cursor,
+      call again with cursor=<that value> and the same filters only if the user wants more.
+    - Saved opportunities keep only the start of the posting. Use job_description_tool(job_id)
+      for the full text before matching a job to the CV, writing a cover letter or interview prep.
 
     **Checking API Usage:**
     - Use serpapi_usage_tool() to check remaining searches
@@ -463,23 +488,28 @@ root_agent = LlmAgent(
         AgentTool(google_searching_agent),
         AgentTool(gmail_search_agent),
         read_document_tool,
+        search_pdf_tool,
         load_memory,
         write_scratchpad_tool,
         read_scratchpad_tool,
         gmail_draft_tool_for_agent,
         PreloadMemoryTool(),
         job_tracker_add_tool,
+        job_tracker_bulk_add_tool,
         job_tracker_update_tool,
         job_tracker_query_tool,
         cover_letter_generator_tool,
         cold_email_add_tool,
         cold_email_update_tool,
+        cold_email_bulk_add_tool,
+        cold_email_bulk_update_tool,
         cold_email_query_tool,
         network_graph_tool,
         job_search_tool,
         job_opportunities_query_tool,
         serpapi_usage_tool,
         job_opportunity_delete_tool,
+        job_description_tool,
         google_scholar_tool,
         elevator_pitch_tool,
         company_brief_tool,
@@ -10,7 +10,7 @@ import wave
 import pyaudio
 import whisper
 import tempfile
-from pypdf import PdfReader
+import pdf_extract
 from google.genai import types
 from agent import runner, memory_service, get_or_create_session
 
@@ -18,6 +18,9 @@ from agent import runner, memory_service, get_or_create_session
 USER_ID = "Noah_Haag"
 SESSION_ID = "Job_Search"
 
+# Dropped PDFs longer than this are cut off (the rest rarely fits a prompt anyway)
+DROP_MAX_PAGES = 60
+
 # Configuration
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
@@ -164,22 +167,16 @@ class AgentGUI(TkinterDnD_CTk):
             filename = os.path.basename(file_path)
             header = f"\n--- File: {filename} ---\n"
             
+            # PDFs are extracted in the background and streamed in page by page
+            if file_path.lower().endswith('.pdf'):
+                self.update_status(f"Reading {filename}...")
+                threading.Thread(target=self.load_pdf, args=(file_path, header), daemon=True).start()
+                return
+            
             try:
-                # Check if it's a PDF
-                if file_path.lower().endswith('.pdf'):
-                    reader = PdfReader(file_path)
-                    content = ""
-                    for page_num, page in enumerate(reader.pages, 1):
-                        page_text = page.extract_text()
-                        if page_text:
-                            content += f"\n[Page {page_num}]\n{page_text}\n"
-                    
-                    if not content.strip():
-                        content = "(PDF appears to be empty or text could not be extracted)"
-                else:
-                    # Try reading as text file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                # Try reading as text file
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
                 
                 # Insert into input box
                 self.user_input.insert("end", header + content + "\n")
@@ -188,6 +185,30 @@ class AgentGUI(TkinterDnD_CTk):
                 self.update_status(f"Error reading file: {e}")
                 self.append_message("System", f"Error reading file {file_path}: {e}")
 
+    def load_pdf(self, file_path, header):
+        """Extract a dropped PDF off the UI thread, inserting pages in order as they are ready."""
+        filename = os.path.basename(file_path)
+        try:
+            total = pdf_extract.page_count(file_path)
+            pages = min(total, DROP_MAX_PAGES)
+            self.schedule_ui_update(self.user_input.insert, "end", header)
+            found_text = False
+            for page_num, page_text in pdf_extract.iter_pages(file_path, max_pages=DROP_MAX_PAGES):
+                if page_text:
+                    found_text = True
+                    self.schedule_ui_update(self.user_input.insert, "end", f"\n[Page {page_num}]\n{page_text}\n")
+                self.schedule_ui_update(self.update_status, f"Reading {filename}: page {page_num}/{pages}")
+            
+            if not found_text:
+                self.schedule_ui_update(self.user_input.insert, "end", "(PDF appears to be empty or text could not be extracted)")
+            if total > DROP_MAX_PAGES:
+                self.schedule_ui_update(self.user_input.insert, "end", f"\n(Only the first {DROP_MAX_PAGES} of {total} pages were loaded.)")
+            self.schedule_ui_update(self.user_input.insert, "end", "\n")
+            self.schedule_ui_update(self.update_status, f"Loaded file: {filename}")
+        except Exception as e:
+            self.schedule_ui_update(self.update_status, f"Error reading file: {e}")
+            self.schedule_ui_update(self.append_message, "System", f"Error reading file {file_path}: {e}")
+
     def toggle_recording(self):
         """Toggle audio recording on/off."""
         if not self.is_recording:
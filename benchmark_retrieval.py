@@ -0,0 +1,361 @@
+"""
+Retrieval benchmark for the research-paper search (search_pdf).
+
+Builds a corpus with labeled query -> chunk pairs, loads it into a scratch
+vector store and reports, per retrieval configuration, p50/p95 query
+latency, recall@k and memory:
+
+    python benchmark_retrieval.py                                  # synthetic corpus, hashing embeddings
+    python benchmark_retrieval.py --papers 500 --chunks-per-paper 20
+    python benchmark_retrieval.py --config hybrid:8:50 --config hybrid:8:250 --config mmr:25:250
+    python benchmark_retrieval.py --fixture bench.json --embeddings ollama --store chroma
+
+Configurations are "<method>:<k>[:<fetch_k>]":
+
+- hybrid: BM25 prefilter + fused keyword/vector rerank (what search_pdf uses)
+- mmr:    Chroma-style maximal marginal relevance (the previous search_pdf)
+- vector: plain nearest-neighbour search
+- local:  the NumPy hashed TF-IDF index search_pdf falls back to without
+          Ollama (local_paper_index.py); it ignores --embeddings/--store
+
+The synthetic corpus is deterministic (--seed): each chunk mixes topic words
+with a few made-up names (sites, species codes) that only it contains, and
+each query asks for some of those names plus topic words. A fixture corpus
+is a JSON file:
+
+    {"chunks": [{"id": "c1", "text": "...", "source": "paper.pdf", "page": 0}],
+     "queries": [{"query": "...", "relevant": ["c1"]}]}
+
+--embeddings hash (default) uses the deterministic HashingEmbeddings stub,
+so the benchmark runs without Ollama; --embeddings ollama measures the
+real model. --store memory keeps vectors in a NumPy array; --store chroma
+builds a throwaway Chroma collection like the real one.
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from hashing_embeddings import HashingEmbeddings
+from local_paper_index import LocalPaperIndex, build_index
+from paper_search import HybridPaperRetriever, cosine_scores
+
+DEFAULT_CONFIGS = ["vector:8", "mmr:25:250", "hybrid:8:50", "hybrid:8:100", "hybrid:8:250", "local:8"]
+
+# Vocabulary of the synthetic corpus
+TOPICS = {
+    "coral": "coral reef bleaching symbiont zooxanthellae thermal stress calcification polyp colony "
+             "outplanting restoration nursery acropora recruitment larvae spawning",
+    "seagrass": "seagrass meadow thalassia rhizome shoot density epiphyte light attenuation nutrient "
+                "loading sediment blue carbon grazing turtle dugong",
+    "fisheries": "fisheries stock assessment catch effort bycatch longline trawl quota spawning biomass "
+                 "recruitment mortality tagging otolith growth",
+    "plankton": "phytoplankton zooplankton bloom chlorophyll diatom dinoflagellate copepod grazing "
+                "upwelling nutrient primary production microscopy",
+    "acoustics": "hydrophone acoustic telemetry receiver detection array tag transmitter movement "
+                 "home range migration sound noise vessel",
+    "genomics": "genomic sequencing population structure microsatellite snp connectivity gene flow "
+                "heterozygosity adaptation transcriptome expression",
+}
+FILLER = ("study results analysis data method site sample survey model effect increase decrease "
+          "observed significant measured across during between higher lower total").split()
+_SYLLABLES = ["ka", "lo", "mi", "ren", "to", "vas", "qui", "zor", "bel", "nup", "dri", "sel"]
+
+
+# ---------------------------------------------------------------------
+# Corpus
+# ---------------------------------------------------------------------
+
+def _made_up_name(rng):
+    return "".join(rng.choice(_SYLLABLES) for _ in range(3)) + str(rng.randint(1, 99))
+
+
+def synthetic_corpus(papers=200, chunks_per_paper=10, queries=200, seed=7):
+    """
+    Generate a deterministic corpus with one relevant chunk per query.
+
+    Returns:
+        dict: {"chunks": [...], "queries": [...]} in the fixture format
+    """
+    rng = random.Random(seed)
+    topics = {name: words.split() for name, words in TOPICS.items()}
+    chunks = []
+    for p in range(papers):
+        topic = rng.choice(sorted(topics))
+        source = f"synthetic/{topic}_{p:04d}.pdf"
+        for c in range(chunks_per_paper):
+            names = [_made_up_name(rng) for _ in range(3)]
+            words = [rng.choice(topics[topic]) for _ in range(45)] + [rng.choice(FILLER) for _ in range(45)]
+            for name in names:
+                words.insert(rng.randrange(len(words)), name)
+            chunks.append({
+                "id": f"p{p}c{c}", "text": " ".join(words), "source": source, "page": c // 2,
+                "topic": topic, "names": names,
+            })
+
+    labeled = []
+    for chunk in rng.sample(chunks, min(queries, len(chunks))):
+        words = rng.sample(chunk["names"], 2) + rng.sample(topics[chunk["topic"]], 3)
+        rng.shuffle(words)
+        labeled.append({"query": " ".join(words), "relevant": [chunk["id"]]})
+    return {"chunks": chunks, "queries": labeled}
+
+
+def load_fixture(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------
+
+def _document(text, metadata):
+    from langchain_core.documents import Document
+
+    return Document(page_content=text, metadata=metadata)
+
+
+class InMemoryStore:
+    """
+    Minimal NumPy vector store with the parts of the LangChain Chroma API
+    the retrievers use (add_texts, get, similarity_search_by_vector,
+    max_marginal_relevance_search).
+    """
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.ids, self.texts, self.metadatas = [], [], []
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self._rows = {}
+
+    def add_texts(self, texts, metadatas=None, ids=None):
+        vectors = np.asarray(self.embeddings.embed_documents(list(texts)), dtype=np.float32)
+        for i, text in enumerate(texts):
+            self._rows[ids[i]] = len(self.ids)
+            self.ids.append(ids[i])
+            self.texts.append(text)
+            self.metadatas.append(metadatas[i] if metadatas else {})
+        self.vectors = vectors if not self.vectors.size else np.vstack([self.vectors, vectors])
+
+    def get(self, ids=None, include=(), limit=None, offset=0, where=None):
+        rows = [self._rows[i] for i in ids if i in self._rows] if ids is not None else \
+            list(range(offset, len(self.ids) if limit is None else min(offset + limit, len(self.ids))))
+        return {
+            "ids": [self.ids[r] for r in rows],
+            "documents": [self.texts[r] for r in rows],
+            "metadatas": [self.metadatas[r] for r in rows],
+            "embeddings": self.vectors[rows] if "embeddings" in include else None,
+        }
+
+    def _top(self, vector, n):
+        scores = cosine_scores(vector, self.vectors)
+        return np.argsort(-scores)[:n], scores
+
+    def similarity_search_by_vector(self, embedding, k=4):
+        order, _ = self._top(embedding, k)
+        return [_document(self.texts[r], self.metadatas[r]) for r in order]
+
+    def max_marginal_relevance_search(self, query, k=4, fetch_k=20, lambda_mult=0.5):
+        query_vector = self.embeddings.embed_query(query)
+        candidates, scores = self._top(query_vector, fetch_k)
+        vectors = self.vectors[candidates]
+        norms = np.linalg.norm(vectors, axis=1)
+        similarity = (vectors @ vectors.T) / np.outer(np.where(norms == 0, 1.0, norms), np.where(norms == 0, 1.0, norms))
+        relevance = scores[candidates]
+        chosen = []
+        redundancy = np.zeros(len(candidates))
+        available = np.ones(len(candidates), dtype=bool)
+        while available.any() and len(chosen) < k:
+            mmr = np.where(available, lambda_mult * relevance - (1 - lambda_mult) * redundancy, -np.inf)
+            best = int(np.argmax(mmr))
+            chosen.append(best)
+            available[best] = False
+            redundancy = np.maximum(redundancy, similarity[best])
+        chosen = [candidates[i] for i in chosen]
+        return [_document(self.texts[r], self.metadatas[r]) for r in chosen]
+
+
+def build_store(corpus, embeddings, kind, directory):
+    """Load the corpus chunks into a fresh store."""
+    if kind == "chroma":
+        from chromadb import Settings
+        from langchain_community.vectorstores import Chroma
+
+        store = Chroma(collection_name="benchmark", embedding_function=embeddings, persist_directory=directory,
+                       client_settings=Settings(anonymized_telemetry=False))
+    else:
+        store = InMemoryStore(embeddings)
+    chunks = corpus["chunks"]
+    for start in range(0, len(chunks), 256):
+        batch = chunks[start:start + 256]
+        store.add_texts(
+            [c["text"] for c in batch],
+            metadatas=[{"source": c.get("source", ""), "page": c.get("page", 0), "bench_id": c["id"]} for c in batch],
+            ids=[c["id"] for c in batch],
+        )
+    return store
+
+
+# ---------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------
+
+def parse_config(text):
+    """"hybrid:8:100" -> ("hybrid", 8, 100)."""
+    parts = text.split(":")
+    method = parts[0]
+    if method not in ("hybrid", "mmr", "vector", "local"):
+        raise ValueError(f"Unknown method '{method}' in config '{text}'")
+    k = int(parts[1]) if len(parts) > 1 else 8
+    fetch_k = int(parts[2]) if len(parts) > 2 else max(k * 4, 20)
+    return method, k, fetch_k
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(round(q * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+def run_config(store, retriever, local_index, config, queries):
+    """
+    Time every query under one configuration.
+
+    Returns:
+        dict: Latency percentiles (ms), recall@k and peak traced memory (MB)
+    """
+    method, k, fetch_k = config
+    if method == "hybrid":
+        search = lambda q: retriever.search(q, k=k, fetch_k=fetch_k)
+    elif method == "mmr":
+        search = lambda q: store.max_marginal_relevance_search(q, k=k, fetch_k=fetch_k, lambda_mult=0.8)
+    elif method == "local":
+        search = lambda q: local_index.search(q, k=k)
+    else:
+        search = lambda q: store.similarity_search_by_vector(store.embeddings.embed_query(q), k=k)
+
+    latencies, recalls = [], []
+    for item in queries:
+        start = time.perf_counter()
+        docs = search(item["query"])
+        latencies.append((time.perf_counter() - start) * 1000)
+        found = {doc.metadata.get("bench_id") for doc in docs[:k]}
+        relevant = set(item["relevant"])
+        recalls.append(len(found & relevant) / len(relevant) if relevant else 0.0)
+
+    # Memory is traced in a separate pass so tracing doesn't skew the latencies
+    tracemalloc.start()
+    for item in queries[:20]:
+        search(item["query"])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "config": f"{method}:{k}:{fetch_k}" if method in ("hybrid", "mmr") else f"{method}:{k}",
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "recall@k": round(statistics.mean(recalls), 3),
+        "peak_query_mb": round(peak / 1e6, 2),
+    }
+
+
+def _embeddings(kind):
+    if kind == "ollama":
+        from langchain_ollama import OllamaEmbeddings
+
+        from get_embedding_function import EMBEDDING_MODEL
+
+        # The bare model, so the on-disk embedding cache doesn't hide its cost
+        return OllamaEmbeddings(model=EMBEDDING_MODEL)
+    return HashingEmbeddings()
+
+
+def _max_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1e6 if sys.platform == "darwin" else 1e3), 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark research-paper retrieval")
+    parser.add_argument("--fixture", help="Labeled corpus JSON (default: synthetic corpus)")
+    parser.add_argument("--papers", type=int, default=200)
+    parser.add_argument("--chunks-per-paper", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--embeddings", choices=["hash", "ollama"], default="hash")
+    parser.add_argument("--store", choices=["memory", "chroma"], default="memory")
+    parser.add_argument("--config", action="append", help=f"Configuration to run (default: {' '.join(DEFAULT_CONFIGS)})")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        configs = [parse_config(c) for c in (args.config or DEFAULT_CONFIGS)]
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    corpus = load_fixture(args.fixture) if args.fixture else synthetic_corpus(
+        args.papers, args.chunks_per_paper, args.queries, args.seed
+    )
+    print(f"📚 {len(corpus['chunks'])} chunks, {len(corpus['queries'])} labeled queries "
+          f"({args.embeddings} embeddings, {args.store} store)")
+
+    directory = tempfile.mkdtemp(prefix="retrieval_bench_")
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        store = build_store(corpus, _embeddings(args.embeddings), args.store, directory)
+        # Cache disabled: every query is measured cold
+        retriever = HybridPaperRetriever(store, directory, cache_size=0)
+        retriever.search(corpus["queries"][0]["query"])  # builds the keyword index
+        build_seconds = time.perf_counter() - start
+        _, build_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"🏗️  Store + keyword index built in {build_seconds:.1f}s (peak {build_peak / 1e6:.1f} MB traced)")
+
+        local_index = None
+        if any(method == "local" for method, _, _ in configs):
+            start = time.perf_counter()
+            local_dir = os.path.join(directory, "local_index")
+            build_index(((c["id"], c["text"], {"source": c.get("source", ""), "page": c.get("page", 0),
+                                                "bench_id": c["id"]}) for c in corpus["chunks"]), local_dir)
+            local_index = LocalPaperIndex.open(local_dir)
+            print(f"🏗️  Local index built in {time.perf_counter() - start:.1f}s")
+
+        results = [run_config(store, retriever, local_index, config, corpus["queries"]) for config in configs]
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\n{'config':<16}{'p50 ms':>9}{'p95 ms':>9}{'recall@k':>10}{'peak MB':>9}")
+    for r in results:
+        print(f"{r['config']:<16}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['recall@k']:>10}{r['peak_query_mb']:>9}")
+    rss = _max_rss_mb()
+    if rss is not None:
+        print(f"\nMax RSS: {rss} MB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "chunks": len(corpus["chunks"]), "queries": len(corpus["queries"]),
+                "embeddings": args.embeddings, "store": args.store,
+                "build_seconds": round(build_seconds, 2), "build_peak_mb": round(build_peak / 1e6, 2),
+                "max_rss_mb": rss, "results": results,
+            }, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+"""
+Section-level retrieval over the CV and resume.
+
+The pitch, interview prep and cover letter tools used to paste both full
+documents into every prompt. CVSectionIndex splits each document into
+sections at its headings ("EDUCATION", "Research Experience", "Skills:"),
+indexes the sections with BM25 (text_index.InvertedIndex) and returns only
+the sections most relevant to a company or job description, up to a token
+budget:
+
+- The untitled section at the top of a document (name, contact, summary) is
+  always included.
+- Long sections are split into parts at blank lines, so one relevant job in
+  a long "Experience" section doesn't pull in all the others.
+- Sections that repeat one already selected (the resume mostly restates the
+  CV) are skipped.
+- Selected sections are returned in document order.
+
+Documents are re-split only when their text changes (read_document caches
+the extracted text by file version, so checking is cheap).
+"""
+
+import re
+import threading
+
+from text_index import InvertedIndex, tokenize
+
+# Default size of the CV context in a prompt
+DEFAULT_TOKEN_BUDGET = 1500
+
+# Sections longer than this are split into parts
+MAX_SECTION_TOKENS = 300
+
+# Sections whose words overlap an already selected section this much are skipped
+DUPLICATE_OVERLAP = 0.8
+
+_SECTION_WORDS = {
+    "experience", "education", "skills", "publications", "awards", "honors", "certifications",
+    "projects", "presentations", "teaching", "leadership", "volunteer", "volunteering",
+    "references", "summary", "profile", "objective", "grants", "languages", "interests",
+    "coursework", "affiliations", "memberships", "employment", "fieldwork", "qualifications",
+    "activities", "service", "outreach", "training", "competencies", "conferences", "posters",
+}
+
+
+def estimate_tokens(text):
+    """Rough token count (about 4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def is_heading(line):
+    """
+    Guess whether a line of extracted text is a section heading.
+
+    Headings are short lines without sentence punctuation that are either
+    ALL CAPS, end with a colon, or name a usual CV section.
+    """
+    line = line.strip()
+    words = line.rstrip(":").split()
+    if not words or len(words) > 6 or len(line) > 60 or line[-1] in ".,;":
+        return False
+    if not any(c.isalpha() for c in line):
+        return False
+    if line.isupper() or line.endswith(":"):
+        return True
+    lowered = {w.strip("&/,").lower() for w in words}
+    return len(words) <= 4 and line[0].isupper() and bool(lowered & _SECTION_WORDS)
+
+
+def _split_long(title, body, max_tokens):
+    """Split a section body into parts of up to max_tokens at blank lines (or lines)."""
+    blocks = [b.strip() for b in re.split(r"\n\s*\n", body) if b.strip()]
+    sep = "\n\n"
+    if len(blocks) <= 1:
+        blocks, sep = [line for line in body.split("\n") if line.strip()], "\n"
+    parts, current = [], []
+    for block in blocks:
+        if current and estimate_tokens(sep.join(current + [block])) > max_tokens:
+            parts.append(sep.join(current))
+            current = []
+        current.append(block)
+    if current:
+        parts.append(sep.join(current))
+    return [(title, part) for part in parts]
+
+
+def split_sections(text, max_tokens=MAX_SECTION_TOKENS):
+    """
+    Split document text into sections at headings.
+
+    Args:
+        text (str): Extracted document text
+        max_tokens (int): Sections longer than this are split into parts
+
+    Returns:
+        list: (title, body) tuples in document order; the text before the
+        first heading has the title ""
+    """
+    sections = []
+    title, lines = "", []
+    for line in text.split("\n"):
+        if is_heading(line):
+            if any(l.strip() for l in lines):
+                sections.append((title, "\n".join(lines).strip()))
+            title, lines = line.strip().rstrip(":"), []
+        else:
+            lines.append(line)
+    if any(l.strip() for l in lines):
+        sections.append((title, "\n".join(lines).strip()))
+
+    result = []
+    for title, body in sections:
+        if estimate_tokens(body) > max_tokens:
+            result.extend(_split_long(title, body, max_tokens))
+        else:
+            result.append((title, body))
+    return result
+
+
+class CVSectionIndex:
+    """
+    BM25 index of the sections of a set of documents.
+
+    Args:
+        reader (callable): filename -> text; text starting with "Error" or
+                           "Failed" means the document can't be read
+        max_tokens (int): Size above which sections are split into parts
+    """
+
+    def __init__(self, reader, max_tokens=MAX_SECTION_TOKENS):
+        self.reader = reader
+        self.max_tokens = max_tokens
+        self.index = InvertedIndex()
+        self._texts = {}     # filename -> text the sections were built from
+        self._sections = {}  # filename -> [(title, body)]
+        self._lock = threading.Lock()
+
+    def _refresh(self, filename):
+        text = self.reader(filename)
+        if not text or text.startswith(("Error", "Failed")):
+            text = ""
+        if self._texts.get(filename) == text:
+            return
+        for i in range(len(self._sections.get(filename, []))):
+            self.index.remove((filename, i))
+        sections = split_sections(text, self.max_tokens) if text else []
+        for i, (title, body) in enumerate(sections):
+            self.index.add((filename, i), f"{title}\n{body}")
+        self._texts[filename] = text
+        self._sections[filename] = sections
+
+    def retrieve(self, query, filenames, token_budget=DEFAULT_TOKEN_BUDGET):
+        """
+        Most relevant sections of the given documents, within a token budget.
+
+        Args:
+            query (str): Company, role and/or job description text
+            filenames (list): Documents to draw from, e.g. ["CV.docx", "Resume.docx"]
+            token_budget (int): Approximate maximum size of the result in tokens
+
+        Returns:
+            str: The selected sections, grouped by document; "" if none can be read
+        """
+        with self._lock:
+            for filename in filenames:
+                self._refresh(filename)
+            wanted = set(filenames)
+            ranked = [doc_id for doc_id, _ in self.index.search(query) if doc_id[0] in wanted]
+            sections = {filename: self._sections.get(filename, []) for filename in filenames}
+
+        if not ranked:
+            # Nothing matched the query: fall back to document order
+            ranked = [(f, i) for f in filenames for i in range(len(sections[f]))]
+        pinned = [(f, 0) for f in filenames if sections[f] and sections[f][0][0] == ""]
+        candidates = pinned + ranked
+
+        selected, selected_words, used = set(), [], 0
+        for doc_id in candidates:
+            if doc_id in selected:
+                continue
+            title, body = sections[doc_id[0]][doc_id[1]]
+            cost = estimate_tokens(f"{title}\n{body}")
+            if used + cost > token_budget:
+                continue
+            words = set(tokenize(body))
+            if words and any(len(words & other) / len(words) >= DUPLICATE_OVERLAP for other in selected_words):
+                continue
+            selected.add(doc_id)
+            selected_words.append(words)
+            used += cost
+
+        blocks = []
+        for filename in filenames:
+            parts = [
+                f"{title}\n{body}" if title else body
+                for i, (title, body) in enumerate(sections[filename])
+                if (filename, i) in selected
+            ]
+            if parts:
+                label = filename.rsplit(".", 1)[0]
+                blocks.append(f"{label}:\n" + "\n\n".join(parts))
+        return "\n\n".join(blocks)
@@ -0,0 +1,126 @@
+"""
+Compressed, content-addressed store for full job descriptions.
+
+Job postings often run to several thousand characters, while
+job_opportunities.json only keeps the first 500 so the tracker (and
+everything that loads it) stays small. The full text is kept here instead:
+
+    job_descriptions/<id[:2]>/<id>.z
+
+where id is the first 16 hex digits of the SHA-256 of the text and the file
+holds the zlib-compressed UTF-8 text. Opportunities reference it through
+their "description_id" field and the text is only decompressed when a tool
+asks for it. Identical descriptions (the same posting found by several
+searches) are stored once, and a stored file never changes, so the folder
+diffs cleanly in git.
+
+Texts are only stored for opportunities that are actually saved. Deleting
+the last opportunity that references a text deletes its file, and sweep()
+removes files nothing references any more (e.g. from an interrupted run).
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+import zlib
+
+DESCRIPTION_STORE_DIR = "job_descriptions"
+
+# Descriptions up to this length fit in the opportunity record itself
+INLINE_DESCRIPTION_CHARS = 500
+
+
+def description_id(text):
+    """Content address of a description."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class DescriptionStore:
+    """
+    zlib-compressed description texts, one file per distinct text.
+
+    Args:
+        directory (str): Store folder, e.g. job_descriptions
+    """
+
+    def __init__(self, directory=DESCRIPTION_STORE_DIR):
+        self.directory = directory
+
+    def _path(self, desc_id):
+        return os.path.join(self.directory, desc_id[:2], f"{desc_id}.z")
+
+    def put(self, text):
+        """
+        Store a description (no-op if the same text is already stored).
+
+        Args:
+            text (str): Full description text
+
+        Returns:
+            str: The description's id
+        """
+        desc_id = description_id(text)
+        path = self._path(desc_id)
+        if os.path.exists(path):
+            return desc_id
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Unique temp file + rename: concurrent writers of the same text can't clash
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(zlib.compress(text.encode("utf-8"), 9))
+        os.replace(tmp_path, path)
+        return desc_id
+
+    def get(self, desc_id):
+        """Return the full text of a description, or None if it isn't stored."""
+        if not desc_id:
+            return None
+        try:
+            with open(self._path(desc_id), "rb") as f:
+                return zlib.decompress(f.read()).decode("utf-8")
+        except (OSError, zlib.error):
+            return None
+
+    def __contains__(self, desc_id):
+        return bool(desc_id) and os.path.exists(self._path(desc_id))
+
+    def delete(self, desc_id):
+        """Delete a stored description. Returns True if it existed."""
+        if not desc_id:
+            return False
+        try:
+            os.remove(self._path(desc_id))
+            return True
+        except OSError:
+            return False
+
+    def sweep(self, referenced, min_age=3600):
+        """
+        Delete stored descriptions that no opportunity references.
+
+        Args:
+            referenced (set): Description ids still in use
+            min_age (int): Only delete files older than this many seconds, so a
+                text stored by a search that is saving right now is kept
+
+        Returns:
+            int: Number of files deleted
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        cutoff = time.time() - min_age
+        removed = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                desc_id, ext = os.path.splitext(name)
+                path = os.path.join(root, name)
+                if ext != ".z" or desc_id in referenced:
+                    continue
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    continue
+        return removed
@@ -0,0 +1,112 @@
+"""
+Cache of text extracted from documents (CV, resume, papers).
+
+Parsing a .docx with python-docx or a PDF with PyPDF2 takes far longer than
+the tools that use the text, and the same few files are read over and over
+(every elevator pitch and interview prep reads both the CV and the resume).
+DocumentTextCache keeps the extracted text per file, keyed by the file's
+absolute path, mtime and size, so a file is only parsed again after it
+changes on disk.
+
+Set DOCUMENT_TEXT_CACHE_DIR (e.g. document_text_cache) to also keep the
+extracted text on disk, so a restarted agent doesn't parse the files again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from tracker_store import _write_json_atomic
+
+
+def _fingerprint(path):
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class DocumentTextCache:
+    """
+    Process-wide cache of extracted document text.
+
+    Args:
+        persist_dir (str, optional): Folder for an on-disk copy of the cache
+    """
+
+    def __init__(self, persist_dir=None):
+        self.persist_dir = persist_dir
+        self._entries = {}  # abspath -> (fingerprint, text)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _persist_path(self, key):
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.persist_dir, f"{name}.json")
+
+    def _load_persisted(self, key, fingerprint):
+        try:
+            with open(self._persist_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("path") != key or tuple(entry.get("fingerprint", ())) != fingerprint:
+            return None
+        return entry.get("text")
+
+    def _persist(self, key, fingerprint, text):
+        try:
+            os.makedirs(self.persist_dir, exist_ok=True)
+            _write_json_atomic(self._persist_path(key), {"path": key, "fingerprint": list(fingerprint), "text": text})
+        except OSError as e:
+            print(f"[WARNING] Could not persist extracted text of {key}: {e}")
+
+    def get(self, path, extract):
+        """
+        Return the text of a document, extracting it only if the file changed.
+
+        Args:
+            path (str): Document path
+            extract (callable): Function that takes path and returns its text.
+                                Exceptions propagate and nothing is cached.
+
+        Returns:
+            str: Extracted text
+        """
+        key = os.path.abspath(path)
+        fingerprint = _fingerprint(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and fingerprint is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+
+        text = None
+        if self.persist_dir and fingerprint is not None:
+            text = self._load_persisted(key, fingerprint)
+        if text is None:
+            # Parse outside the lock so different documents can be read in parallel
+            text = extract(path)
+            if self.persist_dir and fingerprint is not None:
+                self._persist(key, fingerprint, text)
+
+        with self._lock:
+            self.misses += 1
+            if fingerprint is not None:
+                self._entries[key] = (fingerprint, text)
+        return text
+
+    def invalidate(self, path=None):
+        """Forget one document (or all of them); persisted copies expire on their own."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+document_text_cache = DocumentTextCache(os.getenv("DOCUMENT_TEXT_CACHE_DIR") or None)
@@ -0,0 +1,151 @@
+"""
+Persistent cache for embedding vectors.
+
+CachedEmbeddings wraps a LangChain embeddings object (OllamaEmbeddings) and
+keeps every vector it computes on disk, keyed by model name and a hash of
+the text, so repeated queries and re-ingested chunks never reach the model
+again. Cache misses in one embed_documents() call are sent to the model as
+a single batch.
+
+Layout, one folder per model:
+
+    <cache_dir>/<model>/vectors.bin   rows of float32 (or float16), appended
+    <cache_dir>/<model>/index.tsv     "<text hash>\\t<row>" lines, appended
+    <cache_dir>/<model>/meta.json     {"model", "dim", "dtype"}
+
+vectors.bin is read through a numpy memmap, so the cache is not loaded into
+memory. Vectors are appended before their index lines, so a crash can leave
+unused rows but never an index entry without a vector.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+try:
+    from langchain_core.embeddings import Embeddings
+except ImportError:  # langchain not installed; the cache still works standalone
+    Embeddings = object
+
+# Misses sent to the model per request
+EMBED_BATCH_SIZE = 256
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    LangChain Embeddings with an on-disk vector cache. The async
+    aembed_documents / aembed_query come from the Embeddings base class.
+
+    Args:
+        base: Embeddings object with embed_documents() and embed_query()
+        model (str): Model name, part of the cache key
+        cache_dir (str): Root folder of the cache
+        dtype (str): "float32" or "float16" (half the disk, ~3 significant digits)
+    """
+
+    def __init__(self, base, model, cache_dir="embedding_cache", dtype="float32"):
+        self.base = base
+        self.model = model
+        self.dtype = np.dtype(dtype)
+        self.directory = os.path.join(cache_dir, re.sub(r"[^A-Za-z0-9_.-]", "_", model))
+        self._vectors_path = os.path.join(self.directory, "vectors.bin")
+        self._index_path = os.path.join(self.directory, "index.tsv")
+        self._meta_path = os.path.join(self.directory, "meta.json")
+        self._lock = threading.Lock()
+        self._index = None  # text hash -> row
+        self._dim = None
+        self._rows = 0      # rows in vectors.bin
+        self._mmap = None   # memmap over the first _mmap_rows rows
+        self._mmap_rows = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, kind, text):
+        # Queries and documents may embed differently, so they are cached apart
+        return hashlib.sha256(f"{kind}\0{text}".encode("utf-8")).hexdigest()[:32]
+
+    def _load(self):
+        if self._index is not None:
+            return
+        self._index = {}
+        if not os.path.exists(self._meta_path):
+            return
+        with open(self._meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("dtype") != self.dtype.name:
+            print(f"[WARNING] Embedding cache {self.directory} is {meta.get('dtype')}, not {self.dtype.name}; using it as is.")
+            self.dtype = np.dtype(meta["dtype"])
+        self._dim = meta["dim"]
+        row_bytes = self._dim * self.dtype.itemsize
+        self._rows = os.path.getsize(self._vectors_path) // row_bytes if os.path.exists(self._vectors_path) else 0
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    key, _, row = line.rstrip("\n").partition("\t")
+                    if row.isdigit() and int(row) < self._rows:
+                        self._index[key] = int(row)
+
+    def _vector(self, row):
+        if row >= self._mmap_rows:
+            # The file grew since it was mapped
+            self._mmap = np.memmap(self._vectors_path, dtype=self.dtype, mode="r", shape=(self._rows, self._dim))
+            self._mmap_rows = self._rows
+        return self._mmap[row].astype(np.float32).tolist()
+
+    def _append(self, keys, vectors):
+        array = np.asarray(vectors, dtype=self.dtype)
+        if self._dim is None:
+            self._dim = array.shape[1]
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self._meta_path, "w", encoding="utf-8") as f:
+                json.dump({"model": self.model, "dim": self._dim, "dtype": self.dtype.name}, f)
+        row_bytes = self._dim * self.dtype.itemsize
+        if os.path.exists(self._vectors_path) and os.path.getsize(self._vectors_path) % row_bytes:
+            # Drop a partial row left by an interrupted write
+            os.truncate(self._vectors_path, os.path.getsize(self._vectors_path) // row_bytes * row_bytes)
+        with open(self._vectors_path, "ab") as f:
+            # Rows are numbered from the file's actual end, in case another process appended
+            first_row = f.tell() // row_bytes
+            f.write(array.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        self._rows = first_row + len(keys)
+        with open(self._index_path, "a", encoding="utf-8") as f:
+            for i, key in enumerate(keys):
+                f.write(f"{key}\t{first_row + i}\n")
+                self._index[key] = first_row + i
+        # Return what later cache hits will return (float16 rounds)
+        return array.astype(np.float32).tolist()
+
+    def _embed(self, kind, texts, compute):
+        keys = [self._key(kind, text) for text in texts]
+        with self._lock:
+            self._load()
+            result = {key: self._vector(self._index[key]) for key in set(keys) if key in self._index}
+        self.hits += sum(1 for key in keys if key in result)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in result:
+                missing.setdefault(key, text)
+        if missing:
+            self.misses += len(missing)
+            miss_keys = list(missing)
+            for start in range(0, len(miss_keys), EMBED_BATCH_SIZE):
+                batch = miss_keys[start:start + EMBED_BATCH_SIZE]
+                vectors = compute([missing[key] for key in batch])
+                with self._lock:
+                    result.update(zip(batch, self._append(batch, vectors)))
+        return [result[key] for key in keys]
+
+    def embed_documents(self, texts):
+        """Embed texts, computing only the ones not cached (in batches)."""
+        return self._embed("document", list(texts), self.base.embed_documents)
+
+    def embed_query(self, text):
+        """Embed a search query (cached like documents)."""
+        return self._embed("query", [text], lambda batch: [self.base.embed_query(batch[0])])[0]
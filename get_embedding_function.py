@@ -5,11 +5,24 @@ try:
 except ImportError:
     OllamaEmbeddings = None
 
+try:
+    from embedding_cache import CachedEmbeddings
+except ImportError:  # numpy not installed
+    CachedEmbeddings = None
+
+EMBEDDING_MODEL = "qwen3-embedding"
+
+# Vectors are cached on disk by (model, text hash); set EMBEDDING_CACHE_DIR="" to disable
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR", "embedding_cache")
+EMBEDDING_CACHE_DTYPE = os.getenv("EMBEDDING_CACHE_DTYPE", "float32")
+
 def get_embedding_function():
     # In GitHub Actions, we don't have Ollama, so return None
     # The consumer (tools_2.py) must handle this gracefully
     if os.getenv("GITHUB_ACTIONS") == "true" or OllamaEmbeddings is None:
         return None
         
-    embeddings = OllamaEmbeddings(model="qwen3-embedding")
+    embeddings = OllamaEmbeddings(model=EMBEDDING_MODEL)
+    if EMBEDDING_CACHE_DIR and CachedEmbeddings is not None:
+        embeddings = CachedEmbeddings(embeddings, EMBEDDING_MODEL, EMBEDDING_CACHE_DIR, EMBEDDING_CACHE_DTYPE)
     return embeddings
@@ -0,0 +1,63 @@
+"""
+Deterministic local embeddings without a model.
+
+HashingEmbeddings maps text to a fixed-size vector by hashing its words and
+word pairs into buckets (the "hashing trick"), with a sign hash so
+collisions tend to cancel out, then L2-normalizes it. Texts that share
+words get similar vectors, which is enough to exercise and benchmark the
+retrieval code without Ollama. The vectors are the same on every machine
+and every run.
+
+It is a LangChain Embeddings (embed_documents / embed_query and their async
+versions), so it can be passed anywhere OllamaEmbeddings is.
+"""
+
+import hashlib
+import math
+from collections import Counter
+
+from text_index import tokenize
+
+try:
+    from langchain_core.embeddings import Embeddings
+except ImportError:  # langchain not installed
+    Embeddings = object
+
+DEFAULT_DIM = 384
+
+
+def _bucket(feature, dim):
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    value = int.from_bytes(digest, "little")
+    return value % dim, 1.0 if value >> 63 else -1.0
+
+
+class HashingEmbeddings(Embeddings):
+    """
+    Hashed bag-of-words embeddings.
+
+    Args:
+        dim (int): Vector size
+        bigrams (bool): Also hash adjacent word pairs
+    """
+
+    def __init__(self, dim=DEFAULT_DIM, bigrams=True):
+        self.dim = dim
+        self.bigrams = bigrams
+
+    def _embed(self, text):
+        vector = [0.0] * self.dim
+        tokens = tokenize(text)
+        features = tokens + ([f"{a} {b}" for a, b in zip(tokens, tokens[1:])] if self.bigrams else [])
+        for feature, count in Counter(features).items():
+            index, sign = _bucket(feature, self.dim)
+            # Sublinear term frequency, so repeated words don't drown out rare ones
+            vector[index] += sign * (1.0 + math.log(count))
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
@@ -0,0 +1,293 @@
+"""
+Incremental ingestion of research-paper PDFs into the Chroma store behind search_pdf.
+
+    python ingest_papers.py papers/                 # add new / changed papers
+    python ingest_papers.py papers/ --workers 8     # more parser processes
+    python ingest_papers.py papers/ --dry-run       # only report what would change
+
+How a re-run stays proportional to what changed:
+
+1. A manifest next to the store (<db>/ingest_manifest.json) records every
+   ingested PDF's mtime, size and chunk ids. PDFs whose mtime and size are
+   unchanged are skipped without being opened.
+2. New or changed PDFs are parsed in a process pool (PDF text extraction
+   is CPU-bound) and embedded in this process as each one finishes.
+3. Text is chunked page by page, and each chunk's id is a hash of its source
+   and text. An edited PDF only produces new ids for the pages that changed;
+   only those chunks are embedded, and the chunks that disappeared are
+   deleted.
+4. PDFs that were removed from the folder have their chunks deleted.
+
+A store built by another tool has no manifest. The first run looks up each
+PDF's existing chunks by their "source" metadata and replaces them with
+content-addressed chunks.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tracker_store import _write_json_atomic
+
+PAPERS_DB_PATH = "chroma_db_research_papers_test"
+MANIFEST_NAME = "ingest_manifest.json"
+
+# Chunking (characters); chunks never span pages
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+
+# Chunks embedded per add_texts call
+EMBED_BATCH_SIZE = 64
+
+
+def parse_pdf(path):
+    """
+    Extract the text of each page of a PDF (runs in a worker process).
+
+    Returns:
+        list: Page texts, in page order
+    """
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(path)
+    return [page.extract_text() or "" for page in reader.pages]
+
+
+def chunk_text(text, size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
+    """
+    Split text into overlapping chunks of about size characters, breaking at whitespace.
+
+    Returns:
+        list: Chunk strings
+    """
+    text = " ".join(text.split())
+    if not text:
+        return []
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            # Break at the last space in the window, unless that leaves a tiny chunk
+            space = text.rfind(" ", start + size // 2, end)
+            if space != -1:
+                end = space
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        next_start = max(end - overlap, start + 1)
+        # Start the next chunk at a word boundary
+        space = text.find(" ", next_start, end)
+        start = space + 1 if space != -1 else next_start
+    return [c for c in chunks if c]
+
+
+def chunk_id(source, text):
+    """Content address of a chunk: the same text from the same paper always gets the same id."""
+    return hashlib.sha256(f"{source}\0{text}".encode("utf-8")).hexdigest()[:32]
+
+
+def chunk_pages(source, pages, size=CHUNK_SIZE, overlap=CHUNK_OVERLAP):
+    """
+    Chunk a paper page by page.
+
+    Args:
+        source (str): Paper path, stored as the chunks' "source" metadata
+        pages (list): Page texts
+
+    Returns:
+        dict: chunk id -> (text, metadata), in reading order
+    """
+    chunks = {}
+    for page_number, page_text in enumerate(pages):
+        for i, text in enumerate(chunk_text(page_text, size, overlap)):
+            chunks.setdefault(chunk_id(source, text), (text, {"source": source, "page": page_number, "chunk": i}))
+    return chunks
+
+
+def _fingerprint(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def find_pdfs(folder):
+    """All PDFs under folder, as paths relative to the working directory."""
+    paths = []
+    for root, _, files in os.walk(folder):
+        paths.extend(os.path.join(root, name) for name in files if name.lower().endswith(".pdf"))
+    return sorted(os.path.relpath(p) for p in paths)
+
+
+class PaperIngester:
+    """
+    Keeps a vector store in sync with a folder of PDFs.
+
+    Args:
+        db: LangChain vector store with get(), add_texts() and delete() (e.g. Chroma)
+        manifest_path (str): Manifest of ingested files
+        chunk_size (int): Chunk size in characters
+        chunk_overlap (int): Overlap between consecutive chunks of a page
+    """
+
+    def __init__(self, db, manifest_path, chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
+        self.db = db
+        self.manifest_path = manifest_path
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.manifest = {"files": {}}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    self.manifest = json.load(f)
+            except json.JSONDecodeError:
+                print(f"[WARNING] Corrupted {manifest_path}, checking every paper against the store.")
+
+    def _save_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        _write_json_atomic(self.manifest_path, self.manifest)
+
+    def _stored_ids(self, source):
+        """Chunk ids the store holds for a paper."""
+        entry = self.manifest["files"].get(source)
+        if entry is not None:
+            return set(entry["chunk_ids"])
+        # Not ingested by us (or manifest lost): ask the store
+        return set(self.db.get(where={"source": source}, include=[])["ids"])
+
+    def plan(self, pdfs):
+        """
+        Split PDFs into changed ones and removed manifest entries.
+
+        Returns:
+            tuple: (changed paths, removed paths)
+        """
+        files = self.manifest["files"]
+        changed = [p for p in pdfs if files.get(p, {}).get("fingerprint") != _fingerprint(p)]
+        present = set(pdfs)
+        removed = [p for p in files if p not in present]
+        return changed, removed
+
+    def apply(self, source, pages, dry_run=False):
+        """
+        Sync one paper's chunks with the store.
+
+        Returns:
+            tuple: (chunks added, chunks deleted)
+        """
+        chunks = chunk_pages(source, pages, self.chunk_size, self.chunk_overlap)
+        stored = self._stored_ids(source)
+        new_ids = [cid for cid in chunks if cid not in stored]
+        stale_ids = [cid for cid in stored if cid not in chunks]
+        if not dry_run:
+            for start in range(0, len(new_ids), EMBED_BATCH_SIZE):
+                batch = new_ids[start:start + EMBED_BATCH_SIZE]
+                self.db.add_texts(
+                    [chunks[cid][0] for cid in batch],
+                    metadatas=[chunks[cid][1] for cid in batch],
+                    ids=batch,
+                )
+            if stale_ids:
+                self.db.delete(ids=stale_ids)
+            self.manifest["files"][source] = {"fingerprint": _fingerprint(source), "chunk_ids": list(chunks)}
+            # Saved after every paper so an interrupted run keeps its progress
+            self._save_manifest()
+        return len(new_ids), len(stale_ids)
+
+    def remove(self, source, dry_run=False):
+        """Delete the chunks of a paper that is no longer in the folder. Returns chunks deleted."""
+        stale_ids = self._stored_ids(source)
+        if not dry_run:
+            if stale_ids:
+                self.db.delete(ids=list(stale_ids))
+            self.manifest["files"].pop(source, None)
+            self._save_manifest()
+        return len(stale_ids)
+
+    def run(self, folder, workers=None, dry_run=False):
+        """
+        Ingest every new or changed PDF under folder and drop removed ones.
+
+        Args:
+            folder (str): Folder of PDFs (searched recursively)
+            workers (int, optional): Parser processes (default: CPU count)
+            dry_run (bool): Report changes without touching the store
+
+        Returns:
+            dict: Counts of papers and chunks processed
+        """
+        changed, removed = self.plan(find_pdfs(folder))
+        stats = {"papers_changed": len(changed), "papers_removed": len(removed),
+                 "chunks_added": 0, "chunks_deleted": 0, "failed": 0}
+
+        for source in removed:
+            stats["chunks_deleted"] += self.remove(source, dry_run)
+            print(f"🗑️  {source}: removed")
+
+        if changed:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(parse_pdf, source): source for source in changed}
+                # Embed each paper as soon as its parse finishes
+                for future in as_completed(futures):
+                    source = futures[future]
+                    try:
+                        pages = future.result()
+                    except Exception as e:
+                        print(f"❌ {source}: {e}")
+                        stats["failed"] += 1
+                        continue
+                    added, deleted = self.apply(source, pages, dry_run)
+                    stats["chunks_added"] += added
+                    stats["chunks_deleted"] += deleted
+                    print(f"📄 {source}: +{added} / -{deleted} chunks")
+        return stats
+
+
+def open_papers_db(db_path=PAPERS_DB_PATH):
+    """Open (or create) the Chroma store search_pdf reads from, or return None without embeddings."""
+    from chromadb import Settings
+    from langchain_community.vectorstores import Chroma
+
+    from get_embedding_function import get_embedding_function
+
+    embedding_func = get_embedding_function()
+    if embedding_func is None:
+        return None
+    return Chroma(persist_directory=db_path, embedding_function=embedding_func,
+                  client_settings=Settings(anonymized_telemetry=False))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add new and changed research papers to the search_pdf store")
+    parser.add_argument("folder", help="Folder of PDFs (searched recursively)")
+    parser.add_argument("--db", default=PAPERS_DB_PATH, help=f"Chroma directory (default: {PAPERS_DB_PATH})")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--chunk-overlap", type=int, default=CHUNK_OVERLAP)
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would change")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.folder):
+        print(f"Error: Folder '{args.folder}' does not exist.")
+        return 1
+
+    db = open_papers_db(args.db)
+    if db is None:
+        print("Error: No embedding function available (is Ollama installed?).")
+        return 1
+
+    ingester = PaperIngester(db, os.path.join(args.db, MANIFEST_NAME), args.chunk_size, args.chunk_overlap)
+    stats = ingester.run(args.folder, args.workers, args.dry_run)
+    print(
+        f"\n✅ {stats['papers_changed']} new/changed and {stats['papers_removed']} removed paper(s): "
+        f"+{stats['chunks_added']} / -{stats['chunks_deleted']} chunks"
+        + (f", {stats['failed']} failed" if stats["failed"] else "")
+        + (" (dry run)" if args.dry_run else "")
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
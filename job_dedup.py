@@ -0,0 +1,335 @@
+"""
+Duplicate detection for job opportunities ingested by search_jobs.
+
+Two indexes are kept next to job_opportunities.json, both as side files with
+one line per stored opportunity that are appended to on insert and
+rewritten on delete:
+
+- JobKeyIndex (<stem>.keys.idx): the normalized (company, title, location)
+  key of every opportunity in a hash table, so an exact duplicate check is
+  O(1) instead of a scan over the tracker.
+- MinHashIndex (<stem>.minhash.idx): a MinHash signature over shingles of
+  title + company + location + description, bucketed with LSH banding, so
+  near-duplicates ("Marine Scientist II" vs "Marine Scientist 2", the same
+  posting re-listed by another job board) are found by probing a few
+  buckets instead of comparing against every stored posting.
+
+Side files are caches: if one is missing or does not match the stored
+opportunities (e.g. after a `git pull` brought in new jobs) it is rebuilt
+from the tracker on first use. They are rechecked whenever the tracker's
+revision changes, so jobs saved by another process (the scheduled search
+while the GUI is open) are seen too. Writes made in this process are applied
+with add()/remove() right after the tracker write, so that check passes
+without recomputing anything.
+"""
+
+import abc
+import base64
+import hashlib
+import os
+import random
+import re
+import struct
+import threading
+
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+NEAR_DUPLICATE_THRESHOLD = 0.7
+TITLE_OVERLAP_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# Tokens that vary between listings of the same posting
+_TOKEN_ALIASES = {
+    "i": "1", "ii": "2", "iii": "3", "iv": "4", "v": "5",
+    "sr": "senior", "jr": "junior", "&": "and",
+}
+
+
+def job_key(job):
+    """Normalized (company, title, location) key used for exact duplicate checks."""
+    return "|".join(
+        " ".join(str(job.get(field) or "").lower().split())
+        for field in ("company", "title", "location")
+    )
+
+
+def _tokens(text):
+    return [_TOKEN_ALIASES.get(t, t) for t in re.findall(r"[a-z0-9&]+", str(text or "").lower())]
+
+
+def _shingles(job):
+    """Prefixed header tokens plus word 3-grams of the description."""
+    shingles = set()
+    for field in ("title", "company", "location"):
+        shingles.update(f"{field[0]}:{t}" for t in _tokens(job.get(field)))
+    words = _tokens(job.get("description"))
+    shingles.update("d:" + " ".join(words[i:i + 3]) for i in range(max(len(words) - 2, 0)))
+    return shingles
+
+
+def minhash_signature(job):
+    """Return the MinHash signature of a job as a tuple of 32-bit ints."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+        for s in _shingles(job)
+    ]
+    if not hashes:
+        return tuple([0xFFFFFFFF] * NUM_PERMUTATIONS)
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & 0xFFFFFFFF
+        for a, b in _PERMUTATIONS
+    )
+
+
+def signature_similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERMUTATIONS
+
+
+def _title_overlap(title_a, title_b):
+    a, b = set(_tokens(title_a)), set(_tokens(title_b))
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class _SideIndex(abc.ABC):
+    """
+    Base class for an index persisted as "<id>\\t<payload>" lines next to
+    the opportunities file.
+
+    Args:
+        opportunities_file (str): Path of job_opportunities.json
+        suffix (str): Side file suffix, e.g. "keys.idx"
+        load_records (callable): Returns the stored opportunity list, used to
+            validate and rebuild the index
+        revision (callable, optional): Returns a token that changes when the
+            stored opportunities change (TrackerStore.revision), so jobs added
+            by another process are picked up
+    """
+
+    def __init__(self, opportunities_file, suffix, load_records, revision=None):
+        stem, _ = os.path.splitext(opportunities_file)
+        self.path = f"{stem}.{suffix}"
+        self._load_records = load_records
+        self._revision = revision
+        self._lock = threading.RLock()
+        self._entries = None  # ordered list of (id, payload), mirrors the file
+        self._seen_revision = None  # tracker revision the entries were checked against
+
+    # Subclass hooks
+    @abc.abstractmethod
+    def _payload(self, record):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _index(self, record_id, payload):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _unindex(self, record_id, payload):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def _reset(self):
+        raise NotImplementedError
+
+    def _read_file(self):
+        if not os.path.exists(self.path):
+            return None
+        entries = []
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if "\t" in line:
+                    record_id, payload = line.split("\t", 1)
+                    entries.append((record_id, payload))
+        return entries
+
+    def _write_file(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(f"{record_id}\t{payload}\n" for record_id, payload in self._entries)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _covers(entries, records):
+        # Valid if it covers the same number of records and ends with the same id
+        return (
+            entries is not None
+            and len(entries) == len(records)
+            and (not records or entries[-1][0] == records[-1].get("id"))
+        )
+
+    def _ensure_loaded(self):
+        revision = self._revision() if self._revision else None
+        if self._entries is not None:
+            if revision == self._seen_revision:
+                return
+            # The tracker changed (possibly in another process): keep the index if it still matches
+            if self._covers(self._entries, self._load_records()):
+                self._seen_revision = revision
+                return
+        records = self._load_records()
+        entries = self._read_file()
+        valid = self._covers(entries, records)
+        if not valid:
+            entries = [(r.get("id"), self._payload(r)) for r in records]
+        self._entries = entries
+        self._reset()
+        for record_id, payload in entries:
+            self._index(record_id, payload)
+        self._seen_revision = revision
+        if not valid:
+            self._write_file()
+
+    def add(self, records):
+        """
+        Register newly stored opportunities and append them to the side file.
+
+        Call it after the tracker write. The change is applied to the loaded
+        index as is: it is not revalidated against the tracker, whose revision
+        has just moved because of this very write. The next lookup only checks
+        that the index still covers the stored records.
+        """
+        if not records:
+            return
+        with self._lock:
+            if self._entries is None:
+                self._ensure_loaded()
+            known = {record_id for record_id, _ in self._entries}
+            new_entries = [(r["id"], self._payload(r)) for r in records if r["id"] not in known]
+            if not new_entries:
+                return
+            for record_id, payload in new_entries:
+                self._index(record_id, payload)
+            self._entries.extend(new_entries)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(f"{record_id}\t{payload}\n" for record_id, payload in new_entries)
+
+    def remove(self, record_id):
+        """Forget a deleted opportunity (after the tracker write, like add())."""
+        with self._lock:
+            if self._entries is None:
+                self._ensure_loaded()
+            remaining = []
+            for entry_id, payload in self._entries:
+                if entry_id == record_id:
+                    self._unindex(entry_id, payload)
+                else:
+                    remaining.append((entry_id, payload))
+            if len(remaining) != len(self._entries):
+                self._entries = remaining
+                self._write_file()
+
+    def invalidate(self):
+        """Drop the in-memory index so it is revalidated on next use."""
+        with self._lock:
+            self._entries = None
+
+
+class JobKeyIndex(_SideIndex):
+    """Persisted hash index of job_key() -> opportunity ids."""
+
+    def __init__(self, opportunities_file, load_records, revision=None):
+        super().__init__(opportunities_file, "keys.idx", load_records, revision)
+        self._keys = {}
+
+    def _payload(self, record):
+        return job_key(record)
+
+    def _index(self, record_id, payload):
+        self._keys.setdefault(payload, set()).add(record_id)
+
+    def _unindex(self, record_id, payload):
+        ids = self._keys.get(payload, set())
+        ids.discard(record_id)
+        if not ids:
+            self._keys.pop(payload, None)
+
+    def _reset(self):
+        self._keys = {}
+
+    def contains(self, job):
+        """Return True if an opportunity with the same key is already stored."""
+        with self._lock:
+            self._ensure_loaded()
+            return bool(self._keys.get(job_key(job)))
+
+
+class MinHashIndex(_SideIndex):
+    """
+    Persisted MinHash signatures with an in-memory LSH bucket index.
+
+    Signatures are split into LSH_BANDS bands; two postings become candidates
+    when any band matches exactly. Candidates are confirmed when the
+    estimated Jaccard similarity reaches NEAR_DUPLICATE_THRESHOLD and their
+    titles share enough tokens, which keeps different roles with the same
+    boilerplate description apart.
+    """
+
+    def __init__(self, opportunities_file, load_records, revision=None):
+        super().__init__(opportunities_file, "minhash.idx", load_records, revision)
+        self._signatures = {}
+        self._titles = {}
+        self._buckets = [dict() for _ in range(LSH_BANDS)]
+
+    @staticmethod
+    def _bands(signature):
+        rows = NUM_PERMUTATIONS // LSH_BANDS
+        return [tuple(signature[i * rows:(i + 1) * rows]) for i in range(LSH_BANDS)]
+
+    def _payload(self, record):
+        packed = struct.pack(f"<{NUM_PERMUTATIONS}I", *minhash_signature(record))
+        title = " ".join(str(record.get("title") or "").split())
+        return f"{base64.b64encode(packed).decode('ascii')}\t{title}"
+
+    def _index(self, record_id, payload):
+        encoded, _, title = payload.partition("\t")
+        signature = struct.unpack(f"<{NUM_PERMUTATIONS}I", base64.b64decode(encoded))
+        self._signatures[record_id] = signature
+        self._titles[record_id] = title
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket.setdefault(band, set()).add(record_id)
+
+    def _unindex(self, record_id, payload):
+        signature = self._signatures.pop(record_id, None)
+        self._titles.pop(record_id, None)
+        if signature is None:
+            return
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            ids = bucket.get(band, set())
+            ids.discard(record_id)
+            if not ids:
+                bucket.pop(band, None)
+
+    def _reset(self):
+        self._signatures = {}
+        self._titles = {}
+        self._buckets = [dict() for _ in range(LSH_BANDS)]
+
+    def find_near_duplicate(self, job):
+        """
+        Return (opportunity_id, similarity) of the closest stored near-duplicate,
+        or None if there is none.
+        """
+        signature = minhash_signature(job)
+        with self._lock:
+            self._ensure_loaded()
+            candidates = set()
+            for band, bucket in zip(self._bands(signature), self._buckets):
+                candidates.update(bucket.get(band, ()))
+            best = None
+            for record_id in candidates:
+                similarity = signature_similarity(signature, self._signatures[record_id])
+                if (similarity >= NEAR_DUPLICATE_THRESHOLD
+                        and _title_overlap(job.get("title"), self._titles[record_id]) >= TITLE_OVERLAP_THRESHOLD
+                        and (best is None or similarity > best[1])):
+                    best = (record_id, similarity)
+            return best
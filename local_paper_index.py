@@ -0,0 +1,276 @@
+"""
+Self-contained research-paper index for when Ollama / Chroma aren't available.
+
+In GitHub Actions (and on a machine without the Ollama server) there is no
+embedding function, so the Chroma store can't be queried. LocalPaperIndex
+is a NumPy-only alternative that search_pdf falls back to: it is built
+ahead of time, can be committed or cached as a CI artifact, and opens in
+milliseconds.
+
+    python local_paper_index.py papers/                  # build from a folder of PDFs
+    python local_paper_index.py --from-db                # build from the Chroma store's chunks
+    python local_paper_index.py papers/ --out my_index   # somewhere else (default: paper_index/)
+
+Vectors are hashed TF-IDF: HashingEmbeddings (words and word pairs hashed
+into buckets, sublinear term frequency) weighted by each bucket's inverse
+document frequency and L2-normalized. A query is scored against every
+chunk with one vectorized cosine pass over the memory-mapped matrix.
+
+Layout:
+
+    <dir>/meta.json     {"format", "dim", "dtype", "bigrams", "count"}
+    <dir>/vectors.bin   count x dim rows (float32, or float16), read through a memmap
+    <dir>/idf.npy       per-bucket IDF weights
+    <dir>/chunks.jsonl  one {"id", "text", "metadata"} line per row
+    <dir>/offsets.npy   byte offset of each chunks.jsonl line
+
+Only the rows of the returned chunks are read from chunks.jsonl.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import threading
+
+import numpy as np
+
+from hashing_embeddings import DEFAULT_DIM, HashingEmbeddings
+from paper_search import check_search_args
+
+LOCAL_PAPER_INDEX_DIR = os.environ.get("PAPER_INDEX_DIR", "paper_index")
+INDEX_FORMAT = 1
+
+# Rows scored per block, so a large float16 matrix is never converted in one piece
+_SCORE_BLOCK_ROWS = 65536
+
+
+class LocalPaperIndex:
+    """
+    Read-only hashed TF-IDF index over paper chunks.
+
+    Use LocalPaperIndex.open() to load one and build_index() to create one.
+    search() has the same signature and return type as
+    HybridPaperRetriever.search, so search_pdf can use either.
+    """
+
+    def __init__(self, directory, meta):
+        self.directory = directory
+        self.meta = meta
+        self.embeddings = HashingEmbeddings(meta["dim"], meta["bigrams"])
+        self.idf = np.load(os.path.join(directory, "idf.npy"))
+        self.offsets = np.load(os.path.join(directory, "offsets.npy"), mmap_mode="r")
+        self.vectors = np.memmap(
+            os.path.join(directory, "vectors.bin"), dtype=meta["dtype"], mode="r",
+            shape=(meta["count"], meta["dim"]),
+        ) if meta["count"] else np.zeros((0, meta["dim"]), dtype=meta["dtype"])
+        self._chunks_path = os.path.join(directory, "chunks.jsonl")
+        self._lock = threading.Lock()
+
+    @classmethod
+    def open(cls, directory=LOCAL_PAPER_INDEX_DIR):
+        """
+        Load an index.
+
+        Returns:
+            LocalPaperIndex: The index, or None if there is none (or it's unreadable)
+        """
+        meta_path = os.path.join(directory, "meta.json")
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("format") != INDEX_FORMAT:
+                print(f"[WARNING] {directory} was built by another version; rebuild it with local_paper_index.py.")
+                return None
+            return cls(directory, meta)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[WARNING] Could not open local paper index {directory}: {e}")
+            return None
+
+    def __len__(self):
+        return self.meta["count"]
+
+    def embed_query(self, query):
+        """TF-IDF query vector (float32, unit length)."""
+        return _weight(np.asarray([self.embeddings.embed_query(query)], dtype=np.float32), self.idf)[0]
+
+    def top_k(self, query, k):
+        """
+        Best k rows for a query.
+
+        Returns:
+            list: (row, cosine score) tuples, best first; rows sharing no feature with the query are left out
+        """
+        query_vector = self.embed_query(query)
+        if not len(self) or not query_vector.any():
+            return []
+        scores = np.empty(len(self), dtype=np.float32)
+        for start in range(0, len(self), _SCORE_BLOCK_ROWS):
+            block = self.vectors[start:start + _SCORE_BLOCK_ROWS]
+            # Rows are unit length, so the dot product is the cosine
+            scores[start:start + len(block)] = np.asarray(block, dtype=np.float32) @ query_vector
+        k = min(k, len(scores))
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(int(row), float(scores[row])) for row in best if scores[row] > 0]
+
+    def chunk(self, row):
+        """The {"id", "text", "metadata"} record of a row."""
+        with self._lock, open(self._chunks_path, "rb") as f:
+            f.seek(int(self.offsets[row]))
+            return json.loads(f.readline())
+
+    def search(self, query, k=8, fetch_k=None):
+        """
+        Best k chunks for a query.
+
+        Args:
+            query (str): Search query
+            k (int): Chunks to return
+            fetch_k (int): Unused; every chunk is scored
+
+        Returns:
+            list: LangChain Documents, best first
+
+        Raises:
+            ValueError: If k or fetch_k is not a whole number of at least 1
+        """
+        from langchain_core.documents import Document
+
+        check_search_args(k, k if fetch_k is None else fetch_k)
+
+        results = []
+        for row, _ in self.top_k(query, k):
+            record = self.chunk(row)
+            results.append(Document(page_content=record["text"], metadata=record["metadata"]))
+        return results
+
+
+def _weight(vectors, idf):
+    weighted = vectors * idf
+    norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+    return weighted / np.where(norms == 0, 1.0, norms)
+
+
+def build_index(chunks, directory=LOCAL_PAPER_INDEX_DIR, dim=DEFAULT_DIM, dtype="float32", bigrams=True):
+    """
+    Build an index, replacing any index already in directory.
+
+    Args:
+        chunks (iterable): (chunk id, text, metadata) tuples
+        directory (str): Where to write the index
+        dim (int): Hashed feature buckets
+        dtype (str): "float32", or "float16" (half the size, but slower to score)
+
+    Returns:
+        int: Number of chunks indexed
+    """
+    embeddings = HashingEmbeddings(dim, bigrams)
+    tmp_dir = directory.rstrip("/\\") + ".tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    # Pass 1: hashed vectors to a scratch float32 file, records to chunks.jsonl,
+    # document frequency per bucket
+    raw_path = os.path.join(tmp_dir, "raw.f32")
+    document_frequency = np.zeros(dim, dtype=np.int64)
+    offsets = [0]
+    count = 0
+    with open(raw_path, "wb") as raw, open(os.path.join(tmp_dir, "chunks.jsonl"), "wb") as records:
+        for chunk_id, text, metadata in chunks:
+            vector = np.asarray(embeddings.embed_documents([text])[0], dtype=np.float32)
+            document_frequency += vector != 0
+            raw.write(vector.tobytes())
+            records.write((json.dumps({"id": chunk_id, "text": text, "metadata": metadata}) + "\n").encode("utf-8"))
+            offsets.append(records.tell())
+            count += 1
+
+    # Pass 2: IDF-weight and normalize into the final matrix, block by block
+    idf = (np.log((1 + count) / (1 + document_frequency)) + 1).astype(np.float32)
+    if count:
+        raw = np.memmap(raw_path, dtype=np.float32, mode="r", shape=(count, dim))
+        vectors = np.memmap(os.path.join(tmp_dir, "vectors.bin"), dtype=dtype, mode="w+", shape=(count, dim))
+        for start in range(0, count, _SCORE_BLOCK_ROWS):
+            vectors[start:start + _SCORE_BLOCK_ROWS] = _weight(raw[start:start + _SCORE_BLOCK_ROWS], idf)
+        vectors.flush()
+        del raw, vectors
+    os.remove(raw_path)
+    np.save(os.path.join(tmp_dir, "idf.npy"), idf)
+    np.save(os.path.join(tmp_dir, "offsets.npy"), np.asarray(offsets[:-1], dtype=np.int64))
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"format": INDEX_FORMAT, "dim": dim, "dtype": np.dtype(dtype).name, "bigrams": bigrams,
+                   "count": count}, f, indent=2)
+
+    # Swap the finished index in
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(tmp_dir, directory)
+    return count
+
+
+def iter_pdf_chunks(folder):
+    """(id, text, metadata) for every chunk of every PDF under folder, chunked like ingest_papers.py."""
+    from ingest_papers import chunk_pages, find_pdfs, parse_pdf
+
+    for source in find_pdfs(folder):
+        try:
+            pages = parse_pdf(source)
+        except Exception as e:
+            print(f"❌ {source}: {e}")
+            continue
+        chunks = chunk_pages(source, pages)
+        print(f"📄 {source}: {len(chunks)} chunks")
+        for cid, (text, metadata) in chunks.items():
+            yield cid, text, metadata
+
+
+def iter_db_chunks(db_path, page_size=5000):
+    """(id, text, metadata) for every chunk in a Chroma store (no embedding model needed)."""
+    from chromadb import Settings
+    from langchain_community.vectorstores import Chroma
+
+    db = Chroma(persist_directory=db_path, client_settings=Settings(anonymized_telemetry=False))
+    offset = 0
+    while True:
+        page = db.get(include=["documents", "metadatas"], limit=page_size, offset=offset)
+        for cid, text, metadata in zip(page["ids"], page["documents"], page["metadatas"]):
+            yield cid, text, metadata or {}
+        if len(page["ids"]) < page_size:
+            return
+        offset += page_size
+
+
+def main(argv=None):
+    from ingest_papers import PAPERS_DB_PATH
+
+    parser = argparse.ArgumentParser(description="Build the local (no Ollama) research-paper index")
+    parser.add_argument("folder", nargs="?", help="Folder of PDFs (searched recursively)")
+    parser.add_argument("--from-db", nargs="?", const=PAPERS_DB_PATH, metavar="DB",
+                        help=f"Index the chunks of a Chroma store instead (default: {PAPERS_DB_PATH})")
+    parser.add_argument("--out", default=LOCAL_PAPER_INDEX_DIR, help=f"Index directory (default: {LOCAL_PAPER_INDEX_DIR})")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="Hashed feature buckets")
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float32",
+                        help="float16 halves the index but every query has to convert it")
+    args = parser.parse_args(argv)
+
+    if bool(args.folder) == bool(args.from_db):
+        print("Error: Give either a folder of PDFs or --from-db.")
+        return 1
+    if args.folder and not os.path.isdir(args.folder):
+        print(f"Error: Folder '{args.folder}' does not exist.")
+        return 1
+    if args.from_db and not os.path.isdir(args.from_db):
+        print(f"Error: Chroma store '{args.from_db}' does not exist.")
+        return 1
+
+    chunks = iter_pdf_chunks(args.folder) if args.folder else iter_db_chunks(args.from_db)
+    count = build_index(chunks, args.out, args.dim, args.dtype)
+    size = sum(os.path.getsize(os.path.join(args.out, name)) for name in os.listdir(args.out))
+    print(f"\n✅ Indexed {count} chunks into {args.out}/ ({size / 1e6:.1f} MB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
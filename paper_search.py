@@ -0,0 +1,196 @@
+"""
+Two-stage retrieval over the research-paper store.
+
+search_pdf used to run a Chroma MMR search (fetch_k=250, k=25) on every
+call. HybridPaperRetriever does this instead:
+
+1. Prefilter: a BM25 keyword index over all chunk texts
+   (text_index.InvertedIndex, built once from the store) picks the fetch_k
+   best keyword matches.
+2. Rerank: each candidate's BM25 score and the cosine similarity of its
+   stored embedding to the query embedding are scaled to [0, 1] and mixed
+   (KEYWORD_WEIGHT, default 0.5), and the best k are returned. Keeping the
+   keyword score matters: exact names (sites, species, authors) are what
+   the embeddings blur. If the keywords match fewer than k chunks (a purely
+   conceptual query), a vector search fills the gap.
+
+Unlike the old MMR search there is no diversity step and the default k is
+8 rather than 25, so several passages can come from the same paper; ask
+for a larger k to see more papers.
+
+Results are kept in an LRU cache keyed by the normalized query, k and
+fetch_k. The keyword index and the cache are rebuilt when ingest_papers.py
+changes the store (its manifest changes).
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from ingest_papers import MANIFEST_NAME
+from text_index import InvertedIndex
+
+DEFAULT_K = 8
+DEFAULT_FETCH_K = 100
+QUERY_CACHE_SIZE = 128
+
+# Share of the BM25 score in the final ranking (the rest is embedding similarity)
+KEYWORD_WEIGHT = float(os.getenv("PAPER_SEARCH_KEYWORD_WEIGHT", "0.5"))
+
+# Chunks read from the store per request when building the keyword index
+_LOAD_PAGE_SIZE = 5000
+
+
+def normalize_query(query):
+    """Cache key form of a query: lowercase, single spaces."""
+    return " ".join(str(query).lower().split())
+
+
+def check_search_args(k, fetch_k):
+    """
+    Validate k and fetch_k of a paper search.
+
+    Returns:
+        int: fetch_k, raised to k if it is smaller (the rerank never sees fewer than k candidates)
+
+    Raises:
+        ValueError: If k or fetch_k is not a whole number of at least 1
+    """
+    for name, value in (("k", k), ("fetch_k", fetch_k)):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(f"{name} must be a whole number of at least 1, got {value!r}")
+    return max(fetch_k, k)
+
+
+def fuse_scores(keyword, vector, keyword_weight=KEYWORD_WEIGHT):
+    """
+    Combine keyword (BM25) and vector (cosine) scores of the same candidates.
+
+    Each score list is min-max scaled to [0, 1] over the candidates, then
+    mixed as keyword_weight * keyword + (1 - keyword_weight) * vector.
+    """
+    def scale(values):
+        values = np.asarray(values, dtype=np.float32)
+        spread = values.max() - values.min() if len(values) else 0
+        return (values - values.min()) / spread if spread > 0 else np.ones_like(values)
+
+    return keyword_weight * scale(keyword) + (1 - keyword_weight) * scale(vector)
+
+
+def cosine_scores(query_vector, vectors):
+    """Cosine similarity of one vector against each row of a matrix."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    query = np.asarray(query_vector, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    return (matrix @ query) / np.where(norms == 0, 1.0, norms)
+
+
+class HybridPaperRetriever:
+    """
+    BM25 prefilter + embedding rerank over a LangChain Chroma store.
+
+    Args:
+        db: Chroma vector store (get(), similarity_search_by_vector(), embeddings)
+        db_path (str): Store directory, watched for ingest_papers.py updates
+        cache_size (int): Number of query results kept
+    """
+
+    def __init__(self, db, db_path, cache_size=QUERY_CACHE_SIZE, keyword_weight=KEYWORD_WEIGHT):
+        self.db = db
+        self.keyword_weight = keyword_weight
+        self.manifest_path = os.path.join(db_path, MANIFEST_NAME)
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._index = None
+        self._revision = None
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _store_revision(self):
+        try:
+            st = os.stat(self.manifest_path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _build_index(self):
+        index = InvertedIndex()
+        offset = 0
+        while True:
+            page = self.db.get(include=["documents"], limit=_LOAD_PAGE_SIZE, offset=offset)
+            for chunk_id, text in zip(page["ids"], page["documents"]):
+                index.add(chunk_id, text)
+            if len(page["ids"]) < _LOAD_PAGE_SIZE:
+                return index
+            offset += _LOAD_PAGE_SIZE
+
+    def _refresh(self):
+        revision = self._store_revision()
+        if self._index is None or revision != self._revision:
+            self._index = self._build_index()
+            self._revision = revision
+            self._cache.clear()
+
+    def search(self, query, k=DEFAULT_K, fetch_k=DEFAULT_FETCH_K):
+        """
+        Best k chunks for a query.
+
+        Args:
+            query (str): Search query
+            k (int): Chunks to return
+            fetch_k (int): Keyword candidates to rerank (at least k are)
+
+        Returns:
+            list: LangChain Documents, best first
+
+        Raises:
+            ValueError: If k or fetch_k is not a whole number of at least 1
+        """
+        from langchain_core.documents import Document
+
+        fetch_k = check_search_args(k, fetch_k)
+        key = (normalize_query(query), k, fetch_k)
+        with self._lock:
+            self._refresh()
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return list(self._cache[key])
+            matches = self._index.search(query, limit=fetch_k)
+        candidates = [chunk_id for chunk_id, _ in matches]
+        keyword_scores = dict(matches)
+        self.misses += 1
+
+        query_vector = self.db.embeddings.embed_query(query)
+        results = []
+        if candidates:
+            found = self.db.get(ids=candidates, include=["embeddings", "documents", "metadatas"])
+            if len(found["ids"]):
+                scores = fuse_scores(
+                    [keyword_scores.get(chunk_id, 0.0) for chunk_id in found["ids"]],
+                    cosine_scores(query_vector, found["embeddings"]),
+                    self.keyword_weight,
+                )
+                order = np.argsort(-scores)[:k]
+                results = [
+                    Document(page_content=found["documents"][i], metadata=found["metadatas"][i] or {})
+                    for i in order
+                ]
+
+        if len(results) < k:
+            # Too few keyword matches: fill up with plain vector search
+            seen = {(doc.page_content, doc.metadata.get("source")) for doc in results}
+            for doc in self.db.similarity_search_by_vector(query_vector, k=k):
+                if len(results) >= k:
+                    break
+                if (doc.page_content, doc.metadata.get("source")) not in seen:
+                    results.append(doc)
+
+        with self._lock:
+            self._cache[key] = results
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return list(results)
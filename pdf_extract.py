@@ -0,0 +1,215 @@
+"""
+Parallel PDF text extraction shared by read_document and the GUI.
+
+Text extraction is CPU-bound Python, so one loop over a 200-page paper
+takes many seconds. iter_pages() splits the page range into chunks, hands
+them to a shared process pool and yields the pages back in order as the
+chunks finish, so callers can show the first pages while the rest are
+still being parsed. Short documents are extracted in-process, where the
+pool's start-up cost isn't worth it. Workers are started on the first pooled
+call and then kept: that call pays for starting them (about 0.4 s more than
+a warm call for 3 workers on one core; workers import only this module and
+pypdf, never the caller's main script).
+
+Two ways to get a usable answer from a large document faster:
+
+- max_pages: only extract the first N pages.
+- extract_structure(): title, page count and the outline (bookmarks) with
+  page numbers, without extracting any text.
+"""
+
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    from PyPDF2 import PdfReader
+
+# Documents with fewer pages than this are extracted without the pool
+MIN_PAGES_FOR_POOL = 16
+
+# Pages per task sent to a worker
+PAGES_PER_TASK = 8
+
+# Leave one core for the caller; with a single core the pool only adds overhead
+POOL_WORKERS = max((os.cpu_count() or 1) - 1, 1)
+USE_POOL = (os.cpu_count() or 1) > 1
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _pool_context():
+    """
+    Start method for the pool's workers.
+
+    The pool is first needed from a tool or GUI thread of a process that
+    already runs other threads (asyncio, genai, Chroma), and forking such a
+    process can deadlock. On POSIX the workers are forked from a small
+    forkserver that has only this module (and pypdf) imported; Windows only
+    has spawn.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+@contextmanager
+def _main_hidden():
+    """
+    Keep the caller's __main__ out of worker start-up.
+
+    Spawned and forkserver workers re-run the parent's main script (as
+    __mp_main__) before they take a task. For agent_gui.py that means
+    whisper/torch, the agent, Chroma and the tracker stores, once per
+    worker. The tasks only need this module, so while workers are being
+    started __main__ is swapped for an empty module, which multiprocessing
+    leaves alone.
+    """
+    main = sys.modules["__main__"]
+    sys.modules["__main__"] = types.ModuleType("__main__")
+    try:
+        yield
+    finally:
+        sys.modules["__main__"] = main
+
+
+def _get_pool():
+    """Return the shared extraction pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS, mp_context=_pool_context())
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def _submit_ranges(path, total):
+    """Queue the page ranges of a PDF on the pool; workers are started on demand in submit()."""
+    pool = _get_pool()
+    with _pool_lock, _main_hidden():
+        return [
+            (start, pool.submit(_extract_range, path, start, min(start + PAGES_PER_TASK, total)))
+            for start in range(0, total, PAGES_PER_TASK)
+        ]
+
+
+def _extract_range(path, start, stop):
+    """Extract pages [start, stop) of a PDF (runs in a worker process)."""
+    reader = PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def page_count(path):
+    """Number of pages in a PDF."""
+    return len(PdfReader(path).pages)
+
+
+def _check_max_pages(max_pages):
+    if max_pages is not None and (isinstance(max_pages, bool) or not isinstance(max_pages, int) or max_pages < 1):
+        raise ValueError(f"max_pages must be a whole number of at least 1, got {max_pages!r}")
+
+
+def iter_pages(path, max_pages=None, parallel=True):
+    """
+    Extract the text of a PDF page by page, in order.
+
+    Args:
+        path (str): PDF file
+        max_pages (int, optional): Only extract the first max_pages pages
+        parallel (bool): Use the process pool for long documents
+
+    Yields:
+        tuple: (page number starting at 1, page text)
+
+    Raises:
+        ValueError: If max_pages is given and is less than 1
+    """
+    _check_max_pages(max_pages)
+    reader = PdfReader(path)
+    total = len(reader.pages)
+    if max_pages is not None:
+        total = min(total, max_pages)
+
+    if not (parallel and USE_POOL) or total < MIN_PAGES_FOR_POOL:
+        for i in range(total):
+            yield i + 1, reader.pages[i].extract_text() or ""
+        return
+
+    futures = _submit_ranges(path, total)
+    try:
+        for start, future in futures:
+            for offset, text in enumerate(future.result()):
+                yield start + offset + 1, text
+    finally:
+        # The caller stopped early (or a task failed): drop the work not started yet
+        for _, future in futures:
+            future.cancel()
+
+
+def extract_text(path, max_pages=None, page_markers=False):
+    """
+    Extract the text of a PDF.
+
+    Args:
+        path (str): PDF file
+        max_pages (int, optional): Only extract the first max_pages pages
+        page_markers (bool): Prefix each page with "[Page N]" and skip empty pages
+
+    Returns:
+        str: The extracted text
+
+    Raises:
+        ValueError: If max_pages is given and is less than 1
+    """
+    # Checked here too: iter_pages is a generator and would only raise once consumed
+    _check_max_pages(max_pages)
+    if page_markers:
+        return "".join(f"\n[Page {n}]\n{text}\n" for n, text in iter_pages(path, max_pages) if text)
+    return "\n".join(text for _, text in iter_pages(path, max_pages))
+
+
+def extract_structure(path):
+    """
+    Describe a PDF without extracting its text: title, page count and outline.
+
+    Returns:
+        str: e.g. "Title: ...\\nPages: 212\\nOutline:\\n- 1 Introduction (p. 3)\\n  - 1.1 Background (p. 4)"
+    """
+    reader = PdfReader(path)
+    lines = []
+    title = reader.metadata.get("/Title") if reader.metadata else None
+    if title:
+        lines.append(f"Title: {title}")
+    lines.append(f"Pages: {len(reader.pages)}")
+
+    def walk(items, depth):
+        for item in items:
+            if isinstance(item, list):
+                walk(item, depth + 1)
+                continue
+            try:
+                page = reader.get_destination_page_number(item) + 1
+                lines.append(f"{'  ' * depth}- {item.title} (p. {page})")
+            except Exception:
+                lines.append(f"{'  ' * depth}- {getattr(item, 'title', item)}")
+
+    try:
+        outline = reader.outline
+    except Exception:
+        outline = []
+    if outline:
+        lines.append("Outline:")
+        walk(outline, 0)
+    else:
+        lines.append("Outline: (none)")
+    return "\n".join(lines)
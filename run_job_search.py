@@ -6,37 +6,101 @@ This script is designed to run on a schedule (via GitHub Actions cron) to:
 2. Save new opportunities to job_opportunities.json
 3. Track API usage
 4. Exit gracefully if usage limit is reached
+
+Not every search runs every day: search_planner splits today's share of the
+monthly quota across JOB_SEARCHES by how many new opportunities each query
+has historically found per paid search (see plan_job_searches).
+
+Each search only asks for what is new since its last successful run: the
+per-query high-water marks in STATE_FILE pick the narrowest date chip that
+covers the gap and stop paging once known postings show up.
+
+Searches run concurrently (at most MAX_CONCURRENCY at a time) on a pooled
+HTTP session, so the run takes about as long as the slowest search. Each
+search reserves its quota from the usage ledger before it is sent, so
+parallel searches can't overspend the monthly limit.
 """
 
+import asyncio
 import sys
 import os
+import time
 from datetime import datetime
 
 # Import job search functions from tools_2
-from tools_2 import search_jobs, get_serpapi_usage_report
+from tools_2 import search_jobs, get_serpapi_usage_report, export_tracker_json, plan_job_searches, prune_job_descriptions
+from serpapi_client import MAX_CONCURRENCY, data_path
+from search_watermarks import SearchWatermarks, choose_date_chip
 
 # Configure your job searches here
 # NOTE: SerpAPI does not support "Remote" as a location parameter or "State, Country" format
 # For remote jobs, use a broad location like "United States" and add "Remote" to the query
 # Valid location examples: "Florida", "United States", "New York", "California"
+# max_pages: how many 10-result pages to follow at most (each page is one SerpAPI search);
+# paging stops early once a page brings no new opportunities
+DEFAULT_MAX_PAGES = 1
+
+# Monthly SerpAPI budget shared by these searches and ad hoc agent searches
+USAGE_LIMIT = 95
+
+# Per-query high-water marks (last successful run, newest posting seen); committed by the workflow
+STATE_FILE = data_path("job_search_state.json")
+
 JOB_SEARCHES = [
     {
         "query": "Marine Scientist",
         "location": "Florida",  # Changed from "Florida, USA" - SerpAPI doesn't support "State, Country" format
-        "date_posted": "week"
+        "date_posted": "week",
+        "max_pages": 2
     },
     {
         "query": "Research Marine Biologist Remote",  # Added "Remote" to query instead of location
         "location": "United States",  # Changed from "Remote" - not a valid location parameter
-        "date_posted": "week"
+        "date_posted": "week",
+        "max_pages": 3
     },
     {
         "query": "Machine Learning Engineer (Computational Biology/Ecology) Remote",  # Added "Remote" to query
         "location": "United States",  # Changed from "Remote" - not a valid location parameter
-        "date_posted": "week"
+        "date_posted": "week",
+        "max_pages": 3
     }
 ]
 
+async def _run_search(search, semaphore):
+    """Run one configured search on a worker thread once a concurrency slot is free."""
+    async with semaphore:
+        return await asyncio.to_thread(
+            search_jobs,
+            query=search["query"],
+            location=search["location"],
+            date_posted=search.get("date_posted", "week"),
+            max_results=10,
+            usage_limit=USAGE_LIMIT,
+            save_results=True,
+            max_pages=search.get("max_pages", DEFAULT_MAX_PAGES),
+            since=search.get("since")
+        )
+
+
+async def run_searches(searches, max_concurrency=MAX_CONCURRENCY):
+    """
+    Run job searches concurrently.
+    
+    Args:
+        searches (list): Search configs like JOB_SEARCHES
+        max_concurrency (int): Maximum number of searches in flight
+    
+    Returns:
+        list: One search_jobs result dict (or the raised exception) per search, in order
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return await asyncio.gather(
+        *(_run_search(search, semaphore) for search in searches),
+        return_exceptions=True
+    )
+
+
 def main():
     """Run predefined job searches and report results."""
     print(f"🔍 Job Search Script - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -48,66 +112,94 @@ def main():
     print(usage_report)
     print()
     
+    # Decide which searches get today's share of the quota
+    plan, budget = plan_job_searches(JOB_SEARCHES, USAGE_LIMIT)
+    print(f"🧮 Today's budget: {budget} search(es)")
+    for entry in plan:
+        search = entry["search"]
+        print(f"   {entry['pages']} page(s) - {search['query']} - {search['location']} "
+              f"(~{entry['expected_yield']} new per search)")
+    todays_searches = [dict(e["search"], max_pages=e["pages"]) for e in plan if e["pages"] > 0]
+    
+    # Only ask for postings since each search's last successful run
+    run_time = datetime.now()
+    watermarks = SearchWatermarks(STATE_FILE)
+    for search in todays_searches:
+        state = watermarks.get(search["query"], search["location"]) or {}
+        search["date_posted"] = choose_date_chip(state, run_time, default=search.get("date_posted", "week"))
+        search["since"] = state.get("newest_posting")
+    
     total_new_jobs = 0
     all_warnings = []
+    limit_reached = False
     
-    # Run each search
-    for i, search in enumerate(JOB_SEARCHES, 1):
-        print(f"\n🔎 Search {i}/{len(JOB_SEARCHES)}: {search['query']} - {search['location']}")
+    started = time.perf_counter()
+    results = asyncio.run(run_searches(todays_searches))
+    elapsed = time.perf_counter() - started
+    
+    # Report each search in order
+    for i, (search, result) in enumerate(zip(todays_searches, results), 1):
+        print(f"\n🔎 Search {i}/{len(todays_searches)}: {search['query']} - {search['location']} "
+              f"(posted: {search['date_posted']})")
         print("-" * 60)
         
-        try:
-            result = search_jobs(
-                query=search["query"],
-                location=search["location"],
-                date_posted=search.get("date_posted", "week"),
-                max_results=10,
-                usage_limit=95,
-                save_results=True
-            )
-            
-            # Debug: Print raw result keys
-            # print(f"DEBUG: Result keys: {result.keys()}")
-            
-            # Check for warnings/errors
-            if result.get("warning"):
-                all_warnings.append(result["warning"])
-                print(f"⚠️  {result['warning']}")
-                
-                # If usage limit reached, stop searching
-                if "Usage limit reached" in result["warning"]:
-                    print("\n🛑 Stopping job search - usage limit reached.")
-                    break
-        except Exception as e:
-            print(f"❌ Error in search {i}: {e}")
-            all_warnings.append(f"Search {i} failed: {e}")
+        if isinstance(result, Exception):
+            print(f"❌ Error in search {i}: {result}")
+            all_warnings.append(f"Search {i} failed: {result}")
             continue
         
+        # Check for warnings/errors
+        if result.get("warning"):
+            all_warnings.append(result["warning"])
+            print(f"⚠️  {result['warning']}")
+        limit_reached = limit_reached or result.get("limit_reached", False)
+        
+        # Nothing was fetched (skipped at the usage limit, or the first page failed)
+        if not result.get("pages_fetched"):
+            continue
+        
+        # Move the high-water mark unless the search stopped before paging finished
+        if not result.get("stopped_early"):
+            watermarks.update(search["query"], search["location"], result.get("jobs", []), run_time)
+        
         # Report results
         new_count = result.get("new_jobs_count", 0)
         total_jobs = len(result.get("jobs", []))
         total_new_jobs += new_count
         
-        print(f"✅ Found {total_jobs} jobs, {new_count} new")
+        print(f"✅ Found {total_jobs} jobs on {result.get('pages_fetched', 1)} page(s), {new_count} new")
         
         # Show usage stats
         usage_stats = result.get("usage_stats", {})
         print(f"📈 Usage: {usage_stats.get('used', 0)}/{usage_stats.get('limit', 100)} searches this month")
     
+    watermarks.save()
+    
     # Final summary
     print("\n" + "=" * 60)
     print(f"🎯 Job Search Complete!")
     print(f"   Total new opportunities discovered: {total_new_jobs}")
+    print(f"   {len(todays_searches)} searches in {elapsed:.1f}s (up to {MAX_CONCURRENCY} at a time)")
     
     if all_warnings:
         print(f"   Warnings: {len(all_warnings)}")
         for w in all_warnings:
             print(f"   - {w}")
     
+    # Full descriptions left behind by deleted or never-saved postings. A checkout
+    # resets file times, and nothing else writes in GitHub Actions, so skip the age guard there
+    pruned = prune_job_descriptions(min_age=0 if os.getenv("GITHUB_ACTIONS") == "true" else 3600)
+    if pruned:
+        print(f"   Removed {pruned} unreferenced job description(s)")
+    
+    # Keep the committed JSON files current when running on the SQLite backend
+    for path in export_tracker_json():
+        print(f"   Exported {path}")
+    
     # Exit code
     # 0 = success
     # 1 = usage limit reached (warn but don't fail the workflow)
-    if any("Usage limit reached" in w for w in all_warnings):
+    if limit_reached:
         print("\n⚠️  Exiting with code 1 (usage limit)")
         sys.exit(1)
     else:
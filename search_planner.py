@@ -0,0 +1,130 @@
+"""
+Daily budget planner for the scheduled SerpAPI job searches.
+
+The monthly quota is shared by the scheduled searches in run_job_search.py
+and ad hoc searches made through the agent. Instead of running every
+configured search every day, plan_searches() decides how many paid
+searches (result pages) each configured search gets today:
+
+1. Today's budget is what is left of the usage limit, minus the share
+   expected to go to ad hoc searches for the rest of the month, spread over
+   the remaining scheduled run days.
+2. Each search is scored by its learned yield - new opportunities per paid
+   search from the ledger's query_stats, smoothed towards an optimistic
+   prior so new or rarely run queries still get tried. Yield grows with the
+   days since a query last ran, because new postings pile up meanwhile.
+3. Pages are handed out greedily by expected yield; every further page of
+   the same search is worth PAGE_DECAY times the one before it.
+"""
+
+import calendar
+import math
+from datetime import date, datetime
+
+from serpapi_ledger import query_key
+
+# Smoothing prior: an unseen query is assumed to bring PRIOR_NEW_JOBS new
+# opportunities per search, worth PRIOR_SEARCHES searches of evidence
+PRIOR_NEW_JOBS = 3.0
+PRIOR_SEARCHES = 2.0
+
+# Value of each additional page relative to the previous one
+PAGE_DECAY = 0.5
+
+# A query's yield grows by this factor per day since it last ran, up to MAX_STALENESS_BOOST
+STALENESS_PER_DAY = 0.25
+MAX_STALENESS_BOOST = 3.0
+
+# Scheduled run days (Monday=0); matches the weekday cron in job_monitor.yml
+RUN_WEEKDAYS = (0, 1, 2, 3, 4)
+
+
+def run_days_left(today=None, run_weekdays=RUN_WEEKDAYS):
+    """Scheduled run days from today through the end of the month (at least 1)."""
+    today = today or date.today()
+    last_day = calendar.monthrange(today.year, today.month)[1]
+    days = sum(
+        1 for day in range(today.day, last_day + 1)
+        if date(today.year, today.month, day).weekday() in run_weekdays
+    )
+    return max(days, 1)
+
+
+def expected_yield(stats, today=None):
+    """
+    Smoothed new opportunities per paid search for one query.
+
+    Args:
+        stats (dict, optional): The query's query_stats entry
+        today (date, optional): Date to measure staleness from
+
+    Returns:
+        float: Expected new opportunities for the query's next search
+    """
+    stats = stats or {}
+    rate = (stats.get("new_jobs", 0) + PRIOR_NEW_JOBS) / (stats.get("searches", 0) + PRIOR_SEARCHES)
+    if stats.get("last_run"):
+        days_idle = ((today or date.today()) - datetime.fromisoformat(stats["last_run"]).date()).days
+        rate *= min(1 + STALENESS_PER_DAY * max(days_idle - 1, 0), MAX_STALENESS_BOOST)
+    return rate
+
+
+def _ad_hoc_reserve(usage_data, scheduled_keys, today):
+    """Searches to keep back for ad hoc use, projected from this month's ad hoc rate."""
+    scheduled = {key.split("|")[0] for key in scheduled_keys}
+    ad_hoc = 0
+    for entry in usage_data.get("searches", []):
+        # Later pages are logged as "<query> (page N)"
+        base_query = entry["query"].split(" (page ")[0]
+        if query_key(base_query).split("|")[0] not in scheduled:
+            ad_hoc += 1
+    days_elapsed = today.day
+    days_remaining = calendar.monthrange(today.year, today.month)[1] - today.day + 1
+    return math.ceil(ad_hoc / days_elapsed * days_remaining)
+
+
+def plan_searches(searches, usage_data, usage_limit, today=None, run_weekdays=RUN_WEEKDAYS):
+    """
+    Decide which configured searches run today and with how many pages.
+
+    Args:
+        searches (list): Search configs like run_job_search.JOB_SEARCHES; "max_pages"
+                         caps the pages a search can get (default 1)
+        usage_data (dict): Usage document from the SerpAPI usage ledger
+        usage_limit (int): Monthly search budget for scheduled + ad hoc searches
+        today (date, optional): Planning date (default: today)
+        run_weekdays (tuple): Weekdays the scheduled job runs on
+
+    Returns:
+        tuple: (plan, budget) - plan is a list of {"search", "pages", "expected_yield"}
+        dicts in config order (searches with 0 pages included), budget is the
+        number of searches allotted to today
+    """
+    today = today or date.today()
+    used = usage_data.get("monthly_counts", {}).get(today.strftime("%Y-%m"), 0)
+    query_stats = usage_data.get("query_stats", {})
+    keys = [query_key(s["query"], s.get("location", "")) for s in searches]
+
+    available = usage_limit - used - _ad_hoc_reserve(usage_data, keys, today)
+    budget = max(min(math.ceil(available / run_days_left(today, run_weekdays)), usage_limit - used), 0)
+
+    yields = [expected_yield(query_stats.get(key), today) for key in keys]
+    pages = [0] * len(searches)
+    for _ in range(budget):
+        # Marginal value of one more page for each search that still has page budget
+        candidates = [
+            (yields[i] * PAGE_DECAY ** pages[i], i)
+            for i, search in enumerate(searches)
+            if pages[i] < search.get("max_pages", 1)
+        ]
+        if not candidates:
+            break
+        # Highest value wins; ties go to the search listed first
+        _, best = max(candidates, key=lambda c: (c[0], -c[1]))
+        pages[best] += 1
+
+    plan = [
+        {"search": search, "pages": n_pages, "expected_yield": round(y, 2)}
+        for search, n_pages, y in zip(searches, pages, yields)
+    ]
+    return plan, budget
@@ -0,0 +1,130 @@
+"""
+Per-query high-water marks for the scheduled job monitor.
+
+For every scheduled (query, location) the monitor remembers when it last
+ran successfully and the newest posting it saw then. The next run uses
+that to:
+
+- ask SerpAPI for the narrowest date chip ("today", "3days", "week",
+  "month") that still covers the time since the last run, and
+- stop paging as soon as a page reaches postings that are already known or
+  older than the newest posting seen last time.
+
+SerpAPI only gives relative posting times ("3 days ago"), so posting times
+are estimated against the time of the search.
+"""
+
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+from serpapi_ledger import query_key
+from tracker_store import _write_json_atomic
+
+# Date chips from narrowest to widest, with the window each one covers
+DATE_CHIP_WINDOWS = [
+    ("today", timedelta(days=1)),
+    ("3days", timedelta(days=3)),
+    ("week", timedelta(days=7)),
+    ("month", timedelta(days=30)),
+]
+
+# Cron runs drift by a few minutes to hours; a gap this much over a window still uses it
+RUN_SLACK = timedelta(hours=3)
+
+_RELATIVE_TIME = re.compile(r"(\d+)\+?\s*(minute|hour|day|week|month)s?\s+ago", re.IGNORECASE)
+_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+}
+
+
+def posted_at(relative, now=None):
+    """
+    Estimate when a posting went up from SerpAPI's relative "posted_at" text.
+
+    Args:
+        relative (str): e.g. "5 hours ago", "3 days ago", "30+ days ago", "Just posted"
+        now (datetime, optional): Time the search was made
+
+    Returns:
+        datetime or None if the text isn't recognized
+    """
+    now = now or datetime.now()
+    text = str(relative or "").strip().lower()
+    if text in ("just posted", "today", "just now"):
+        return now
+    if text == "yesterday":
+        return now - timedelta(days=1)
+    match = _RELATIVE_TIME.search(text)
+    if not match:
+        return None
+    return now - int(match.group(1)) * _UNITS[match.group(2).lower()]
+
+
+def choose_date_chip(state, now=None, default="week"):
+    """
+    Narrowest date chip covering the time since the last successful run.
+
+    Args:
+        state (dict, optional): The query's watermark ({"last_run", "newest_posting"})
+        now (datetime, optional): Time of this run
+        default (str): Chip to use when the query has never run
+
+    Returns:
+        str: "today", "3days", "week" or "month"
+    """
+    if not state or not state.get("last_run"):
+        return default
+    gap = (now or datetime.now()) - datetime.fromisoformat(state["last_run"])
+    for chip, window in DATE_CHIP_WINDOWS:
+        if gap <= window + RUN_SLACK:
+            return chip
+    return DATE_CHIP_WINDOWS[-1][0]
+
+
+class SearchWatermarks:
+    """
+    High-water marks of scheduled searches, persisted as JSON.
+
+    Args:
+        path (str): State file, e.g. job_search_state.json
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.queries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.queries = json.load(f).get("queries", {})
+            except json.JSONDecodeError:
+                print(f"[WARNING] Corrupted {path}, starting without watermarks.")
+
+    def get(self, query, location=""):
+        """Return the watermark of a search, or None if it never ran."""
+        return self.queries.get(query_key(query, location))
+
+    def update(self, query, location, jobs, run_time):
+        """
+        Record a successful run and the newest posting it returned.
+
+        Args:
+            query (str): Search query
+            location (str): Search location
+            jobs (list): Job dicts returned by the search
+            run_time (datetime): When the search ran
+        """
+        state = self.queries.setdefault(query_key(query, location), {})
+        state["last_run"] = run_time.isoformat()
+        times = [t for t in (posted_at(job.get("date_posted"), run_time) for job in jobs) if t]
+        if times:
+            newest = max(times).isoformat()
+            state["newest_posting"] = max(newest, state.get("newest_posting", ""))
+
+    def save(self):
+        _write_json_atomic(self.path, {"queries": self.queries})
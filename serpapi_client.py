@@ -0,0 +1,263 @@
+"""
+Shared HTTP client for SerpAPI.
+
+All SerpAPI calls go through one requests.Session whose connection pool is
+sized for the concurrent job searches in run_job_search.py, so parallel
+searches reuse TLS connections instead of opening a new one per request.
+Sessions are safe to share between threads for plain GET requests.
+
+ResponseCache keeps raw responses on disk, keyed by the normalized request
+parameters (the API key is never part of the key), so repeating a search
+within its engine's TTL costs neither a paid search nor a round trip.
+Entries are evicted least-recently-used once the cache exceeds its size
+budget.
+
+SERPAPI_BASE_URL points the client at another server, e.g. the local
+record/replay stand-in in serpapi_replay.py; with SERPAPI_RECORD_DIR set,
+every live response is also saved there as a replay fixture. While a
+stand-in is in use, data_path() sends the usage ledger, trackers and search
+state to SERPAPI_SCRATCH_DIR, so stand-in runs never touch the real ones.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_SERPAPI_BASE_URL = "https://serpapi.com"
+
+# Upper bound on simultaneous SerpAPI requests (and pooled connections)
+MAX_CONCURRENCY = 4
+
+# Response cache settings. TTLs (seconds) can be overridden per engine with
+# SERPAPI_CACHE_TTL_<ENGINE>, e.g. SERPAPI_CACHE_TTL_GOOGLE_JOBS=3600; 0 disables caching.
+SERPAPI_CACHE_DIR = os.getenv("SERPAPI_CACHE_DIR", "serpapi_cache")
+SERPAPI_CACHE_MAX_BYTES = int(os.getenv("SERPAPI_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+DEFAULT_CACHE_TTLS = {
+    "google_jobs": 12 * 3600,
+    "google_scholar": 7 * 24 * 3600,
+}
+DEFAULT_CACHE_TTL = 3600
+
+# Usage ledger, trackers and search state of runs against a stand-in server
+SERPAPI_SCRATCH_DIR = os.getenv("SERPAPI_SCRATCH_DIR", "serpapi_scratch")
+
+# Parameters that don't change the results
+_IGNORED_PARAMS = {"api_key", "no_cache", "output"}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def serpapi_base_url():
+    """Server to send SerpAPI requests to (SERPAPI_BASE_URL, default https://serpapi.com)."""
+    return os.getenv("SERPAPI_BASE_URL", DEFAULT_SERPAPI_BASE_URL).rstrip("/")
+
+
+def using_stand_in():
+    """True when SERPAPI_BASE_URL points at a server other than the real SerpAPI."""
+    return serpapi_base_url() != DEFAULT_SERPAPI_BASE_URL
+
+
+def data_path(path):
+    """
+    Where a data file lives: path itself, or its copy under SERPAPI_SCRATCH_DIR
+    while a stand-in server is in use.
+    """
+    if not using_stand_in():
+        return path
+    os.makedirs(SERPAPI_SCRATCH_DIR, exist_ok=True)
+    return os.path.join(SERPAPI_SCRATCH_DIR, path)
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENCY)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def serpapi_get(params, timeout=30):
+    """
+    Run one SerpAPI request and return the decoded JSON.
+
+    Args:
+        params (dict): Query parameters, including engine and api_key
+        timeout (float): Seconds to wait for the response
+
+    Returns:
+        dict: Parsed response body
+
+    Raises:
+        requests.exceptions.RequestException: On network or HTTP errors
+    """
+    response = get_session().get(f"{serpapi_base_url()}/search", params=params, timeout=timeout)
+    response.raise_for_status()
+    results = response.json()
+    record_dir = os.getenv("SERPAPI_RECORD_DIR")
+    if record_dir:
+        record_response(record_dir, params, results)
+    return results
+
+
+def fixture_path(directory, params):
+    """Path of the replay fixture for a request: <directory>/<engine>/<cache key>.json."""
+    return os.path.join(directory, str(params.get("engine", "unknown")), f"{ResponseCache.key(params, base_url=False)}.json")
+
+
+def record_response(directory, params, response):
+    """Save a response as a replay fixture (the API key is not stored)."""
+    path = fixture_path(directory, params)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"params": normalize_params(params), "response": response}, f, ensure_ascii=False, indent=2)
+
+
+def normalize_params(params):
+    """Return request parameters as a canonical, key-free list of (name, value) pairs."""
+    normalized = []
+    for name, value in params.items():
+        if name in _IGNORED_PARAMS or value is None or value == "":
+            continue
+        value = " ".join(str(value).split())
+        if name in ("q", "location"):
+            value = value.lower()
+        normalized.append((name, value))
+    return sorted(normalized)
+
+
+class ResponseCache:
+    """
+    On-disk TTL cache of SerpAPI responses with LRU eviction.
+
+    Each response is stored as <directory>/<sha256 of normalized params>.json.
+    A file's mtime records when it was last used; when the cache grows past
+    max_bytes the least recently used files are deleted.
+
+    Args:
+        directory (str): Cache folder
+        ttls (dict, optional): engine -> seconds a response stays fresh
+        max_bytes (int): Size budget for all cached responses
+    """
+
+    def __init__(self, directory=SERPAPI_CACHE_DIR, ttls=None, max_bytes=SERPAPI_CACHE_MAX_BYTES):
+        self.directory = directory
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = None  # key -> [last_used, size]
+
+    def ttl(self, engine):
+        """Seconds a response from this engine stays fresh."""
+        override = os.getenv(f"SERPAPI_CACHE_TTL_{str(engine).upper()}")
+        if override is not None:
+            return int(override)
+        return self.ttls.get(engine, DEFAULT_CACHE_TTL)
+
+    @staticmethod
+    def key(params, base_url=True):
+        normalized = normalize_params(params)
+        # Keep responses from a stand-in server apart from real ones
+        if base_url and using_stand_in():
+            normalized.append(("base_url", serpapi_base_url()))
+        canonical = json.dumps(normalized, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def _scan(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                st = os.stat(os.path.join(self.directory, name))
+                self._entries[name[:-5]] = [st.st_mtime, st.st_size]
+
+    def get(self, params):
+        """
+        Return the cached response for these parameters, or None if missing or expired.
+        """
+        ttl = self.ttl(params.get("engine"))
+        if ttl <= 0:
+            return None
+        key = self.key(params)
+        path = self._path(key)
+        with self._lock:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return None
+            if time.time() - entry.get("stored_at", 0) > ttl:
+                return None
+            # Mark as recently used
+            now = time.time()
+            os.utime(path, (now, now))
+            self._scan()
+            if key in self._entries:
+                self._entries[key][0] = now
+            return entry["response"]
+
+    def put(self, params, response):
+        """Store a response and evict least recently used entries past the size budget."""
+        if self.ttl(params.get("engine")) <= 0:
+            return
+        key = self.key(params)
+        path = self._path(key)
+        entry = {
+            "engine": params.get("engine"),
+            "params": normalize_params(params),
+            "stored_at": time.time(),
+            "response": response,
+        }
+        with self._lock:
+            self._scan()
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._entries[key] = [time.time(), os.path.getsize(path)]
+            self._evict()
+
+    def _evict(self):
+        total = sum(size for _, size in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, (_, size) in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            del self._entries[key]
+            total -= size
+
+    def clear(self):
+        """Delete every cached response."""
+        with self._lock:
+            self._scan()
+            for key in list(self._entries):
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._entries = {}
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,217 @@
+"""
+SerpAPI usage ledger.
+
+serpapi_usage.json used to keep every search ever made, and every quota
+check counted this month's entries by scanning the whole list. The ledger
+keeps a per-month counter next to the raw log:
+
+    {
+      "monthly_limit": 200,
+      "monthly_counts": {"2025-11": 1, "2025-12": 3},
+      "searches": [ ...this month's searches only... ]
+    }
+
+Quota checks read monthly_counts (O(1)). When a new month starts, the
+previous months' raw entries are moved to <archive_dir>/<YYYY-MM>.json so
+the hot file that the daily workflow commits stays small. Older files
+without monthly_counts are migrated on first load.
+
+Every update is applied under a lock and written with an atomic rename, so
+a crash never leaves a half-written usage file.
+
+query_stats keeps, per job query and location, how many paid searches it
+has used and how many new opportunities they brought in; search_planner
+uses it to spend the quota on the queries that pay off.
+
+Concurrent callers reserve() quota before sending a request and settle the
+reservation with record() or release(), so searches running in parallel
+can never spend more than the limit between them.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from tracker_store import document_cache, _write_json_atomic
+
+DEFAULT_MONTHLY_LIMIT = 200
+
+
+class QuotaExceeded(Exception):
+    """Raised when a search would take the month past its usage limit."""
+
+    def __init__(self, used, limit):
+        super().__init__(f"Usage limit reached ({used}/{limit})")
+        self.used = used
+        self.limit = limit
+
+
+def month_key(when=None):
+    """Return the YYYY-MM key for a datetime (default: now)."""
+    return (when or datetime.now()).strftime("%Y-%m")
+
+
+def query_key(query, location=""):
+    """Normalized "query|location" key of query_stats."""
+    return "|".join(" ".join(str(part or "").lower().split()) for part in (query, location))
+
+
+class UsageLedger:
+    """
+    Per-month SerpAPI search counters with a small hot log and monthly archives.
+
+    Args:
+        path (str): Usage file, e.g. serpapi_usage.json
+        archive_dir (str): Folder for <YYYY-MM>.json archives of past months
+    """
+
+    def __init__(self, path, archive_dir):
+        self.path = path
+        self.archive_dir = archive_dir
+        self._lock = threading.RLock()
+        self._reserved = 0  # in-flight searches that were granted quota
+
+    def _read(self):
+        if not os.path.exists(self.path):
+            initial_data = {"monthly_limit": DEFAULT_MONTHLY_LIMIT, "monthly_counts": {}, "query_stats": {}, "searches": []}
+            _write_json_atomic(self.path, initial_data)
+            return initial_data
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except json.JSONDecodeError:
+            print(f"[WARNING] Corrupted {self.path}, resetting.")
+            return {"monthly_limit": DEFAULT_MONTHLY_LIMIT, "monthly_counts": {}, "query_stats": {}, "searches": []}
+
+    def _save(self, data):
+        document_cache.store(self.path, data, _write_json_atomic)
+
+    def _archive(self, month, searches):
+        os.makedirs(self.archive_dir, exist_ok=True)
+        archive_path = os.path.join(self.archive_dir, f"{month}.json")
+        archived = {"month": month, "searches": []}
+        if os.path.exists(archive_path):
+            with open(archive_path, "r", encoding="utf-8") as f:
+                archived = json.load(f)
+        known = {(s.get("date"), s.get("query")) for s in archived["searches"]}
+        archived["searches"].extend(s for s in searches if (s.get("date"), s.get("query")) not in known)
+        _write_json_atomic(archive_path, archived)
+
+    def _maintain(self, data):
+        """Migrate old files and move past months out of the hot log. Returns True if data changed."""
+        changed = False
+        if "monthly_counts" not in data:
+            counts = {}
+            for s in data.get("searches", []):
+                counts[s["date"][:7]] = counts.get(s["date"][:7], 0) + 1
+            data["monthly_counts"] = counts
+            changed = True
+        if "query_stats" not in data:
+            data["query_stats"] = {}
+            changed = True
+
+        current = month_key()
+        searches = data.setdefault("searches", [])
+        # Entries are appended chronologically, so checking the first one is enough
+        if searches and searches[0]["date"][:7] != current:
+            by_month = {}
+            for s in searches:
+                by_month.setdefault(s["date"][:7], []).append(s)
+            for month, entries in sorted(by_month.items()):
+                if month != current:
+                    self._archive(month, entries)
+            data["searches"] = by_month.get(current, [])
+            changed = True
+        return changed
+
+    def load(self):
+        """Return the usage document (cached until the file changes on disk)."""
+        with self._lock:
+            data = document_cache.load(self.path, self._read)
+            if self._maintain(data):
+                self._save(data)
+            return data
+
+    def save(self, data):
+        """Write the whole usage document."""
+        with self._lock:
+            self._save(data)
+
+    def count(self, month=None):
+        """Number of searches logged in a month (default: the current month)."""
+        return self.load()["monthly_counts"].get(month or month_key(), 0)
+
+    def monthly_limit(self):
+        return self.load().get("monthly_limit", DEFAULT_MONTHLY_LIMIT)
+
+    @property
+    def reserved(self):
+        """Number of searches currently holding a reservation."""
+        return self._reserved
+
+    def reserve(self, limit, count=1):
+        """
+        Claim quota for searches that are about to run.
+
+        Reserved searches count against limit until they are settled with
+        record(..., reserved=True) or release().
+
+        Args:
+            limit (int): Monthly search budget the reservation must fit in
+            count (int): Number of searches to reserve
+
+        Returns:
+            bool: True if reserved, False if it would exceed the limit
+        """
+        with self._lock:
+            if self.count() + self._reserved + count > limit:
+                return False
+            self._reserved += count
+            return True
+
+    def release(self, count=1):
+        """Give back reserved quota for searches that were not made (or failed)."""
+        with self._lock:
+            self._reserved = max(self._reserved - count, 0)
+
+    def record(self, query, results_count, reserved=False, **details):
+        """
+        Log one search and bump this month's counter in a single atomic write.
+
+        Args:
+            query (str): Search query as shown in the usage report
+            results_count (int): Number of results returned
+            reserved (bool): The search was made under a reserve() call, which this settles
+            **details: Extra fields stored on the log entry
+        """
+        with self._lock:
+            if reserved:
+                self._reserved = max(self._reserved - 1, 0)
+            data = self.load()
+            entry = {"date": datetime.now().isoformat(), "query": query, "results": results_count}
+            entry.update(details)
+            data["searches"].append(entry)
+            month = entry["date"][:7]
+            data["monthly_counts"][month] = data["monthly_counts"].get(month, 0) + 1
+            self._save(data)
+            return entry
+
+    def record_yield(self, query, location, searches, new_jobs):
+        """
+        Add the outcome of a job search to its query_stats.
+
+        Args:
+            query (str): Search query
+            location (str): Search location
+            searches (int): Paid searches (pages) the query used
+            new_jobs (int): New opportunities those searches saved
+        """
+        with self._lock:
+            data = self.load()
+            stats = data["query_stats"].setdefault(query_key(query, location), {"searches": 0, "new_jobs": 0})
+            stats["searches"] += searches
+            stats["new_jobs"] += new_jobs
+            stats["last_run"] = datetime.now().isoformat()
+            self._save(data)
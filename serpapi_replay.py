@@ -0,0 +1,250 @@
+"""
+Record/replay stand-in for SerpAPI, for exercising the search pipeline offline.
+
+Recording: run anything that searches (run_job_search.py, the agent, or the
+`record` command below) with SERPAPI_RECORD_DIR=serpapi_fixtures and every
+live google_jobs / google_scholar response is saved as a fixture, keyed the
+same way as the response cache.
+
+Replaying: start the stand-in server and point the client at it:
+
+    python serpapi_replay.py serve --latency 0.8 --jitter 0.4 --error-rate 0.1
+    SERPAPI_BASE_URL=http://127.0.0.1:8765 SERPAPI_KEY=offline python run_job_search.py
+
+Requests with a recorded fixture get the recorded response. Other requests
+get a 404 error, or a generated response with --synthesize (deterministic
+per request, with overlapping postings across queries and pages so dedup
+has work to do). Latency and error injection apply to every request.
+
+While SERPAPI_BASE_URL points at the stand-in, the usage ledger, trackers
+and search state are kept in serpapi_scratch/ (SERPAPI_SCRATCH_DIR) instead
+of the real files; delete that folder to start over.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from serpapi_client import fixture_path, normalize_params
+
+DEFAULT_FIXTURES_DIR = "serpapi_fixtures"
+DEFAULT_PORT = 8765
+
+# Shape of --synthesize responses
+SYNTHETIC_PAGES = 5
+SYNTHETIC_COMPANIES = [
+    "NOAA", "USGS", "Mote Marine Laboratory", "Florida Fish and Wildlife", "Woods Hole",
+    "Scripps Institution", "Monterey Bay Aquarium", "EPA", "The Nature Conservancy", "Ocean Conservancy",
+]
+SYNTHETIC_LEVELS = ["", "I", "II", "Senior", "Lead"]
+
+
+def _rng(params):
+    seed = hashlib.sha256(json.dumps(normalize_params(params)).encode("utf-8")).digest()
+    return random.Random(seed)
+
+
+def synthesize_response(params):
+    """Generate a plausible, deterministic response for a request with no fixture."""
+    engine = params.get("engine")
+    page = int(params.get("next_page_token") or 0)
+    rng = _rng(params)
+    query = params.get("q", "")
+
+    if engine == "google_scholar":
+        return {"organic_results": [
+            {
+                "title": f"{query.title()}: study {rng.randint(1, 999)}",
+                "link": f"https://example.org/paper/{rng.getrandbits(32):08x}",
+                "snippet": f"We examine {query} across {rng.randint(2, 40)} sites.",
+                "publication_info": {"summary": f"A Author - Journal - {rng.randint(1995, 2025)}"},
+                "inline_links": {"cited_by": {"total": rng.randint(0, 500)}},
+            }
+            for _ in range(int(params.get("num", 10)))
+        ]}
+
+    jobs = []
+    for i in range(int(params.get("num", 10))):
+        # Draw from a small pool so postings repeat across pages and queries
+        company = rng.choice(SYNTHETIC_COMPANIES)
+        level = rng.choice(SYNTHETIC_LEVELS)
+        title = " ".join(part for part in (query.replace(" Remote", ""), level) if part)
+        jobs.append({
+            "title": title,
+            "company_name": company,
+            "location": params.get("location") or "Anywhere",
+            "share_link": f"https://example.org/jobs/{rng.getrandbits(32):08x}",
+            "description": f"{company} is hiring a {title}. " * rng.randint(2, 6),
+            "via": rng.choice(["LinkedIn", "Indeed", "USAJobs", "ZipRecruiter"]),
+            "detected_extensions": {"posted_at": f"{rng.randint(1, 7)} days ago"},
+        })
+    response = {"jobs_results": jobs}
+    if page + 1 < SYNTHETIC_PAGES:
+        response["serpapi_pagination"] = {"next_page_token": str(page + 1)}
+    return response
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    """Serves GET /search from the fixtures of the server it belongs to."""
+
+    def _send_json(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        server = self.server
+        url = urlsplit(self.path)
+        if url.path != "/search":
+            return self._send_json(404, {"error": f"Unknown path {url.path}"})
+        params = dict(parse_qsl(url.query))
+
+        with server.lock:
+            server.stats["requests"] += 1
+            delay = server.latency + server.rng.uniform(0, server.jitter)
+            fail = server.rng.random() < server.error_rate
+        time.sleep(delay)
+
+        if fail:
+            with server.lock:
+                server.stats["errors"] += 1
+            status = server.rng.choice([429, 500, 503])
+            return self._send_json(status, {"error": f"Injected error {status}"})
+
+        path = fixture_path(server.fixtures_dir, params)
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                response = json.load(f)["response"]
+            with server.lock:
+                server.stats["replayed"] += 1
+        elif server.synthesize:
+            response = synthesize_response(params)
+            with server.lock:
+                server.stats["synthesized"] += 1
+        else:
+            with server.lock:
+                server.stats["missing"] += 1
+            return self._send_json(404, {"error": "No fixture recorded for this request"})
+        self._send_json(200, response)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(fixtures_dir=DEFAULT_FIXTURES_DIR, host="127.0.0.1", port=DEFAULT_PORT,
+                latency=0.0, jitter=0.0, error_rate=0.0, synthesize=False, seed=None, quiet=False):
+    """
+    Create (but don't start) a threaded replay server.
+
+    Args:
+        fixtures_dir (str): Folder written by the recorder
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free one)
+        latency (float): Seconds added to every response
+        jitter (float): Extra random delay of up to this many seconds
+        error_rate (float): Fraction of requests answered with a 429/500/503
+        synthesize (bool): Generate responses for requests without a fixture
+        seed (int, optional): Seed for latency jitter and error injection
+        quiet (bool): Don't log each request
+
+    Returns:
+        ThreadingHTTPServer: Call serve_forever() (or run it in a thread)
+    """
+    server = ThreadingHTTPServer((host, port), ReplayHandler)
+    server.fixtures_dir = fixtures_dir
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.synthesize = synthesize
+    server.quiet = quiet
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.stats = {"requests": 0, "replayed": 0, "synthesized": 0, "missing": 0, "errors": 0}
+    return server
+
+
+def record(fixtures_dir, engine, queries, location="", date_posted="week", pages=1):
+    """
+    Run live SerpAPI searches and save their responses as fixtures.
+
+    Searches go through tools_2 (bypassing the response cache), so they are
+    logged to serpapi_usage.json like any other paid search.
+
+    Returns:
+        int: Number of queries that failed
+    """
+    os.environ["SERPAPI_RECORD_DIR"] = fixtures_dir
+    # Imported late: tools_2 sets up the agent's tools on import
+    from tools_2 import search_google_scholar_serpapi, search_jobs_serpapi
+
+    failures = 0
+    for query in queries:
+        if engine == "google_scholar":
+            results = search_google_scholar_serpapi(query, force_refresh=True)
+        else:
+            results = search_jobs_serpapi(query, location, date_posted, max_pages=pages, force_refresh=True)
+        if isinstance(results, dict) and "error" in results:
+            print(f"❌ {query}: {results['error']}")
+            failures += 1
+        else:
+            print(f"✅ {query}: {len(results)} results")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record and replay SerpAPI responses")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the local stand-in server")
+    serve.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    serve.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, up to this many seconds")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests that fail")
+    serve.add_argument("--synthesize", action="store_true", help="Generate responses without a fixture")
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--quiet", action="store_true")
+
+    rec = commands.add_parser("record", help="Record live responses as fixtures (uses quota)")
+    rec.add_argument("queries", nargs="+")
+    rec.add_argument("--engine", default="google_jobs", choices=["google_jobs", "google_scholar"])
+    rec.add_argument("--location", default="")
+    rec.add_argument("--date-posted", default="week", choices=["today", "3days", "week", "month"])
+    rec.add_argument("--pages", type=int, default=1)
+    rec.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        failures = record(args.fixtures, args.engine, args.queries, args.location, args.date_posted, args.pages)
+        print(f"Fixtures saved to {args.fixtures}/")
+        return 1 if failures else 0
+
+    server = make_server(args.fixtures, args.host, args.port, args.latency, args.jitter,
+                         args.error_rate, args.synthesize, args.seed, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"🛰️  SerpAPI stand-in on http://{host}:{port} (fixtures: {args.fixtures}/)")
+    print(f"   export SERPAPI_BASE_URL=http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
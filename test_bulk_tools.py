@@ -0,0 +1,61 @@
+import pytest
+
+tools_2 = pytest.importorskip("tools_2")
+
+import tracker_store
+from tracker_store import JsonTrackerStore, default_specs
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    tracker_store.document_cache.invalidate()
+    store = JsonTrackerStore(default_specs(
+        applications_file=str(tmp_path / "job_applications.json"),
+        cold_emails_file=str(tmp_path / "cold_emails.json"),
+        opportunities_file=str(tmp_path / "job_opportunities.json"),
+    ))
+    monkeypatch.setattr(tools_2, "_tracker_store", store)
+    tools_2.add_cold_emails_bulk([
+        {"recipient_name": "Dr. Smith", "recipient_email": "smith@mit.edu"},
+        {"recipient_name": "Dr. Lee", "recipient_email": "lee@ucsd.edu"},
+    ])
+    return store
+
+
+def _statuses(store):
+    return {e["recipient_email"]: (e["status"], len(e["follow_up_dates"])) for e in store.load("emails")["emails"]}
+
+
+def test_bulk_update_reports_bad_items_and_writes_the_rest_once(store, monkeypatch):
+    writes = []
+    original = store._write
+    monkeypatch.setattr(store, "_write", lambda tracker, data: writes.append(tracker) or original(tracker, data))
+
+    result = tools_2.update_cold_emails_bulk([
+        {"recipient_email": "smith@mit.edu", "follow_up_sent": True},
+        {"recipient_email": "lee@ucsd.edu", "status": "bogus"},
+        {"recipient_email": "smith@mit.edu", "status": "responded"},
+    ])
+    assert "Updated 2/3" in result
+    assert writes == ["emails"]
+    assert _statuses(store) == {"smith@mit.edu": ("responded", 1), "lee@ucsd.edu": ("sent", 0)}
+
+
+@pytest.mark.parametrize("call", [
+    lambda: tools_2.update_cold_emails_bulk([{"recipient_email": "smith@mit.edu", "follow_up_sent": True}]),
+    lambda: tools_2.add_cold_emails_bulk([{"recipient_name": "Dr. Smith", "recipient_email": "smith@mit.edu",
+                                            "notes": "Met at the conference"}]),
+    lambda: tools_2.update_cold_email(recipient_email="smith@mit.edu", status="responded"),
+])
+def test_failed_write_leaves_no_phantom_update(store, monkeypatch, call):
+    before = _statuses(store)
+    notes = [e["notes"] for e in store.load("emails")["emails"]]
+
+    def broken_write(tracker, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "_write", broken_write)
+    with pytest.raises(OSError):
+        call()
+    assert _statuses(store) == before
+    assert [e["notes"] for e in store.load("emails")["emails"]] == notes
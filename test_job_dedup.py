@@ -0,0 +1,147 @@
+import os
+
+import pytest
+
+import job_dedup
+from job_dedup import JobKeyIndex, MinHashIndex
+from tracker_store import JsonTrackerStore, default_specs
+
+
+def _job(n, title="Marine Scientist", company="NOAA"):
+    return {
+        "id": f"job{n}",
+        "title": f"{title} {n}",
+        "company": company,
+        "location": "Miami, FL",
+        "description": f"Field surveys of coral reef habitat number {n} with boat work and data analysis.",
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    specs = default_specs(opportunities_file=str(tmp_path / "job_opportunities.json"))
+    return JsonTrackerStore(specs)
+
+
+def _make(index_cls, store):
+    return index_cls(
+        store.spec("opportunities").path,
+        lambda: store.load("opportunities")["opportunities"],
+        lambda: store.revision("opportunities"),
+    )
+
+
+def _count_payloads(monkeypatch, index_cls):
+    calls = []
+    original = index_cls._payload
+    monkeypatch.setattr(index_cls, "_payload", lambda self, record: calls.append(record["id"]) or original(self, record))
+    return calls
+
+
+def _lookup(index, job):
+    """Id of the stored opportunity the index matches job to, or None."""
+    if isinstance(index, JobKeyIndex):
+        return job["id"] if index.contains(job) else None
+    near = index.find_near_duplicate(job)
+    return near[0] if near else None
+
+
+def _lines(index):
+    with open(index.path, "r", encoding="utf-8") as f:
+        return [line.split("\t", 1)[0] for line in f]
+
+
+@pytest.mark.parametrize("index_cls", [JobKeyIndex, MinHashIndex])
+def test_ingests_do_not_rebuild_or_duplicate(store, monkeypatch, index_cls):
+    index = _make(index_cls, store)
+    assert _lookup(index, _job(0)) is None
+    calls = _count_payloads(monkeypatch, index_cls)
+
+    # Same order as tools_2._ingest_jobs: tracker write, then the index
+    for batch in ([_job(1), _job(2), _job(3)], [_job(4), _job(5), _job(6)], [_job(7), _job(8), _job(9)]):
+        store.insert_many("opportunities", batch)
+        index.add(batch)
+        assert _lookup(index, batch[0]) == batch[0]["id"]
+
+    assert calls == [f"job{n}" for n in range(1, 10)]
+    assert _lines(index) == [f"job{n}" for n in range(1, 10)]
+
+
+@pytest.mark.parametrize("index_cls", [JobKeyIndex, MinHashIndex])
+def test_delete_drops_only_that_job(store, monkeypatch, index_cls):
+    jobs = [_job(n) for n in range(1, 6)]
+    store.insert_many("opportunities", jobs)
+    index = _make(index_cls, store)
+    assert _lookup(index, jobs[0]) == "job1"
+    calls = _count_payloads(monkeypatch, index_cls)
+
+    store.delete("opportunities", "job3")
+    index.remove("job3")
+
+    assert calls == []
+    assert _lines(index) == ["job1", "job2", "job4", "job5"]
+    assert _lookup(index, jobs[2]) != "job3"
+    assert _lookup(index, jobs[3]) == "job4"
+
+
+def test_side_file_is_reused_by_a_new_process(store, monkeypatch):
+    jobs = [_job(n) for n in range(1, 4)]
+    store.insert_many("opportunities", jobs)
+    _make(MinHashIndex, store).add(jobs)
+
+    calls = _count_payloads(monkeypatch, MinHashIndex)
+    fresh = _make(MinHashIndex, store)
+    assert _lookup(fresh, jobs[0]) == "job1"
+    assert calls == []
+
+
+def test_index_picks_up_other_writers(store):
+    store.insert_many("opportunities", [_job(1)])
+    index = _make(JobKeyIndex, store)
+    assert index.contains(_job(1))
+
+    other = JsonTrackerStore(store.specs)
+    os.utime(store.spec("opportunities").path, ns=(1, 1))  # make sure the stat signature moves
+    other.insert_many("opportunities", [_job(2)])
+    assert index.contains(_job(2))
+
+
+def test_near_duplicate_threshold():
+    original = _job(1, title="Marine Scientist II")
+    relisted = dict(original, id="x", title="Marine Scientist 2", description=original["description"] + " Apply on Indeed.")
+    other_role = dict(original, id="y", title="Data Engineer", description="Build ETL pipelines for a fintech platform in Python.")
+
+    similar = job_dedup.signature_similarity(job_dedup.minhash_signature(original), job_dedup.minhash_signature(relisted))
+    different = job_dedup.signature_similarity(job_dedup.minhash_signature(original), job_dedup.minhash_signature(other_role))
+    assert similar >= job_dedup.NEAR_DUPLICATE_THRESHOLD
+    assert different < job_dedup.NEAR_DUPLICATE_THRESHOLD
+
+
+def test_near_duplicate_needs_title_overlap(store):
+    original = _job(1, title="Marine Scientist")
+    store.insert_many("opportunities", [original])
+    index = _make(MinHashIndex, store)
+
+    relisted = dict(original, title="Marine Scientist 1")
+    assert index.find_near_duplicate(relisted)[0] == "job1"
+    # Same boilerplate description, different role
+    assert index.find_near_duplicate(dict(original, title="Lab Manager")) is None
+
+
+def test_minhash_add_remove_round_trip(store):
+    job = _job(1)
+    store.insert_many("opportunities", [job])
+    index = _make(MinHashIndex, store)
+    index.add([job])
+    assert index.find_near_duplicate(job) == ("job1", 1.0)
+
+    store.delete("opportunities", "job1")
+    index.remove("job1")
+    assert index.find_near_duplicate(job) is None
+    assert index._signatures == {} and index._titles == {}
+    assert all(not bucket for bucket in index._buckets)
+
+    store.insert_many("opportunities", [job])
+    index.add([job])
+    assert index.find_near_duplicate(job) == ("job1", 1.0)
+    assert _lines(index) == ["job1"]
@@ -0,0 +1,54 @@
+import pytest
+
+tools_2 = pytest.importorskip("tools_2")
+
+
+def _records(n):
+    return [{"id": f"r{i:03d}", "date": f"2025-01-{i % 28 + 1:02d}"} for i in range(n)]
+
+
+def _pages(records, limit):
+    sort_key = lambda r: r["date"]
+    cursor, seen = None, []
+    while True:
+        page, total, offset, cursor = tools_2._paginate(records, "date", sort_key, limit, cursor)
+        assert total == len(records)
+        assert offset == len(seen)
+        seen.extend(page)
+        if cursor is None:
+            return seen
+
+
+def test_cursor_walks_every_record_once_in_order():
+    records = _records(45)
+    seen = _pages(records, 10)
+    assert [r["id"] for r in seen] == [r["id"] for r in sorted(records, key=lambda r: (r["date"], r["id"]), reverse=True)]
+
+
+def test_cursor_is_stable_when_records_are_added():
+    records = _records(30)
+    first, _, _, cursor = tools_2._paginate(records, "date", lambda r: r["date"], 10, None)
+    # A newer record arrives between calls; it sorts first, so it must not shift page two
+    records.append({"id": "new", "date": "2025-12-31"})
+    second, _, offset, _ = tools_2._paginate(records, "date", lambda r: r["date"], 10, cursor)
+    assert offset == 10
+    assert not {r["id"] for r in first} & {r["id"] for r in second}
+    assert "new" not in {r["id"] for r in second}
+
+
+def test_limit_is_clamped():
+    records = _records(120)
+    page, _, _, cursor = tools_2._paginate(records, "date", lambda r: r["date"], 1000, None)
+    assert len(page) == tools_2.MAX_PAGE_SIZE
+    assert cursor is not None
+    page, _, _, _ = tools_2._paginate(records, "date", lambda r: r["date"], 0, None)
+    assert len(page) == tools_2.DEFAULT_PAGE_SIZE
+
+
+def test_bad_cursors_are_rejected():
+    records = _records(5)
+    _, _, _, cursor = tools_2._paginate(records, "date", lambda r: r["date"], 2, None)
+    with pytest.raises(ValueError):
+        tools_2._paginate(records, "company", lambda r: r["date"], 2, cursor)
+    with pytest.raises(ValueError):
+        tools_2._paginate(records, "date", lambda r: r["date"], 2, "not-a-cursor")
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("langchain_core")
+
+from benchmark_retrieval import InMemoryStore
+from hashing_embeddings import HashingEmbeddings
+from paper_search import HybridPaperRetriever
+
+TEXTS = [
+    "Coral bleaching thresholds on Florida reefs",
+    "Thermal tolerance of Acropora under heat stress",
+    "Seagrass carbon storage in Florida Bay",
+    "Kelp forest recovery after urchin removal",
+    "Coral disease spread across the Caribbean",
+]
+
+
+@pytest.fixture
+def retriever(tmp_path):
+    store = InMemoryStore(HashingEmbeddings())
+    store.add_texts(TEXTS, metadatas=[{"source": f"p{i}.pdf"} for i in range(len(TEXTS))],
+                    ids=[f"c{i}" for i in range(len(TEXTS))])
+    return HybridPaperRetriever(store, str(tmp_path))
+
+
+@pytest.mark.parametrize("k, fetch_k", [(0, 10), (-1, 10), (1.5, 10), (True, 10), (2, 0), (2, "10")])
+def test_bad_k_and_fetch_k_raise(retriever, k, fetch_k):
+    with pytest.raises(ValueError):
+        retriever.search("coral", k=k, fetch_k=fetch_k)
+
+
+def test_returns_k_results_best_first(retriever):
+    results = retriever.search("coral bleaching", k=2, fetch_k=10)
+    assert len(results) == 2
+    assert results[0].page_content == TEXTS[0]
+    assert len(retriever.search("coral", k=len(TEXTS), fetch_k=10)) == len(TEXTS)
+
+
+def test_small_fetch_k_shares_the_cache_entry(retriever):
+    retriever.search("coral", k=3, fetch_k=1)
+    retriever.search("Coral ", k=3, fetch_k=3)
+    assert (retriever.misses, retriever.hits) == (1, 1)
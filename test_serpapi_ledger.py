@@ -0,0 +1,51 @@
+import threading
+
+import pytest
+
+from serpapi_ledger import UsageLedger, month_key
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return UsageLedger(str(tmp_path / "serpapi_usage.json"), str(tmp_path / "archive"))
+
+
+def test_reservations_count_against_the_limit(ledger):
+    assert ledger.reserve(3, count=2)
+    assert not ledger.reserve(3, count=2)
+    assert ledger.reserve(3)
+    assert ledger.reserved == 3
+    assert not ledger.reserve(3)
+
+
+def test_record_settles_and_release_returns_quota(ledger):
+    assert ledger.reserve(2, count=2)
+    ledger.record("marine biologist", 10, reserved=True)
+    assert ledger.reserved == 1
+    assert ledger.count() == 1
+
+    ledger.release()
+    assert ledger.reserved == 0
+    ledger.release()
+    assert ledger.reserved == 0
+    assert ledger.reserve(2)
+    assert not ledger.reserve(2)
+
+
+def test_parallel_reservations_never_exceed_the_limit(ledger):
+    granted = []
+
+    def search():
+        if ledger.reserve(5):
+            ledger.record("q", 1, reserved=True)
+            granted.append(1)
+
+    threads = [threading.Thread(target=search) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(granted) == 5
+    assert ledger.count() == 5
+    assert ledger.load()["monthly_counts"] == {month_key(): 5}
+    assert ledger.reserved == 0
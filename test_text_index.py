@@ -0,0 +1,45 @@
+from text_index import InvertedIndex, tokenize
+
+
+def _index():
+    index = InvertedIndex()
+    index.add("a", "Marine scientist for coral reef monitoring")
+    index.add("b", "Data scientist, machine learning and statistics")
+    index.add("c", "Coral coral coral restoration technician")
+    return index
+
+
+def test_tokenize_drops_stopwords_and_punctuation():
+    assert tokenize("The Coral-Reef of Florida, and you!") == ["coral", "reef", "florida"]
+
+
+def test_search_ranks_by_bm25():
+    results = _index().search("coral")
+    assert [doc_id for doc_id, _ in results] == ["c", "a"]
+    assert results[0][1] > results[1][1] > 0
+
+
+def test_rare_terms_outweigh_common_ones():
+    # "scientist" is in two documents, "reef" only in one
+    assert _index().search("scientist reef")[0][0] == "a"
+
+
+def test_limit_and_unknown_terms():
+    index = _index()
+    assert len(index.search("coral scientist", limit=1)) == 1
+    assert index.search("kelp") == []
+    assert InvertedIndex().search("coral") == []
+
+
+def test_add_replaces_and_remove_forgets():
+    index = _index()
+    index.add("a", "Fisheries observer")
+    assert [doc_id for doc_id, _ in index.search("coral")] == ["c"]
+    assert index.search("fisheries")[0][0] == "a"
+
+    index.remove("c")
+    index.remove("missing")
+    assert index.search("coral") == []
+    assert "coral" not in index.postings
+    assert len(index) == 2
+    assert index.total_length == sum(index.doc_lengths.values())
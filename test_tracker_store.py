@@ -0,0 +1,75 @@
+import json
+import os
+
+import pytest
+
+import tracker_store
+from tracker_store import (JournaledJsonTrackerStore, JsonTrackerStore, SqliteTrackerStore, create_tracker_store,
+                           default_specs, journal_path)
+
+
+@pytest.fixture
+def specs(tmp_path):
+    tracker_store.document_cache.invalidate()
+    return default_specs(
+        applications_file=str(tmp_path / "job_applications.json"),
+        cold_emails_file=str(tmp_path / "cold_emails.json"),
+        opportunities_file=str(tmp_path / "job_opportunities.json"),
+    )
+
+
+def test_journal_left_by_an_earlier_run_is_folded_in(specs, monkeypatch):
+    journaled = JournaledJsonTrackerStore(specs, journaled=["emails"])
+    journaled.insert("emails", {"id": "e1", "status": "sent"})
+    journaled.update("emails", {"id": "e1", "status": "responded"})
+    with open(specs["emails"].path, "r", encoding="utf-8") as f:
+        assert json.load(f)["emails"] == []  # the snapshot lags behind the log
+
+    monkeypatch.setattr(tracker_store, "TRACKER_JOURNAL", [])
+    tracker_store.document_cache.invalidate()
+    store = create_tracker_store(specs, backend="json")
+    assert store.load("emails")["emails"] == [{"id": "e1", "status": "responded"}]
+    assert os.path.getsize(journal_path(specs["emails"])) == 0
+
+
+def test_sqlite_imports_json_only_once(specs, tmp_path):
+    with open(specs["applications"].path, "w", encoding="utf-8") as f:
+        json.dump({"applications": [{"id": "a1", "company": "NOAA"}]}, f)
+    db_file = str(tmp_path / "trackers.db")
+
+    store = SqliteTrackerStore(specs, db_file)
+    assert [r["id"] for r in store.load("applications")["applications"]] == ["a1"]
+    assert store.delete("applications", "a1")
+
+    # The JSON file still has the deleted record; reopening must not bring it back
+    reopened = SqliteTrackerStore(specs, db_file)
+    assert reopened.load("applications")["applications"] == []
+
+
+def test_sqlite_exports_changed_trackers(specs, tmp_path):
+    store = SqliteTrackerStore(specs, str(tmp_path / "trackers.db"))
+    store.export_changed()
+    assert not os.path.exists(specs["emails"].path)
+
+    store.insert("emails", {"id": "e1", "status": "sent"})
+    store.export_changed()
+    with open(specs["emails"].path, "r", encoding="utf-8") as f:
+        assert json.load(f)["emails"] == [{"id": "e1", "status": "sent"}]
+    assert not os.path.exists(specs["applications"].path)
+
+
+def test_failed_json_write_leaves_the_cached_document_alone(specs, monkeypatch):
+    store = JsonTrackerStore(specs)
+    store.insert("emails", {"id": "e1", "status": "sent"})
+
+    def broken_write(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(tracker_store, "_write_json", broken_write)
+    for change in (lambda: store.insert("emails", {"id": "e2"}),
+                   lambda: store.upsert_many("emails", [{"id": "e1", "status": "responded"}]),
+                   lambda: store.update("emails", {"id": "e1", "status": "responded"}),
+                   lambda: store.delete("emails", "e1")):
+        with pytest.raises(OSError):
+            change()
+        assert store.load("emails")["emails"] == [{"id": "e1", "status": "sent"}]
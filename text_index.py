@@ -0,0 +1,159 @@
+"""
+Keyword search for the trackers: an incremental inverted index with BM25 ranking.
+
+InvertedIndex is a plain in-memory index of doc_id -> text. TrackerTextIndex
+keeps one in sync with a tracker in tracker_store: it is built on first
+search, updated record-by-record from the store's change notifications,
+and rebuilt only if the store's revision() moves without a notification
+(i.e. another process changed the data).
+"""
+
+import math
+import re
+import threading
+from collections import Counter
+
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is",
+    "it", "of", "on", "or", "that", "the", "to", "was", "will", "with", "we", "you",
+}
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens without stopwords."""
+    return [t for t in re.findall(r"[a-z0-9]+", str(text or "").lower()) if t not in _STOPWORDS]
+
+
+class InvertedIndex:
+    """
+    In-memory inverted index with Okapi BM25 scoring.
+
+    Args:
+        k1 (float): Term frequency saturation
+        b (float): Document length normalization
+    """
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}      # term -> {doc_id: term frequency}
+        self.doc_lengths = {}   # doc_id -> number of tokens
+        self.doc_terms = {}     # doc_id -> terms, for removal
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, doc_id, text):
+        """Index a document, replacing any previous version with the same id."""
+        if doc_id in self.doc_terms:
+            self.remove(doc_id)
+        counts = Counter(tokenize(text))
+        postings = self.postings
+        for term, tf in counts.items():
+            docs = postings.get(term)
+            if docs is None:
+                postings[term] = {doc_id: tf}
+            else:
+                docs[doc_id] = tf
+        length = sum(counts.values())
+        self.doc_lengths[doc_id] = length
+        self.doc_terms[doc_id] = tuple(counts)
+        self.total_length += length
+
+    def remove(self, doc_id):
+        """Remove a document if it is indexed."""
+        terms = self.doc_terms.pop(doc_id, None)
+        if terms is None:
+            return
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs is not None:
+                docs.pop(doc_id, None)
+                if not docs:
+                    del self.postings[term]
+        self.total_length -= self.doc_lengths.pop(doc_id, 0)
+
+    def search(self, query, limit=None):
+        """
+        Rank documents against a keyword query.
+
+        Args:
+            query (str): Free-text query
+            limit (int, optional): Maximum number of results
+
+        Returns:
+            list: (doc_id, score) pairs, best first
+        """
+        n_docs = len(self.doc_lengths)
+        if not n_docs:
+            return []
+        avg_length = self.total_length / n_docs or 1.0
+        scores = {}
+        for term in set(tokenize(query)):
+            docs = self.postings.get(term)
+            if not docs:
+                continue
+            idf = math.log(1 + (n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for doc_id, tf in docs.items():
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+
+class TrackerTextIndex:
+    """
+    BM25 index over selected text fields of one tracker.
+
+    Args:
+        store (TrackerStore): Store the tracker lives in
+        tracker (str): Tracker name, e.g. "opportunities"
+        fields (list): Record fields to index; the first field is weighted double
+    """
+
+    def __init__(self, store, tracker, fields):
+        self.store = store
+        self.tracker = tracker
+        self.fields = list(fields)
+        self._index = None
+        self._revision = None
+        self._lock = threading.RLock()
+        store.subscribe(self._on_change)
+
+    def _text(self, record):
+        parts = [str(record.get(self.fields[0]) or "")]
+        parts.extend(str(record.get(field) or "") for field in self.fields)
+        return " ".join(parts)
+
+    def _rebuild(self):
+        index = InvertedIndex()
+        spec = self.store.spec(self.tracker)
+        for record in self.store.load(self.tracker)[spec.records_key]:
+            index.add(record.get("id"), self._text(record))
+        self._index = index
+        self._revision = self.store.revision(self.tracker)
+
+    def _on_change(self, tracker, upserted=(), deleted=(), reset=False):
+        if tracker != self.tracker:
+            return
+        with self._lock:
+            if self._index is None:
+                return
+            if reset:
+                self._index = None
+                return
+            for record_id in deleted:
+                self._index.remove(record_id)
+            for record in upserted:
+                self._index.add(record.get("id"), self._text(record))
+            self._revision = self.store.revision(self.tracker)
+
+    def search(self, query, limit=None):
+        """
+        Return {record_id: score} for records matching the query, best first.
+        """
+        with self._lock:
+            if self._index is None or self._revision != self.store.revision(self.tracker):
+                self._rebuild()
+            return dict(self._index.search(query, limit))
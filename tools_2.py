@@ -1,14 +1,18 @@
 import asyncio
 import base64
+import copy
+import functools
+import heapq
 import json
 import os
 import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
 
 import docx
 import requests
-from PyPDF2 import PdfReader
 from chromadb import Settings
 import qrcode
 from google.adk.tools import FunctionTool, google_search
@@ -16,7 +20,19 @@ from langchain_community.vectorstores import Chroma
 from langchain_google_community import GmailToolkit
 from langchain_google_community.gmail.utils import get_google_credentials, build_gmail_service
 
+from cv_sections import DEFAULT_TOKEN_BUDGET, CVSectionIndex
+from description_store import INLINE_DESCRIPTION_CHARS, DescriptionStore, description_id
+from document_text_cache import document_text_cache
 from get_embedding_function import get_embedding_function
+from ingest_papers import PAPERS_DB_PATH
+from job_dedup import JobKeyIndex, MinHashIndex, job_key
+import pdf_extract
+from serpapi_client import SERPAPI_SCRATCH_DIR, data_path, response_cache, serpapi_base_url, serpapi_get, using_stand_in
+from serpapi_ledger import QuotaExceeded, UsageLedger, month_key
+from search_planner import plan_searches
+from search_watermarks import posted_at
+from text_index import TrackerTextIndex
+from tracker_store import TRACKER_DB_FILE, create_tracker_store, default_specs
 
 from dotenv import load_dotenv
 
@@ -25,10 +41,44 @@ load_dotenv()
 
 DOCUMENT_FOLDER = "documents"
 SCRATCHPAD_FILE = "agent_scratchpad.txt"
-JOB_APPLICATIONS_FILE = "job_applications.json"
 COVER_LETTERS_FOLDER = "cover_letters"
-JOB_OPPORTUNITIES_FILE = "job_opportunities.json"
-SERPAPI_USAGE_FILE = "serpapi_usage.json"
+
+# Against the serpapi_replay.py stand-in (SERPAPI_BASE_URL), searches are counted and
+# saved under SERPAPI_SCRATCH_DIR instead of the real ledger and trackers
+JOB_APPLICATIONS_FILE = data_path("job_applications.json")
+JOB_OPPORTUNITIES_FILE = data_path("job_opportunities.json")
+COLD_EMAILS_FILE = data_path("cold_emails.json")
+SERPAPI_USAGE_FILE = data_path("serpapi_usage.json")
+SERPAPI_USAGE_ARCHIVE_DIR = data_path("serpapi_usage_archive")
+JOB_DESCRIPTIONS_DIR = data_path("job_descriptions")
+if using_stand_in():
+    print(f"[INFO] SerpAPI stand-in at {serpapi_base_url()}: using scratch trackers and usage in {SERPAPI_SCRATCH_DIR}/")
+
+# Storage engine for the application / cold email / opportunity trackers.
+# JSON files by default; set TRACKER_BACKEND=sqlite for the indexed SQLite store.
+_tracker_store = create_tracker_store(
+    default_specs(JOB_APPLICATIONS_FILE, COLD_EMAILS_FILE, JOB_OPPORTUNITIES_FILE),
+    db_file=data_path(TRACKER_DB_FILE),
+)
+
+# Monthly SerpAPI counters; past months' raw search logs are moved to SERPAPI_USAGE_ARCHIVE_DIR
+_serpapi_ledger = UsageLedger(SERPAPI_USAGE_FILE, SERPAPI_USAGE_ARCHIVE_DIR)
+
+# Full job description texts (zlib, content-addressed); opportunities keep a 500-char excerpt
+_description_store = DescriptionStore(JOB_DESCRIPTIONS_DIR)
+
+# BM25 keyword indexes behind the `text=` filter of the query tools, kept in sync on every save
+_text_indexes = {
+    "applications": TrackerTextIndex(
+        _tracker_store, "applications", ["position", "company", "job_description", "notes", "next_action"]
+    ),
+    "emails": TrackerTextIndex(
+        _tracker_store, "emails", ["recipient_name", "institution", "subject", "purpose", "notes"]
+    ),
+    "opportunities": TrackerTextIndex(
+        _tracker_store, "opportunities", ["title", "company", "location", "description"]
+    ),
+}
 
 
 # -----------------------------
@@ -87,42 +137,191 @@ read_scratchpad_tool = FunctionTool(
 
 
 # ---------------------------------------------------------------------
-# Job Application Tracker - JSON-based storage
+# Job Application Tracker - stored via tracker_store (JSON or SQLite)
 # ---------------------------------------------------------------------
 
 def _load_job_applications():
     """
-    Load job applications from JSON file. Create file if it doesn't exist.
+    Load job applications from the tracker store. Create the file if it doesn't exist.
     
     Returns:
         dict: Job applications data structure
     """
-    if not os.path.exists(JOB_APPLICATIONS_FILE):
-        initial_data = {"applications": []}
-        with open(JOB_APPLICATIONS_FILE, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-        return initial_data
-    
-    try:
-        with open(JOB_APPLICATIONS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print("[WARNING] Corrupted job_applications.json, creating backup and initializing fresh.")
-        if os.path.exists(JOB_APPLICATIONS_FILE):
-            backup_name = f"job_applications_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            os.rename(JOB_APPLICATIONS_FILE, backup_name)
-        return {"applications": []}
+    return _tracker_store.load("applications")
 
 
 def _save_job_applications(data):
     """
-    Save job applications to JSON file.
+    Save the whole job applications document to the tracker store.
     
     Args:
         data (dict): Job applications data structure
     """
-    with open(JOB_APPLICATIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    _tracker_store.save("applications", data)
+
+
+def export_tracker_json():
+    """
+    Write every tracker back to its JSON file from the active store.
+    
+    This is a no-op for the default JSON backend. With TRACKER_BACKEND=sqlite it
+    keeps job_applications.json, cold_emails.json and job_opportunities.json
+    in sync so they can still be committed and diffed.
+    
+    Returns:
+        list: Paths of the JSON files written
+    """
+    return _tracker_store.export_json()
+
+
+# ---------------------------------------------------------------------
+# Keyset pagination for the tracker query tools
+# ---------------------------------------------------------------------
+
+DEFAULT_PAGE_SIZE = 20
+
+# Upper bound on limit, so one call can't return a whole tracker
+MAX_PAGE_SIZE = 50
+
+
+def _encode_cursor(sort_by, value, record_id, offset):
+    """Opaque cursor pointing just after (value, record_id) in sort_by order."""
+    payload = json.dumps([sort_by, value, record_id, offset], ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor):
+    try:
+        sort_by, value, record_id, offset = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return sort_by, value, record_id, int(offset)
+    except Exception:
+        raise ValueError("Invalid cursor. Use the cursor value returned by the previous call.")
+
+
+def _paginate(records, sort_by, sort_key, limit, cursor):
+    """
+    Return one page of records in descending (sort_key, id) order.
+    
+    The cursor stores the sort value and id of the last record shown, so the
+    next page starts right after it even if records were added in between.
+    Only the requested page is sorted (heapq.nlargest), not the whole list.
+    
+    Args:
+        records (list): Filtered records
+        sort_by (str): Sort field name, stored in the cursor
+        sort_key (callable): Returns the sort value of a record
+        limit (int): Page size, clamped to 1..MAX_PAGE_SIZE
+        cursor (str, optional): Cursor from the previous page
+    
+    Returns:
+        tuple: (page, total, offset, next_cursor) where total counts all matching
+               records and next_cursor is None on the last page
+    
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another sort order
+    """
+    total = len(records)
+    offset = 0
+    key = lambda r: (sort_key(r), r["id"])
+    
+    if cursor:
+        cursor_sort, value, record_id, offset = _decode_cursor(cursor)
+        if cursor_sort != sort_by:
+            raise ValueError(f"Cursor was created for sort_by='{cursor_sort}', not '{sort_by}'.")
+        after = (value, record_id)
+        records = [r for r in records if key(r) < after]
+    
+    limit = min(max(1, limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+    page = heapq.nlargest(limit, records, key=key)
+    next_cursor = None
+    if len(records) > len(page):
+        last = page[-1]
+        next_cursor = _encode_cursor(sort_by, sort_key(last), last["id"], offset + len(page))
+    return page, total, offset, next_cursor
+
+
+_JOB_APPLICATION_STATUSES = ["applied", "interview_scheduled", "interviewed", "rejected", "offer", "accepted"]
+_JOB_APPLICATION_FIELDS = (
+    "company", "position", "status", "date_applied", "application_deadline",
+    "job_description", "next_action", "notes", "contacts",
+)
+
+
+def _editable(record):
+    """
+    Copy of a stored record to apply changes to.
+    
+    The JSON stores hand out records from a shared in-memory document, so
+    changing one in place would show up in every later read even if the
+    write then failed.
+    """
+    return copy.deepcopy(record)
+
+
+# Bulk item fields that aren't strings; every other field must be a string (or null)
+_BULK_FIELD_TYPES = {"connection_strength": int, "follow_up_sent": bool}
+
+
+def _bulk_item(item, fields, required):
+    """Check one item of a bulk request and return it as keyword arguments. Raises ValueError."""
+    if not isinstance(item, dict):
+        raise ValueError(f"Expected an object, got {type(item).__name__}")
+    unknown = [f for f in item if f not in fields]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    missing = [f for f in required if not item.get(f)]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+    
+    checked = {}
+    for name, value in item.items():
+        if name == "contacts" and isinstance(value, list) and all(isinstance(c, str) for c in value):
+            # Accept a list of contacts as well as a comma-separated string
+            value = ", ".join(value)
+        expected = _BULK_FIELD_TYPES.get(name, str)
+        # bool is a subclass of int, so check it explicitly
+        if value is not None and (not isinstance(value, expected) or (expected is int and isinstance(value, bool))):
+            raise ValueError(f"Field '{name}' must be {'an' if expected is int else 'a'} {expected.__name__}, "
+                             f"got {type(value).__name__}")
+        checked[name] = value
+    return checked
+
+
+def _build_job_application(
+    company,
+    position,
+    status="applied",
+    date_applied=None,
+    application_deadline=None,
+    job_description="",
+    next_action="",
+    notes="",
+    contacts=""
+):
+    """Validate the fields of a new application and build its record. Raises ValueError."""
+    if status not in _JOB_APPLICATION_STATUSES:
+        raise ValueError(f"Invalid status '{status}'. Must be one of: {', '.join(_JOB_APPLICATION_STATUSES)}")
+    
+    if date_applied is None:
+        date_applied = date.today().isoformat()
+    
+    # Process contacts
+    contact_list = [c.strip() for c in contacts.split(",")] if contacts else []
+    
+    return {
+        "id": str(uuid.uuid4())[:8],
+        "company": company,
+        "position": position,
+        "status": status,
+        "date_applied": date_applied,
+        "application_deadline": application_deadline or "",
+        "job_description": job_description,
+        "cover_letter_generated": False,
+        "next_action": next_action,
+        "notes": notes,
+        "contacts": contact_list,
+        "last_updated": datetime.now().isoformat()
+    }
 
 
 def add_job_application(
@@ -164,40 +363,60 @@ def add_job_application(
             )
         "Job application added successfully! ID: abc-123-def"
     """
-    valid_statuses = ["applied", "interview_scheduled", "interviewed", "rejected", "offer", "accepted"]
-    if status not in valid_statuses:
-        return f"Error: Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+    try:
+        application = _build_job_application(
+            company, position, status, date_applied, application_deadline,
+            job_description, next_action, notes, contacts
+        )
+    except ValueError as e:
+        return f"Error: {e}"
     
-    if date_applied is None:
-        date_applied = date.today().isoformat()
+    _tracker_store.insert("applications", application)
     
-    data = _load_job_applications()
+    return f"✅ Job application added successfully!\n\nID: {application['id']}\nCompany: {company}\nPosition: {position}\nStatus: {status}\nDate Applied: {application['date_applied']}"
+
+
+def add_job_applications_bulk(applications: list[dict]):
+    """
+    Add several job applications in a single tracker write.
     
-    # Generate unique ID
-    app_id = str(uuid.uuid4())[:8]
+    Every item is validated on its own; valid items are saved together and
+    invalid ones are reported without blocking the rest.
     
-    # Process contacts
-    contact_list = [c.strip() for c in contacts.split(",")] if contacts else []
+    Args:
+        applications (list): One object per application with the same fields as
+                             add_job_application (company and position are required;
+                             contacts may also be a list of names)
     
-    application = {
-        "id": app_id,
-        "company": company,
-        "position": position,
-        "status": status,
-        "date_applied": date_applied,
-        "application_deadline": application_deadline or "",
-        "job_description": job_description,
-        "cover_letter_generated": False,
-        "next_action": next_action,
-        "notes": notes,
-        "contacts": contact_list,
-        "last_updated": datetime.now().isoformat()
-    }
+    Returns:
+        str: Count of added applications and one result line per item
     
-    data["applications"].append(application)
-    _save_job_applications(data)
+    Example:
+        >>> add_job_applications_bulk([
+                {"company": "NOAA", "position": "Fisheries Biologist"},
+                {"company": "USGS", "position": "Hydrologist", "status": "interviewed"}
+            ])
+        "✅ Added 2/2 job applications
+          1. ✅ 1a2b3c4d NOAA - Fisheries Biologist (applied)
+          2. ✅ 5e6f7a8b USGS - Hydrologist (interviewed)"
+    """
+    if not applications:
+        return "Error: No applications provided"
     
-    return f"✅ Job application added successfully!\n\nID: {app_id}\nCompany: {company}\nPosition: {position}\nStatus: {status}\nDate Applied: {date_applied}"
+    added = []
+    lines = []
+    for n, item in enumerate(applications, 1):
+        try:
+            application = _build_job_application(**_bulk_item(item, _JOB_APPLICATION_FIELDS, ("company", "position")))
+        except ValueError as e:
+            lines.append(f"  {n}. ❌ Error: {e}")
+            continue
+        added.append(application)
+        lines.append(f"  {n}. ✅ {application['id']} {application['company']} - {application['position']} ({application['status']})")
+    
+    _tracker_store.insert_many("applications", added)
+    
+    return f"✅ Added {len(added)}/{len(applications)} job applications\n" + "\n".join(lines)
 
 
 def update_job_application(
@@ -229,18 +448,13 @@ def update_job_application(
     if not application_id and not company:
         return "Error: Must provide either application_id or company name"
     
-    data = _load_job_applications()
-    
     # Find application
     app_to_update = None
     if application_id:
-        for app in data["applications"]:
-            if app["id"] == application_id:
-                app_to_update = app
-                break
+        app_to_update = _tracker_store.get("applications", application_id)
     elif company:
         # Find most recent application for this company
-        matching_apps = [app for app in data["applications"] if app["company"].lower() == company.lower()]
+        matching_apps = _tracker_store.find("applications", company=company)
         if matching_apps:
             app_to_update = max(matching_apps, key=lambda x: x["last_updated"])
     
@@ -248,10 +462,10 @@ def update_job_application(
         return f"Error: No application found for {'ID ' + application_id if application_id else 'company ' + company}"
     
     # Update fields
+    app_to_update = _editable(app_to_update)
     if status:
-        valid_statuses = ["applied", "interview_scheduled", "interviewed", "rejected", "offer", "accepted"]
-        if status not in valid_statuses:
-            return f"Error: Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
+        if status not in _JOB_APPLICATION_STATUSES:
+            return f"Error: Invalid status '{status}'. Must be one of: {', '.join(_JOB_APPLICATION_STATUSES)}"
         app_to_update["status"] = status
     
     if next_action is not None:
@@ -269,7 +483,7 @@ def update_job_application(
     
     app_to_update["last_updated"] = datetime.now().isoformat()
     
-    _save_job_applications(data)
+    _tracker_store.update("applications", app_to_update)
     
     return f"✅ Updated: {app_to_update['company']} - {app_to_update['position']}\nStatus: {app_to_update['status']}\nLast Updated: {app_to_update['last_updated']}"
 
@@ -278,19 +492,29 @@ def get_job_applications(
     status: str = None,
     company: str = None,
     days_back: int = None,
-    sort_by: str = "date_applied"
+    sort_by: str = None,
+    text: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None
 ):
     """
-    Query job applications with optional filters.
+    Query job applications with optional filters, one page at a time.
     
     Args:
         status (str, optional): Filter by status (e.g., "interview_scheduled")
         company (str, optional): Filter by company name (partial match)
         days_back (int, optional): Only show applications from last N days
-        sort_by (str): Sort by field - one of: date_applied, last_updated, company, status
+        sort_by (str, optional): Sort by field - one of: date_applied, last_updated, company, status,
+                                 relevance. Defaults to relevance when `text` is given, else date_applied.
+        text (str, optional): Keyword search over position, company, job description, notes
+                              and next action (ranked with BM25)
+        limit (int): Maximum applications to return (default: 20, at most 50)
+        cursor (str, optional): `next_cursor` from a previous call with the same filters,
+                                to fetch the next page
     
     Returns:
-        str: Formatted list of matching applications
+        str: Formatted page of matching applications with the total count and, if more
+             remain, the cursor for the next page
     
     Example:
         >>> get_job_applications(status="interview_scheduled")
@@ -312,6 +536,11 @@ def get_job_applications(
         cutoff_date = (date.today() - __import__('datetime').timedelta(days=days_back)).isoformat()
         applications = [app for app in applications if app["date_applied"] >= cutoff_date]
     
+    scores = {}
+    if text:
+        scores = _text_indexes["applications"].search(text)
+        applications = [app for app in applications if app["id"] in scores]
+    
     if not applications:
         filter_desc = []
         if status:
@@ -320,25 +549,40 @@ def get_job_applications(
             filter_desc.append(f"company={company}")
         if days_back:
             filter_desc.append(f"last {days_back} days")
+        if text:
+            filter_desc.append(f"text={text}")
         
         filter_str = " with filters: " + ", ".join(filter_desc) if filter_desc else ""
         return f"No applications found{filter_str}."
     
     # Sort
+    if sort_by is None:
+        sort_by = "relevance" if text else "date_applied"
     sort_fields = {
         "date_applied": lambda x: x["date_applied"],
         "last_updated": lambda x: x["last_updated"],
         "company": lambda x: x["company"],
-        "status": lambda x: x["status"]
+        "status": lambda x: x["status"],
+        "relevance": lambda x: scores.get(x["id"], 0.0)
     }
     
-    if sort_by in sort_fields:
-        applications = sorted(applications, key=sort_fields[sort_by], reverse=True)
+    if sort_by not in sort_fields:
+        return f"Error: Invalid sort_by '{sort_by}'. Must be one of: {', '.join(sort_fields)}"
+    
+    try:
+        applications, total, offset, next_cursor = _paginate(
+            applications, sort_by, sort_fields[sort_by], limit, cursor
+        )
+    except ValueError as e:
+        return f"Error: {e}"
+    
+    if not applications:
+        return f"No more applications (all {total} shown)."
     
     # Format output
-    result = [f"📊 Found {len(applications)} application(s):\n"]
+    result = [f"📊 Found {total} application(s), showing {offset + 1}-{offset + len(applications)}:\n"]
     
-    for i, app in enumerate(applications, 1):
+    for i, app in enumerate(applications, offset + 1):
         deadline_str = f" | Deadline: {app['application_deadline']}" if app['application_deadline'] else ""
         next_action_str = f"\n   Next: {app['next_action']}" if app['next_action'] else ""
         cover_letter_str = " ✓ Cover Letter" if app.get('cover_letter_generated') else ""
@@ -348,6 +592,9 @@ def get_job_applications(
             f"   ID: {app['id']} | Status: {app['status']} | Applied: {app['date_applied']}{deadline_str}{next_action_str}"
         )
     
+    if next_cursor:
+        result.append(f"➡️ {total - offset - len(applications)} more. next_cursor: {next_cursor}")
+    
     return "\n\n".join(result)
 
 
@@ -369,28 +616,23 @@ def delete_job_application(application_id: str = None, company: str = None):
     if not application_id and not company:
         return "Error: Must provide either application_id or company name"
     
-    data = _load_job_applications()
-    
     # Find and remove application
-    original_count = len(data["applications"])
-    
     if application_id:
-        data["applications"] = [app for app in data["applications"] if app["id"] != application_id]
+        record_id = application_id
         identifier = f"ID {application_id}"
     elif company:
         # Find most recent to delete
-        matching_apps = [app for app in data["applications"] if app["company"].lower() == company.lower()]
+        matching_apps = _tracker_store.find("applications", company=company)
         if matching_apps:
             app_to_delete = max(matching_apps, key=lambda x: x["last_updated"])
-            data["applications"] = [app for app in data["applications"] if app["id"] != app_to_delete["id"]]
+            record_id = app_to_delete["id"]
             identifier = f"{app_to_delete['company']} - {app_to_delete['position']}"
         else:
             return f"Error: No application found for company '{company}'"
     
-    if len(data["applications"]) == original_count:
+    if not _tracker_store.delete("applications", record_id):
         return f"Error: Application not found"
     
-    _save_job_applications(data)
     return f"✅ Deleted application: {identifier}"
 
 
@@ -398,31 +640,164 @@ def delete_job_application(application_id: str = None, company: str = None):
 # Cold Email Tracker - Track outreach to professors/researchers
 # ---------------------------------------------------------------------
 
-COLD_EMAILS_FILE = "cold_emails.json"
-
 def _load_cold_emails():
-    """Load cold emails from JSON file. Create file if it doesn't exist."""
-    if not os.path.exists(COLD_EMAILS_FILE):
-        initial_data = {"emails": []}
-        with open(COLD_EMAILS_FILE, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-        return initial_data
-    
-    try:
-        with open(COLD_EMAILS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print("[WARNING] Corrupted cold_emails.json, creating backup.")
-        if os.path.exists(COLD_EMAILS_FILE):
-            backup_name = f"cold_emails_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            os.rename(COLD_EMAILS_FILE, backup_name)
-        return {"emails": []}
+    """Load cold emails from the tracker store. Create the file if it doesn't exist."""
+    return _tracker_store.load("emails")
 
 
 def _save_cold_emails(data):
-    """Save cold emails to JSON file."""
-    with open(COLD_EMAILS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Save the whole cold emails document to the tracker store."""
+    _tracker_store.save("emails", data)
+
+
+_COLD_EMAIL_STATUSES = ["sent", "responded", "no_response", "follow_up_sent"]
+_COLD_EMAIL_FIELDS = (
+    "recipient_name", "recipient_email", "institution", "subject", "purpose",
+    "date_sent", "notes", "referred_by", "connection_strength",
+)
+_COLD_EMAIL_UPDATE_FIELDS = (
+    "email_id", "recipient_email", "recipient_name", "status", "response_date",
+    "follow_up_sent", "notes", "referred_by", "connection_strength",
+)
+
+
+def _new_cold_email(
+    recipient_name,
+    recipient_email,
+    institution="",
+    subject="",
+    purpose="",
+    date_sent=None,
+    notes="",
+    referred_by="",
+    connection_strength=1
+):
+    """Build the record for a first email to a recipient."""
+    return {
+        "id": str(uuid.uuid4())[:8],
+        "recipient_name": recipient_name,
+        "recipient_email": recipient_email,
+        "institution": institution,
+        "subject": subject,
+        "purpose": purpose,
+        "date_sent": date_sent or date.today().isoformat(),
+        "status": "sent",
+        "response_date": None,
+        "follow_up_dates": [],
+        "notes": notes,
+        "last_updated": datetime.now().isoformat(),
+        "referred_by": referred_by,
+        "connection_strength": connection_strength
+    }
+
+
+def _merge_cold_email(
+    existing_email,
+    recipient_name,
+    recipient_email,
+    institution="",
+    subject="",
+    purpose="",
+    date_sent=None,
+    notes="",
+    referred_by="",
+    connection_strength=1
+):
+    """Fold a repeated send to the same recipient into their record. Returns the updated field names."""
+    date_sent = date_sent or date.today().isoformat()
+    updated_fields = []
+    
+    # Update recipient_name if provided and different
+    if recipient_name and recipient_name != existing_email["recipient_name"]:
+        existing_email["recipient_name"] = recipient_name
+        updated_fields.append("name")
+    
+    # Update institution if provided and different
+    if institution and institution != existing_email["institution"]:
+        existing_email["institution"] = institution
+        updated_fields.append("institution")
+    
+    # Update subject if provided
+    if subject and subject != existing_email["subject"]:
+        existing_email["subject"] = subject
+        updated_fields.append("subject")
+    
+    # Update purpose if provided
+    if purpose and purpose != existing_email["purpose"]:
+        existing_email["purpose"] = purpose
+        updated_fields.append("purpose")
+    
+    # Add to follow-up dates if this is a new send
+    if date_sent not in existing_email.get("follow_up_dates", []):
+        existing_email["follow_up_dates"].append(date_sent)
+        updated_fields.append("follow-up date")
+    
+    # Append notes if provided
+    if notes:
+        if existing_email["notes"]:
+            existing_email["notes"] += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
+        else:
+            existing_email["notes"] = notes
+        updated_fields.append("notes")
+    
+    # Update referred_by if provided
+    if referred_by and referred_by != existing_email.get("referred_by", ""):
+        existing_email["referred_by"] = referred_by
+        updated_fields.append("referred_by")
+
+    # Update connection_strength if provided
+    if connection_strength != existing_email.get("connection_strength", 1):
+        existing_email["connection_strength"] = connection_strength
+        updated_fields.append("connection_strength")
+    
+    existing_email["last_updated"] = datetime.now().isoformat()
+    return updated_fields
+
+
+def _match_cold_email_by_name(emails, recipient_name):
+    """Return the single email whose recipient name contains recipient_name. Raises ValueError."""
+    matching_emails = [e for e in emails if recipient_name.lower() in e["recipient_name"].lower()]
+    if len(matching_emails) == 0:
+        raise ValueError(f"No email found matching name '{recipient_name}'")
+    elif len(matching_emails) > 1:
+        names = [f"{e['recipient_name']} ({e['recipient_email']})" for e in matching_emails]
+        raise ValueError(f"Multiple emails found matching '{recipient_name}': {', '.join(names)}. Please be more specific.")
+    return matching_emails[0]
+
+
+def _apply_cold_email_update(
+    email_to_update,
+    status=None,
+    response_date=None,
+    follow_up_sent=False,
+    notes=None,
+    referred_by=None,
+    connection_strength=None
+):
+    """Apply update_cold_email's changes to a record in place."""
+    if status:
+        email_to_update["status"] = status
+    if response_date:
+        email_to_update["response_date"] = response_date
+        if not status:
+            email_to_update["status"] = "responded"
+    if follow_up_sent:
+        email_to_update["follow_up_dates"].append(date.today().isoformat())
+        if not status:
+            email_to_update["status"] = "follow_up_sent"
+    if notes:
+        if email_to_update["notes"]:
+            email_to_update["notes"] += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
+        else:
+            email_to_update["notes"] = notes
+    
+    if referred_by is not None:
+        email_to_update["referred_by"] = referred_by
+    
+    if connection_strength is not None:
+        email_to_update["connection_strength"] = connection_strength
+    
+    email_to_update["last_updated"] = datetime.now().isoformat()
 
 
 def add_cold_email(
@@ -456,93 +831,98 @@ def add_cold_email(
     if date_sent is None:
         date_sent = date.today().isoformat()
     
-    data = _load_cold_emails()
+    fields = dict(
+        recipient_name=recipient_name, recipient_email=recipient_email, institution=institution,
+        subject=subject, purpose=purpose, date_sent=date_sent, notes=notes,
+        referred_by=referred_by, connection_strength=connection_strength
+    )
     
     # Check if an email to this recipient already exists
-    existing_email = None
-    for email in data["emails"]:
-        if email["recipient_email"].lower() == recipient_email.lower():
-            existing_email = email
-            break
+    matching_emails = _tracker_store.find("emails", recipient_email=recipient_email)
+    existing_email = matching_emails[0] if matching_emails else None
     
     if existing_email:
         # Update existing entry
-        updated_fields = []
-        
-        # Update recipient_name if provided and different
-        if recipient_name and recipient_name != existing_email["recipient_name"]:
-            existing_email["recipient_name"] = recipient_name
-            updated_fields.append("name")
-        
-        # Update institution if provided and different
-        if institution and institution != existing_email["institution"]:
-            existing_email["institution"] = institution
-            updated_fields.append("institution")
-        
-        # Update subject if provided
-        if subject and subject != existing_email["subject"]:
-            existing_email["subject"] = subject
-            updated_fields.append("subject")
-        
-        # Update purpose if provided
-        if purpose and purpose != existing_email["purpose"]:
-            existing_email["purpose"] = purpose
-            updated_fields.append("purpose")
-        
-        # Add to follow-up dates if this is a new send
-        if date_sent not in existing_email.get("follow_up_dates", []):
-            existing_email["follow_up_dates"].append(date_sent)
-            updated_fields.append("follow-up date")
-        
-        # Append notes if provided
-        if notes:
-            if existing_email["notes"]:
-                existing_email["notes"] += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
-            else:
-                existing_email["notes"] = notes
-            updated_fields.append("notes")
-        
-        # Update referred_by if provided
-        if referred_by and referred_by != existing_email.get("referred_by", ""):
-            existing_email["referred_by"] = referred_by
-            updated_fields.append("referred_by")
-
-        # Update connection_strength if provided
-        if connection_strength != existing_email.get("connection_strength", 1):
-            existing_email["connection_strength"] = connection_strength
-            updated_fields.append("connection_strength")
-        
-        existing_email["last_updated"] = datetime.now().isoformat()
-        _save_cold_emails(data)
+        existing_email = _editable(existing_email)
+        updated_fields = _merge_cold_email(existing_email, **fields)
+        _tracker_store.update("emails", existing_email)
         
         fields_str = ", ".join(updated_fields) if updated_fields else "no new information"
         return f"🔄 Updated existing email!\n\nID: {existing_email['id']}\nRecipient: {existing_email['recipient_name']} ({recipient_email})\nInstitution: {existing_email['institution'] or 'N/A'}\nUpdated: {fields_str}"
     
     else:
         # Create new entry
-        email_id = str(uuid.uuid4())[:8]
-        
-        cold_email = {
-            "id": email_id,
-            "recipient_name": recipient_name,
-            "recipient_email": recipient_email,
-            "institution": institution,
-            "subject": subject,
-            "purpose": purpose,
-            "date_sent": date_sent,
-            "status": "sent",
-            "response_date": None,
-            "follow_up_dates": [],
-            "notes": notes,
-            "last_updated": datetime.now().isoformat(),
-            "referred_by": referred_by,
-            "connection_strength": connection_strength
-        }
+        cold_email = _new_cold_email(**fields)
+        _tracker_store.insert("emails", cold_email)
         
-        data["emails"].append(cold_email)
-        _save_cold_emails(data)
+        return f"✅ Cold email tracked!\n\nID: {cold_email['id']}\nRecipient: {recipient_name} ({recipient_email})\nInstitution: {institution or 'N/A'}\nDate: {date_sent}"
+
+
+def add_cold_emails_bulk(emails: list[dict]):
+    """
+    Track several sent cold emails in a single tracker write.
+    
+    Each item behaves like add_cold_email: a recipient_email that is already
+    tracked (or appears earlier in the same batch) updates that record
+    instead of creating a new one. Invalid items are reported without
+    blocking the rest.
+    
+    Args:
+        emails (list): One object per email with the same fields as add_cold_email
+                       (recipient_name and recipient_email are required)
+    
+    Returns:
+        str: Counts of tracked and updated emails and one result line per item
+    
+    Example:
+        >>> add_cold_emails_bulk([
+                {"recipient_name": "Dr. Smith", "recipient_email": "smith@mit.edu", "institution": "MIT"},
+                {"recipient_name": "Dr. Lee", "recipient_email": "lee@ucsd.edu", "purpose": "PhD opportunity"}
+            ])
+        "✅ Tracked 2 new, updated 0 (2/2 ok)
+          1. ✅ 1a2b3c4d Dr. Smith (smith@mit.edu)
+          2. ✅ 5e6f7a8b Dr. Lee (lee@ucsd.edu)"
+    """
+    if not emails:
+        return "Error: No emails provided"
+    
+    # Validate the whole batch before changing anything
+    checked = []
+    for item in emails:
+        try:
+            checked.append((_bulk_item(item, _COLD_EMAIL_FIELDS, ("recipient_name", "recipient_email")), None))
+        except ValueError as e:
+            checked.append((None, e))
+    
+    by_address = {e["recipient_email"].lower(): e for e in _load_cold_emails()["emails"]}
+    changed = {}
+    created = updated = 0
+    lines = []
+    for n, (fields, error) in enumerate(checked, 1):
+        if error:
+            lines.append(f"  {n}. ❌ Error: {error}")
+            continue
         
-        return f"✅ Cold email tracked!\n\nID: {email_id}\nRecipient: {recipient_name} ({recipient_email})\nInstitution: {institution or 'N/A'}\nDate: {date_sent}"
+        address = fields["recipient_email"].lower()
+        existing_email = by_address.get(address)
+        if existing_email:
+            # Change a copy; the stored record stays as it is until the write succeeds
+            record = existing_email if existing_email["id"] in changed else _editable(existing_email)
+            by_address[address] = record
+            updated_fields = _merge_cold_email(record, **fields)
+            updated += 1
+            lines.append(f"  {n}. 🔄 {record['id']} {record['recipient_name']} ({record['recipient_email']}): "
+                         f"{', '.join(updated_fields) or 'no new information'}")
+        else:
+            record = _new_cold_email(**fields)
+            by_address[record["recipient_email"].lower()] = record
+            created += 1
+            lines.append(f"  {n}. ✅ {record['id']} {record['recipient_name']} ({record['recipient_email']})")
+        changed[record["id"]] = record
+    
+    _tracker_store.upsert_many("emails", list(changed.values()))
+    
+    return f"✅ Tracked {created} new, updated {updated} ({created + updated}/{len(emails)} ok)\n" + "\n".join(lines)
 
 
 def update_cold_email(
@@ -578,64 +958,117 @@ def update_cold_email(
     if not email_id and not recipient_email and not recipient_name:
         return "Error: Must provide email_id, recipient_email, or recipient_name"
     
-    valid_statuses = ["sent", "responded", "no_response", "follow_up_sent"]
-    if status and status not in valid_statuses:
-        return f"Error: Invalid status. Must be one of: {', '.join(valid_statuses)}"
-    
-    data = _load_cold_emails()
+    if status and status not in _COLD_EMAIL_STATUSES:
+        return f"Error: Invalid status. Must be one of: {', '.join(_COLD_EMAIL_STATUSES)}"
     
     # Find email
     email_to_update = None
     if email_id:
-        for email in data["emails"]:
-            if email["id"] == email_id:
-                email_to_update = email
-                break
+        email_to_update = _tracker_store.get("emails", email_id)
     elif recipient_email:
-        matching_emails = [e for e in data["emails"] if e["recipient_email"].lower() == recipient_email.lower()]
+        matching_emails = _tracker_store.find("emails", recipient_email=recipient_email)
         if matching_emails:
             email_to_update = max(matching_emails, key=lambda x: x["last_updated"])
     elif recipient_name:
         # Partial match on name
-        matching_emails = [e for e in data["emails"] if recipient_name.lower() in e["recipient_name"].lower()]
-        if len(matching_emails) == 0:
-            return f"Error: No email found matching name '{recipient_name}'"
-        elif len(matching_emails) > 1:
-            names = [f"{e['recipient_name']} ({e['recipient_email']})" for e in matching_emails]
-            return f"Error: Multiple emails found matching '{recipient_name}': {', '.join(names)}. Please be more specific."
-        else:
-            email_to_update = matching_emails[0]
+        try:
+            email_to_update = _match_cold_email_by_name(_load_cold_emails()["emails"], recipient_name)
+        except ValueError as e:
+            return f"Error: {e}"
     
     if not email_to_update:
         return "Error: No email found"
     
     # Update fields
-    if status:
-        email_to_update["status"] = status
-    if response_date:
-        email_to_update["response_date"] = response_date
-        if not status:
-            email_to_update["status"] = "responded"
-    if follow_up_sent:
-        email_to_update["follow_up_dates"].append(date.today().isoformat())
-        if not status:
-            email_to_update["status"] = "follow_up_sent"
-    if notes:
-        if email_to_update["notes"]:
-            email_to_update["notes"] += f"\n[{datetime.now().strftime('%Y-%m-%d')}] {notes}"
-        else:
-            email_to_update["notes"] = notes
+    email_to_update = _editable(email_to_update)
+    _apply_cold_email_update(
+        email_to_update, status, response_date, follow_up_sent, notes, referred_by, connection_strength
+    )
+    _tracker_store.update("emails", email_to_update)
     
-    if referred_by is not None:
-        email_to_update["referred_by"] = referred_by
+    return f"✅ Updated: {email_to_update['recipient_name']} ({email_to_update['recipient_email']})\nStatus: {email_to_update['status']}"
+
+
+def update_cold_emails_bulk(updates: list[dict]):
+    """
+    Update several cold email records in a single tracker write.
     
-    if connection_strength is not None:
-        email_to_update["connection_strength"] = connection_strength
+    Each item takes the same fields as update_cold_email and must identify
+    its record by email_id, recipient_email or recipient_name (partial
+    match). Items that fail validation or match no record are reported
+    without blocking the rest.
     
-    email_to_update["last_updated"] = datetime.now().isoformat()
-    _save_cold_emails(data)
+    Args:
+        updates (list): One object per update, e.g.
+                        {"recipient_name": "Dr. Davies", "status": "responded", "response_date": "2025-12-01"}
     
-    return f"✅ Updated: {email_to_update['recipient_name']} ({email_to_update['recipient_email']})\nStatus: {email_to_update['status']}"
+    Returns:
+        str: Count of updated records and one result line per item
+    
+    Example:
+        >>> update_cold_emails_bulk([
+                {"recipient_email": "smith@mit.edu", "follow_up_sent": True},
+                {"recipient_name": "Dr. Lee", "status": "no_response"}
+            ])
+        "✅ Updated 2/2 cold emails
+          1. ✅ Dr. Smith (smith@mit.edu) → follow_up_sent
+          2. ✅ Dr. Lee (lee@ucsd.edu) → no_response"
+    """
+    if not updates:
+        return "Error: No updates provided"
+    
+    emails = _load_cold_emails()["emails"]
+    by_id = {e["id"]: e for e in emails}
+    by_address = {}
+    for e in emails:
+        address = e["recipient_email"].lower()
+        if address not in by_address or e["last_updated"] > by_address[address]["last_updated"]:
+            by_address[address] = e
+    
+    # Validate every item and find its record before changing anything
+    checked = []
+    for item in updates:
+        try:
+            fields = dict(_bulk_item(item, _COLD_EMAIL_UPDATE_FIELDS, ()))
+            email_id = fields.pop("email_id", None)
+            recipient_email = fields.pop("recipient_email", None)
+            recipient_name = fields.pop("recipient_name", None)
+            if not email_id and not recipient_email and not recipient_name:
+                raise ValueError("Must provide email_id, recipient_email, or recipient_name")
+            if fields.get("status") and fields["status"] not in _COLD_EMAIL_STATUSES:
+                raise ValueError(f"Invalid status. Must be one of: {', '.join(_COLD_EMAIL_STATUSES)}")
+            
+            if email_id:
+                email_to_update = by_id.get(email_id)
+            elif recipient_email:
+                email_to_update = by_address.get(recipient_email.lower())
+            else:
+                email_to_update = _match_cold_email_by_name(emails, recipient_name)
+            if not email_to_update:
+                raise ValueError(f"No email found for {email_id or recipient_email}")
+        except ValueError as e:
+            checked.append((None, None, e))
+            continue
+        checked.append((email_to_update["id"], fields, None))
+    
+    changed = {}
+    updated = 0
+    lines = []
+    for n, (record_id, fields, error) in enumerate(checked, 1):
+        if error:
+            lines.append(f"  {n}. ❌ Error: {error}")
+            continue
+        
+        # Change a copy; the stored record stays as it is until the write succeeds
+        email_to_update = changed.get(record_id) or _editable(by_id[record_id])
+        _apply_cold_email_update(email_to_update, **fields)
+        changed[record_id] = email_to_update
+        updated += 1
+        lines.append(f"  {n}. ✅ {email_to_update['recipient_name']} ({email_to_update['recipient_email']}) → {email_to_update['status']}")
+    
+    _tracker_store.upsert_many("emails", list(changed.values()))
+    
+    return f"✅ Updated {updated}/{len(updates)} cold emails\n" + "\n".join(lines)
 
 
 def query_cold_emails(
@@ -643,7 +1076,8 @@ def query_cold_emails(
     institution: str = None,
     recipient_name: str = None,
     days_back: int = None,
-    awaiting_response: bool = False
+    awaiting_response: bool = False,
+    text: str = None
 ):
     """
     Query cold emails with optional filters.
@@ -654,6 +1088,8 @@ def query_cold_emails(
         recipient_name (str, optional): Filter by name (partial match)
         days_back (int, optional): Show emails from last N days
         awaiting_response (bool): Show only sent emails with no response
+        text (str, optional): Keyword search over name, institution, subject, purpose and notes.
+                              Results are ranked by relevance (BM25) instead of date.
     
     Returns:
         str: Formatted list of matching emails
@@ -673,12 +1109,18 @@ def query_cold_emails(
         emails = [e for e in emails if e["date_sent"] >= cutoff_date]
     if awaiting_response:
         emails = [e for e in emails if e["status"] in ["sent", "follow_up_sent"] and not e["response_date"]]
+    if text:
+        scores = _text_indexes["emails"].search(text)
+        emails = [e for e in emails if e["id"] in scores]
     
     if not emails:
         return "No cold emails found with those filters."
     
-    # Sort by date
-    emails = sorted(emails, key=lambda x: x["date_sent"], reverse=True)
+    # Sort by relevance for keyword searches, otherwise by date
+    if text:
+        emails = sorted(emails, key=lambda x: scores[x["id"]], reverse=True)
+    else:
+        emails = sorted(emails, key=lambda x: x["date_sent"], reverse=True)
     
     # Format output
     result = [f"📧 Found {len(emails)} cold email(s):\n"]
@@ -780,34 +1222,61 @@ def generate_network_graph():
 # ---------------------------------------------------------------------
 
 def _load_job_opportunities():
-    """Load job opportunities from JSON file. Create file if it doesn't exist."""
-    if not os.path.exists(JOB_OPPORTUNITIES_FILE):
-        initial_data = {"opportunities": []}
-        with open(JOB_OPPORTUNITIES_FILE, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-        return initial_data
-    
-    try:
-        with open(JOB_OPPORTUNITIES_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print("[WARNING] Corrupted job_opportunities.json, creating backup.")
-        if os.path.exists(JOB_OPPORTUNITIES_FILE):
-            backup_name = f"job_opportunities_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            os.rename(JOB_OPPORTUNITIES_FILE, backup_name)
-        return {"opportunities": []}
+    """Load job opportunities from the tracker store. Create the file if it doesn't exist."""
+    return _tracker_store.load("opportunities")
 
 
 def _save_job_opportunities(data):
-    """Save job opportunities to JSON file."""
-    with open(JOB_OPPORTUNITIES_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    """Save the whole job opportunities document to the tracker store."""
+    _tracker_store.save("opportunities", data)
+    _job_key_index.invalidate()
+    _minhash_index.invalidate()
+
+
+# Persisted (company, title, location) -> id index used for O(1) duplicate checks
+_job_key_index = JobKeyIndex(
+    JOB_OPPORTUNITIES_FILE,
+    lambda: _load_job_opportunities()["opportunities"],
+    lambda: _tracker_store.revision("opportunities"),
+)
+
+# MinHash/LSH index used to catch near-duplicate postings (e.g. "II" vs "2", other job boards)
+_minhash_index = MinHashIndex(
+    JOB_OPPORTUNITIES_FILE,
+    lambda: _load_job_opportunities()["opportunities"],
+    lambda: _tracker_store.revision("opportunities"),
+)
 
 
 # ---------------------------------------------------------------------
 # Job Fair Tools
 # ---------------------------------------------------------------------
 
+# Documents the pitch / interview prep / cover letter context is drawn from
+CV_DOCUMENTS = ["Professional Curriculum Vitae.docx", "Resume.docx"]
+
+# Approximate token budget for CV context in a prompt
+CV_CONTEXT_TOKENS = int(os.getenv("CV_CONTEXT_TOKENS", str(DEFAULT_TOKEN_BUDGET)))
+
+# Heading-level sections of the CV documents, indexed for retrieval
+_cv_sections = CVSectionIndex(lambda filename: read_document(filename))
+
+
+def _cv_context(query, filenames=None, token_budget=None):
+    """
+    CV and resume sections most relevant to a company / role, within the token budget.
+    
+    Args:
+        query (str): Company name, role and/or job description
+        filenames (list, optional): Documents to draw from (default: CV_DOCUMENTS)
+        token_budget (int, optional): Approximate token budget (default: CV_CONTEXT_TOKENS)
+    
+    Returns:
+        str: Selected sections grouped by document, or "" if no document could be read
+    """
+    return _cv_sections.retrieve(query, filenames or CV_DOCUMENTS, token_budget or CV_CONTEXT_TOKENS)
+
+
 def elevator_pitch_tool(company_name: str, job_description: str = ""):
     """
     Generate a 30-second elevator pitch tailored to a specific company.
@@ -819,19 +1288,8 @@ def elevator_pitch_tool(company_name: str, job_description: str = ""):
     Returns:
         str: A tailored elevator pitch.
     """
-    # In a real scenario, we would read the CV here. For now, we'll assume the agent passes relevant context 
-    # or we rely on the LLM's knowledge of the user from the session.
-    # But since this is a tool, we should probably read the CV to be safe/robust if called standalone.
-    
-    # Read CV and Resume
-    cv_text = read_document("Professional Curriculum Vitae.docx")
-    resume_text = read_document("Resume.docx")
-    
-    context = ""
-    if not cv_text.startswith("Error"):
-        context += f"\nCV Content:\n{cv_text}\n"
-    if not resume_text.startswith("Error"):
-        context += f"\nResume Content:\n{resume_text}\n"
+    # Only the CV / resume sections relevant to this company and role
+    context = _cv_context(f"{company_name} {job_description}")
         
     return f"Please generate an elevator pitch for {company_name}. Key JD points: {job_description}. \n\nMy Background Context:\n{context}"
 
@@ -928,78 +1386,233 @@ This portfolio is managed by my **AI Agent** powered by Gemini.
 
 
 def _load_serpapi_usage():
-    """Load SerpAPI usage tracker."""
-    if not os.path.exists(SERPAPI_USAGE_FILE):
-        initial_data = {"monthly_limit": 200, "searches": []}
-        with open(SERPAPI_USAGE_FILE, "w", encoding="utf-8") as f:
-            json.dump(initial_data, f, indent=2)
-        return initial_data
-    
-    try:
-        with open(SERPAPI_USAGE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        print("[WARNING] Corrupted serpapi_usage.json, resetting.")
-        return {"monthly_limit": 200, "searches": []}
+    """Load SerpAPI usage tracker (cached until the file changes on disk)."""
+    return _serpapi_ledger.load()
 
 
 def _save_serpapi_usage(data):
     """Save SerpAPI usage tracker."""
-    with open(SERPAPI_USAGE_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _serpapi_ledger.save(data)
 
 
 def _count_searches_this_month(usage_data):
     """Count searches in current month."""
-    current_month = datetime.now().strftime("%Y-%m")
-    return sum(1 for s in usage_data["searches"] if s["date"].startswith(current_month))
+    return usage_data["monthly_counts"].get(month_key(), 0)
 
 
-def _log_serpapi_search(query, results_count):
-    """Log a SerpAPI search."""
-    usage_data = _load_serpapi_usage()
-    usage_data["searches"].append({
-        "date": datetime.now().isoformat(),
-        "query": query,
-        "results": results_count
-    })
-    _save_serpapi_usage(usage_data)
+def _log_serpapi_search(query, results_count, reserved=False):
+    """Log a SerpAPI search (settling its quota reservation if it had one)."""
+    _serpapi_ledger.record(query, results_count, reserved=reserved)
 
 
-def _is_duplicate_job(job, existing_jobs):
+def _serpapi_fetch(params, log_query, results_key, usage_limit=None, timeout=30, force_refresh=False):
+    """
+    Run a SerpAPI request, answering from the response cache when possible.
+    
+    Cache hits are free. A live request reserves quota first, is logged to the
+    usage ledger when it succeeds, and its response is cached.
+    
+    Args:
+        params (dict): SerpAPI query parameters
+        log_query (str): Query as shown in the usage report
+        results_key (str): Response field whose length is logged as the result count
+        usage_limit (int, optional): Monthly search budget (default: the ledger's monthly_limit)
+        timeout (float): Request timeout in seconds
+        force_refresh (bool): Skip the cache and always make a live request
+    
+    Returns:
+        tuple: (response dict, from_cache)
+    
+    Raises:
+        QuotaExceeded: If a live request would exceed usage_limit
+        requests.exceptions.RequestException: On network or HTTP errors
+    """
+    if not force_refresh:
+        cached = response_cache.get(params)
+        if cached is not None:
+            return cached, True
+    
+    if usage_limit is None:
+        usage_limit = _serpapi_ledger.monthly_limit()
+    if not _serpapi_ledger.reserve(usage_limit):
+        raise QuotaExceeded(_serpapi_ledger.count() + _serpapi_ledger.reserved, usage_limit)
+    
+    try:
+        results = serpapi_get(params, timeout=timeout)
+    except BaseException:
+        _serpapi_ledger.release()
+        raise
+    
+    _log_serpapi_search(log_query, len(results.get(results_key, [])), reserved=True)
+    if "error" not in results:
+        response_cache.put(params, results)
+    return results, False
+
+
+def _is_duplicate_job(job):
     """Check if a job is a duplicate based on company, title, and location."""
-    for existing in existing_jobs:
-        if (existing.get("company", "").lower() == job.get("company", "").lower() and
-            existing.get("title", "").lower() == job.get("title", "").lower() and
-            existing.get("location", "").lower() == job.get("location", "").lower()):
-            return True
-    return False
+    return _job_key_index.contains(job)
 
 
-def search_jobs_serpapi(
-    query: str,
-    location: str = "",
-    date_posted: str = "today",
-    max_results: int = 10
-):
+def _link_near_duplicate(existing, job):
     """
-    Core SerpAPI job search function.
+    Merge a near-duplicate search result into an existing opportunity by
+    recording the other job board and link it was seen on.
+    
+    Returns:
+        bool: True if the existing opportunity changed
+    """
+    changed = False
+    if job.get("via") and job["via"] != existing.get("via") and job["via"] not in existing.get("also_via", []):
+        existing.setdefault("also_via", []).append(job["via"])
+        changed = True
+    if job.get("link") and job["link"] != existing.get("link") and job["link"] not in existing.get("alternate_links", []):
+        existing.setdefault("alternate_links", []).append(job["link"])
+        changed = True
+    # Older opportunities only have the excerpt; take the full text from the repeat
+    # (the caller stores the text)
+    if job.get("description_id") and not existing.get("description_id"):
+        existing["description_id"] = job["description_id"]
+        changed = True
+    return changed
+
+
+_ingest_lock = threading.Lock()
+
+
+def _store_full_description(desc_id, full_descriptions):
+    """Write the full text behind a description_id to the description store, if we have it."""
+    text = (full_descriptions or {}).get(desc_id) if desc_id else None
+    if text is not None:
+        _description_store.put(text)
+
+
+def prune_job_descriptions(min_age=3600):
+    """
+    Delete stored full descriptions that no job opportunity references.
+    
+    Returns:
+        int: Number of description files deleted
+    """
+    referenced = {o.get("description_id") for o in _load_job_opportunities()["opportunities"]}
+    return _description_store.sweep(referenced, min_age)
+
+
+def _ingest_jobs(jobs, query, location="", full_descriptions=None):
+    """
+    Save search results as job opportunities, skipping exact duplicates and
+    linking near-duplicates to the opportunity they repeat.
     
     Args:
-        query: Job search query (e.g., "Marine Scientist")
-        location: Location (e.g., "Florida, USA")
-        date_posted: Filter by date - "today", "3days", "week", "month"
-        max_results: Number of results to return (max 10 for free tier)
+        jobs (list): Job dicts as returned by search_jobs_serpapi
+        query (str): Search query, stored on each new opportunity
+        location (str): Search location, stored on each new opportunity
+        full_descriptions (dict, optional): description_id -> full text; only the
+            texts of opportunities that are saved or linked go to the description store
     
     Returns:
-        List of job dictionaries
+        tuple: (new_jobs_count, near_duplicates_count)
+    """
+    # Searches may run concurrently (run_job_search.py); dedup + save must not interleave
+    with _ingest_lock:
+        new_opportunities = []
+        pending = {}
+        batch_keys = set()
+        linked = {}
+        near_duplicates_count = 0
+        
+        for job in jobs:
+            # Skip exact duplicates (against stored jobs and earlier results in this batch)
+            if _is_duplicate_job(job) or job_key(job) in batch_keys:
+                continue
+            batch_keys.add(job_key(job))
+        
+            # Link near-duplicates instead of saving them again
+            near = _minhash_index.find_near_duplicate(job)
+            if near:
+                near_id = near[0]
+                existing = pending.get(near_id) or linked.get(near_id) or _tracker_store.get("opportunities", near_id)
+                if existing is not None:
+                    near_duplicates_count += 1
+                    adopts_description = job.get("description_id") and not existing.get("description_id")
+                    if _link_near_duplicate(existing, job):
+                        if adopts_description:
+                            _store_full_description(job["description_id"], full_descriptions)
+                        if near_id not in pending:
+                            linked[near_id] = existing
+                    continue
+        
+            job_id = str(uuid.uuid4())[:8]
+            opportunity = {
+                "id": job_id,
+                "title": job["title"],
+                "company": job["company"],
+                "location": job["location"],
+                "link": job["link"],
+                "description": job["description"],
+                "description_id": job.get("description_id"),
+                "via": job["via"],
+                "date_posted": job["date_posted"],
+                "salary": job["salary"],
+                "date_discovered": datetime.now().isoformat(),
+                "search_query": f"{query} {location}".strip(),
+                "applied": False
+            }
+            _store_full_description(opportunity["description_id"], full_descriptions)
+            new_opportunities.append(opportunity)
+            pending[job_id] = opportunity
+            # Index right away so later results in this batch are checked against it
+            _minhash_index.add([opportunity])
+        
+        try:
+            _tracker_store.insert_many("opportunities", new_opportunities)
+        except Exception:
+            # The batch was already added to the MinHash index; let it revalidate
+            _minhash_index.invalidate()
+            raise
+        _job_key_index.add(new_opportunities)
+        for existing in linked.values():
+            _tracker_store.update("opportunities", existing)
+        
+        return len(new_opportunities), near_duplicates_count
+
+
+def _iter_job_pages(
+    query,
+    location="",
+    date_posted="today",
+    max_results=10,
+    max_pages=1,
+    usage_limit=None,
+    force_refresh=False
+):
+    """
+    Fetch Google Jobs results page by page, following next_page_token.
+    
+    Pages are requested lazily: a caller that stops iterating spends no
+    quota on the pages it didn't ask for. Each live page is one search.
+    
+    Args:
+        query: Job search query
+        location: Location
+        date_posted: "today", "3days", "week" or "month"
+        max_results: Results per page (max 10 for free tier)
+        max_pages: Page budget for this query
+        usage_limit: Monthly search budget for live requests (default: the monthly limit)
+        force_refresh: Bypass the response cache
+    
+    Yields:
+        tuple: (job dictionaries of one page, from_cache, full_descriptions) where
+        full_descriptions maps the description_id of each truncated description to
+        its full text (nothing is written to the description store here). On failure
+        a single {"error": ...} dict is yielded ("limit_reached": True if out of
+        quota) and iteration ends.
     """
     api_key = os.getenv("SERPAPI_KEY")
     
     if not api_key:
-        return {"error": "SERPAPI_KEY not found in environment variables. Please add it to your .env file."}
-    
-    url = "https://serpapi.com/search"
+        yield {"error": "SERPAPI_KEY not found in environment variables. Please add it to your .env file."}
+        return
     
     # Map date_posted to SerpAPI chips format
     date_mapping = {
@@ -1019,39 +1632,94 @@ def search_jobs_serpapi(
         "num": min(max_results, 10)  # Free tier limit
     }
     
-    try:
-        # Increased timeout for broad location searches (e.g., "United States") which can be slower
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        results = response.json()
+    for page in range(1, max_pages + 1):
+        log_query = query if page == 1 else f"{query} (page {page})"
+        try:
+            # Increased timeout for broad location searches (e.g., "United States") which can be slower
+            results, from_cache = _serpapi_fetch(params, log_query, "jobs_results", usage_limit, 30, force_refresh)
+        except QuotaExceeded as e:
+            yield {"error": str(e), "limit_reached": True}
+            return
+        except requests.exceptions.HTTPError as e:
+            error_msg = f"SerpAPI request failed: {str(e)}"
+            if e.response is not None:
+                try:
+                    error_msg += f"\nResponse: {e.response.text}"
+                except:
+                    error_msg += "\nResponse: (could not decode response text)"
+            yield {"error": error_msg}
+            return
+        except requests.exceptions.RequestException as e:
+            yield {"error": f"SerpAPI request failed: {str(e)}"}
+            return
+        except Exception as e:
+            yield {"error": f"Unexpected error: {str(e)}"}
+            return
         
         jobs = []
+        full_descriptions = {}
         for job in results.get("jobs_results", []):
+            description = job.get("description", "")
+            desc_id = None
+            if len(description) > INLINE_DESCRIPTION_CHARS:
+                desc_id = description_id(description)
+                full_descriptions[desc_id] = description
             jobs.append({
                 "title": job.get("title", ""),
                 "company": job.get("company_name", ""),
                 "location": job.get("location", ""),
                 "link": job.get("share_link", ""),
-                "description": job.get("description", "")[:500],  # Truncate long descriptions
+                # Truncate long descriptions; the full text goes to the description store
+                "description": description[:INLINE_DESCRIPTION_CHARS],
+                "description_id": desc_id,
                 "via": job.get("via", ""),
                 "date_posted": job.get("detected_extensions", {}).get("posted_at", ""),
                 "salary": job.get("detected_extensions", {}).get("salary", "")
             })
+        yield jobs, from_cache, full_descriptions
         
-        return jobs
-    
-    except requests.exceptions.HTTPError as e:
-        error_msg = f"SerpAPI request failed: {str(e)}"
-        if e.response is not None:
-            try:
-                error_msg += f"\nResponse: {e.response.text}"
-            except:
-                error_msg += "\nResponse: (could not decode response text)"
-        return {"error": error_msg}
-    except requests.exceptions.RequestException as e:
-        return {"error": f"SerpAPI request failed: {str(e)}"}
-    except Exception as e:
-        return {"error": f"Unexpected error: {str(e)}"}
+        next_page_token = results.get("serpapi_pagination", {}).get("next_page_token")
+        if not next_page_token or not jobs:
+            return
+        params = dict(params, next_page_token=next_page_token)
+
+
+def search_jobs_serpapi(
+    query: str,
+    location: str = "",
+    date_posted: str = "today",
+    max_results: int = 10,
+    usage_limit: int = None,
+    force_refresh: bool = False,
+    max_pages: int = 1
+):
+    """
+    Core SerpAPI job search function.
+    
+    Identical searches are answered from the response cache for
+    SERPAPI_CACHE_TTL_GOOGLE_JOBS seconds (default 12 hours) without using quota.
+    
+    Args:
+        query: Job search query (e.g., "Marine Scientist")
+        location: Location (e.g., "Florida, USA")
+        date_posted: Filter by date - "today", "3days", "week", "month"
+        max_results: Number of results per page (max 10 for free tier)
+        usage_limit: Monthly search budget for live requests (default: the monthly limit)
+        force_refresh: Bypass the response cache
+        max_pages: Follow next_page_token for up to this many pages (each page is one search)
+    
+    Returns:
+        List of job dictionaries, or {"error": ...} ("limit_reached": True if out of quota)
+    """
+    jobs = []
+    for page in _iter_job_pages(query, location, date_posted, max_results, max_pages, usage_limit, force_refresh):
+        if isinstance(page, dict):
+            if not jobs:
+                return page
+            print(f"[WARNING] Job search '{query}' stopped early: {page['error']}")
+            break
+        jobs.extend(page[0])
+    return jobs
 
 
 def search_jobs(
@@ -1060,11 +1728,21 @@ def search_jobs(
     date_posted: str = "week",
     max_results: int = 10,
     usage_limit: int = 95,
-    save_results: bool = True
+    save_results: bool = True,
+    force_refresh: bool = False,
+    max_pages: int = 1,
+    since: str = None
 ):
     """
     Search for jobs using SerpAPI with built-in usage tracking and storage.
     
+    Repeating a search within 12 hours returns the cached results and does not
+    count against the monthly quota.
+    
+    With max_pages > 1 further result pages are fetched one at a time and
+    saved as they arrive; paging stops early at the first page that adds no
+    new opportunities, so the budget is only spent while it keeps paying off.
+    
     Args:
         query: Job search query (e.g., "Marine Scientist", "Research Biologist")
         location: Location (e.g., "Florida, USA", "Remote")
@@ -1072,9 +1750,15 @@ def search_jobs(
         max_results: Number of results to return (max 10, default: 10)
         usage_limit: Stop searching when this many searches reached (default: 95)
         save_results: Save jobs to job_opportunities.json (default: True)
+        force_refresh: Ignore cached results and make a new (paid) search (default: False)
+        max_pages: Maximum result pages to fetch; each page costs one search (default: 1)
+        since: ISO time of the newest posting seen by a previous run. Paging stops at the
+               first page that contains already-known postings or postings older than this
     
     Returns:
-        dict with keys: "jobs", "new_jobs_count", "usage_stats", "warning"
+        dict with keys: "jobs", "new_jobs_count", "near_duplicates_count", "pages_fetched",
+        "stopped_early" (a page failed or the quota ran out before paging finished),
+        "limit_reached" (the usage limit stopped the search), "usage_stats", "warning"
     
     Example:
         >>> search_jobs("Marine Scientist", "Florida", "week")
@@ -1085,86 +1769,101 @@ def search_jobs(
             "warning": None
         }
     """
-    # Check current usage
-    usage_data = _load_serpapi_usage()
-    searches_this_month = _count_searches_this_month(usage_data)
-    remaining = usage_data["monthly_limit"] - searches_this_month
+    monthly_limit = _serpapi_ledger.monthly_limit()
+    
+    # Perform search page by page, saving each page as it arrives
+    # (quota is reserved before any live request, so parallel searches can't overspend it)
+    jobs = []
+    new_jobs_count = 0
+    near_duplicates_count = 0
+    pages_fetched = 0
+    live_pages = 0
+    live_new_jobs = 0
+    page_error = None
+    for page in _iter_job_pages(query, location, date_posted, max_results, max_pages, usage_limit, force_refresh):
+        if isinstance(page, dict):
+            page_error = page
+            break
+        page_jobs, from_cache, full_descriptions = page
+        pages_fetched += 1
+        live_pages += not from_cache
+        jobs.extend(page_jobs)
+        if save_results and page_jobs:
+            page_new, page_near = _ingest_jobs(page_jobs, query, location, full_descriptions)
+            new_jobs_count += page_new
+            near_duplicates_count += page_near
+            if not from_cache:
+                live_new_jobs += page_new
+            # Later pages only go further back; stop once a page adds nothing new
+            if page_new == 0:
+                break
+            # Incremental mode: stop once a page reaches what earlier runs already covered
+            if since and (page_new < len(page_jobs) or any(
+                    t and t.isoformat() < since
+                    for t in (posted_at(job["date_posted"]) for job in page_jobs))):
+                break
+    
+    # Feed the search planner: what this query's paid searches brought in
+    if save_results and live_pages:
+        _serpapi_ledger.record_yield(query, location, live_pages, live_new_jobs)
+    
+    if page_error and not pages_fetched:
+        jobs = page_error
     
     # Check if we're over the limit
-    if searches_this_month >= usage_limit:
+    if isinstance(jobs, dict) and jobs.get("limit_reached"):
+        searches_this_month = _serpapi_ledger.count() + _serpapi_ledger.reserved
         return {
             "jobs": [],
             "new_jobs_count": 0,
+            "pages_fetched": 0,
+            "stopped_early": True,
+            "limit_reached": True,
             "usage_stats": {
                 "used": searches_this_month,
-                "limit": usage_data["monthly_limit"],
-                "remaining": remaining
+                "limit": monthly_limit,
+                "remaining": monthly_limit - searches_this_month
             },
             "warning": f"⚠️ Usage limit reached ({searches_this_month}/{usage_limit}). Skipping search to preserve quota. Resets on the 1st of next month."
         }
     
-    # Perform search
-    jobs = search_jobs_serpapi(query, location, date_posted, max_results)
-    
     # Check for errors
     if isinstance(jobs, dict) and "error" in jobs:
+        searches_this_month = _serpapi_ledger.count()
         return {
             "jobs": [],
             "new_jobs_count": 0,
+            "pages_fetched": 0,
+            "stopped_early": True,
+            "limit_reached": False,
             "usage_stats": {
                 "used": searches_this_month,
-                "limit": usage_data["monthly_limit"],
-                "remaining": remaining
+                "limit": monthly_limit,
+                "remaining": monthly_limit - searches_this_month
             },
             "warning": f"❌ Search failed: {jobs['error']}"
         }
     
-    # Log the search
-    _log_serpapi_search(query, len(jobs))
-    searches_this_month += 1
-    remaining -= 1
-    
-    # Save results if requested
-    new_jobs_count = 0
-    if save_results and jobs:
-        opportunities_data = _load_job_opportunities()
-        existing_jobs = opportunities_data["opportunities"]
-        
-        for job in jobs:
-            # Skip duplicates
-            if not _is_duplicate_job(job, existing_jobs):
-                job_id = str(uuid.uuid4())[:8]
-                opportunity = {
-                    "id": job_id,
-                    "title": job["title"],
-                    "company": job["company"],
-                    "location": job["location"],
-                    "link": job["link"],
-                    "description": job["description"],
-                    "via": job["via"],
-                    "date_posted": job["date_posted"],
-                    "salary": job["salary"],
-                    "date_discovered": datetime.now().isoformat(),
-                    "search_query": f"{query} {location}".strip(),
-                    "applied": False
-                }
-                opportunities_data["opportunities"].append(opportunity)
-                new_jobs_count += 1
-        
-        if new_jobs_count > 0:
-            _save_job_opportunities(opportunities_data)
+    searches_this_month = _serpapi_ledger.count()
+    remaining = monthly_limit - searches_this_month
     
     # Generate warning if approaching limit
     warning = None
-    if searches_this_month >= usage_limit * 0.8:  # 80% threshold
+    if page_error:
+        warning = f"⚠️ Stopped after page {pages_fetched}: {page_error['error']}"
+    elif searches_this_month >= usage_limit * 0.8:  # 80% threshold
         warning = f"⚠️ Approaching usage limit: {searches_this_month}/{usage_limit} searches used this month"
     
     return {
         "jobs": jobs,
         "new_jobs_count": new_jobs_count,
+        "near_duplicates_count": near_duplicates_count,
+        "pages_fetched": pages_fetched,
+        "stopped_early": page_error is not None,
+        "limit_reached": bool(page_error and page_error.get("limit_reached")),
         "usage_stats": {
             "used": searches_this_month,
-            "limit": usage_data["monthly_limit"],
+            "limit": monthly_limit,
             "remaining": remaining
         },
         "warning": warning,
@@ -1176,19 +1875,28 @@ def get_job_opportunities(
     days_back: int = None,
     company: str = None,
     title: str = None,
-    sort_by: str = "date_discovered"
+    sort_by: str = None,
+    text: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str = None
 ):
     """
-    Query saved job opportunities with optional filters.
+    Query saved job opportunities with optional filters, one page at a time.
     
     Args:
         days_back: Only show jobs discovered in last N days
         company: Filter by company name (partial match)
         title: Filter by job title (partial match)
-        sort_by: Sort by field - "date_discovered", "company", "title" (default: "date_discovered")
+        sort_by: Sort by field - "date_discovered", "company", "title", "relevance"
+                 (default: "relevance" when `text` is given, else "date_discovered")
+        text: Keyword search over title, company, location and description (ranked with BM25),
+              e.g. "coral restoration GIS"
+        limit: Maximum opportunities to return (default: 20, at most 50)
+        cursor: `next_cursor` from a previous call with the same filters, to fetch the next page
     
     Returns:
-        Formatted string with matching job opportunities
+        Formatted string with one page of matching job opportunities, the total count and,
+        if more remain, the cursor for the next page
     
     Example:
         >>> get_job_opportunities(days_back=7, title="Marine")
@@ -1211,37 +1919,110 @@ def get_job_opportunities(
     if title:
         opportunities = [opp for opp in opportunities if title.lower() in opp["title"].lower()]
     
+    scores = {}
+    if text:
+        scores = _text_indexes["opportunities"].search(text)
+        opportunities = [opp for opp in opportunities if opp["id"] in scores]
+    
     if not opportunities:
         return "No job opportunities found with those filters."
     
     # Sort
+    if sort_by is None:
+        sort_by = "relevance" if text else "date_discovered"
     sort_fields = {
         "date_discovered": lambda x: x["date_discovered"],
         "company": lambda x: x["company"],
-        "title": lambda x: x["title"]
+        "title": lambda x: x["title"],
+        "relevance": lambda x: scores.get(x["id"], 0.0)
     }
     
-    if sort_by in sort_fields:
-        opportunities = sorted(opportunities, key=sort_fields[sort_by], reverse=True)
+    if sort_by not in sort_fields:
+        return f"Error: Invalid sort_by '{sort_by}'. Must be one of: {', '.join(sort_fields)}"
+    
+    try:
+        opportunities, total, offset, next_cursor = _paginate(
+            opportunities, sort_by, sort_fields[sort_by], limit, cursor
+        )
+    except ValueError as e:
+        return f"Error: {e}"
+    
+    if not opportunities:
+        return f"No more job opportunities (all {total} shown)."
     
     # Format output
-    result = [f"📋 Found {len(opportunities)} job opportunity/opportunities:\n"]
+    result = [f"📋 Found {total} job opportunity/opportunities, showing {offset + 1}-{offset + len(opportunities)}:\n"]
     
-    for i, opp in enumerate(opportunities, 1):
+    for i, opp in enumerate(opportunities, offset + 1):
         date_str = datetime.fromisoformat(opp["date_discovered"]).strftime("%b %d")
         salary_str = f" | {opp['salary']}" if opp['salary'] else ""
         applied_str = " ✅ APPLIED" if opp.get('applied') else ""
+        also_via_str = f" (also: {', '.join(opp['also_via'])})" if opp.get('also_via') else ""
         
         result.append(
             f"{i}. {opp['title']} - {opp['company']}{applied_str}\n"
-            f"   📍 {opp['location']} | Discovered: {date_str} | Via: {opp['via']}{salary_str}\n"
+            f"   📍 {opp['location']} | Discovered: {date_str} | Via: {opp['via']}{also_via_str}{salary_str}\n"
             f"   🔗 {opp['link']}\n"
             f"   ID: {opp['id']}"
         )
     
+    if next_cursor:
+        result.append(f"➡️ {total - offset - len(opportunities)} more. next_cursor: {next_cursor}")
+    
     return "\n\n".join(result)
 
 
+def get_job_description(job_id: str):
+    """
+    Get the full description of a saved job opportunity.
+    
+    Saved opportunities only keep the first 500 characters of the posting;
+    use this before matching a job against the CV, writing a cover letter or
+    preparing for an interview.
+    
+    Args:
+        job_id: Job opportunity ID (from job_opportunities_query_tool)
+    
+    Returns:
+        Title, company and the full job description text
+    
+    Example:
+        >>> get_job_description("abc12345")
+        "📄 Marine Scientist - NOAA (Key West, FL)
+        
+        NOAA is seeking a Marine Scientist to..."
+    """
+    opp = _tracker_store.get("opportunities", job_id)
+    if not opp:
+        return f"Error: Job opportunity with ID '{job_id}' not found"
+    
+    description = opp.get("description", "")
+    if opp.get("description_id"):
+        full_text = _description_store.get(opp["description_id"])
+        if full_text is None:
+            print(f"[WARNING] Full description {opp['description_id']} missing, using the saved excerpt.")
+        else:
+            description = full_text
+    
+    if not description:
+        return f"No description saved for {opp['title']} - {opp['company']}. Link: {opp['link']}"
+    return f"📄 {opp['title']} - {opp['company']} ({opp['location']})\n\n{description}"
+
+
+def plan_job_searches(searches, usage_limit: int = 95):
+    """
+    Split today's share of the SerpAPI quota across scheduled job searches.
+    
+    Args:
+        searches (list): Search configs with "query", "location" and optional "max_pages"
+        usage_limit (int): Monthly search budget (default: 95)
+    
+    Returns:
+        tuple: (plan, budget) as returned by search_planner.plan_searches
+    """
+    return plan_searches(searches, _load_serpapi_usage(), usage_limit)
+
+
 def get_serpapi_usage_report():
     """
     Get detailed SerpAPI usage report.
@@ -1275,9 +2056,8 @@ def get_serpapi_usage_report():
         ""
     ]
     
-    # Recent searches
-    current_month = datetime.now().strftime("%Y-%m")
-    recent = [s for s in usage_data["searches"] if s["date"].startswith(current_month)][-5:]
+    # Recent searches (the usage file only holds the current month)
+    recent = usage_data["searches"][-5:]
     
     if recent:
         report.append("Recent Searches:")
@@ -1304,37 +2084,36 @@ def delete_job_opportunity(job_id: str):
         >>> delete_job_opportunity("abc12345")
         "✅ Deleted job opportunity: Marine Scientist - NOAA"
     """
-    data = _load_job_opportunities()
-    
     # Find and remove job
-    original_count = len(data["opportunities"])
-    job_to_delete = None
-    
-    for opp in data["opportunities"]:
-        if opp["id"] == job_id:
-            job_to_delete = opp
-            break
+    job_to_delete = _tracker_store.get("opportunities", job_id)
     
     if not job_to_delete:
         return f"Error: Job opportunity with ID '{job_id}' not found"
     
-    data["opportunities"] = [opp for opp in data["opportunities"] if opp["id"] != job_id]
-    
-    if len(data["opportunities"]) == original_count:
+    if not _tracker_store.delete("opportunities", job_id):
         return f"Error: Failed to delete job opportunity"
+    _job_key_index.remove(job_id)
+    _minhash_index.remove(job_id)
+    
+    # Drop the full description unless another opportunity shares it
+    desc_id = job_to_delete.get("description_id")
+    if desc_id and not any(o.get("description_id") == desc_id for o in _load_job_opportunities()["opportunities"]):
+        _description_store.delete(desc_id)
     
-    _save_job_opportunities(data)
     return f"✅ Deleted job opportunity: {job_to_delete['title']} - {job_to_delete['company']}"
 
 
 # Wrap as ADK FunctionTools
 job_tracker_add_tool = FunctionTool(func=add_job_application)
+job_tracker_bulk_add_tool = FunctionTool(func=add_job_applications_bulk)
 job_tracker_update_tool = FunctionTool(func=update_job_application)
 job_tracker_query_tool = FunctionTool(func=get_job_applications)
 job_tracker_delete_tool = FunctionTool(func=delete_job_application)
 
 cold_email_add_tool = FunctionTool(func=add_cold_email)
 cold_email_update_tool = FunctionTool(func=update_cold_email)
+cold_email_bulk_add_tool = FunctionTool(func=add_cold_emails_bulk)
+cold_email_bulk_update_tool = FunctionTool(func=update_cold_emails_bulk)
 cold_email_query_tool = FunctionTool(func=query_cold_emails)
 
 network_graph_tool = FunctionTool(func=generate_network_graph)
@@ -1342,6 +2121,7 @@ network_graph_tool = FunctionTool(func=generate_network_graph)
 # Job Search / Opportunities Tools
 job_search_tool = FunctionTool(func=search_jobs)
 job_opportunities_query_tool = FunctionTool(func=get_job_opportunities)
+job_description_tool = FunctionTool(func=get_job_description)
 serpapi_usage_tool = FunctionTool(func=get_serpapi_usage_report)
 job_opportunity_delete_tool = FunctionTool(func=delete_job_opportunity)
 
@@ -1354,27 +2134,32 @@ def search_google_scholar_serpapi(
     query: str,
     as_ylo: int = None,
     as_yhi: int = None,
-    max_results: int = 10
+    max_results: int = 10,
+    usage_limit: int = None,
+    force_refresh: bool = False
 ):
     """
     Core SerpAPI Google Scholar search function.
     
+    Identical searches are answered from the response cache for
+    SERPAPI_CACHE_TTL_GOOGLE_SCHOLAR seconds (default 7 days) without using quota.
+    
     Args:
         query: Search query (e.g., "coral bleaching")
         as_ylo: Start year (optional)
         as_yhi: End year (optional)
         max_results: Number of results to return (max 10 for free tier)
+        usage_limit: Monthly search budget for live requests (default: the monthly limit)
+        force_refresh: Bypass the response cache
     
     Returns:
-        List of result dictionaries
+        List of result dictionaries, or {"error": ...} ("limit_reached": True if out of quota)
     """
     api_key = os.getenv("SERPAPI_KEY")
     
     if not api_key:
         return {"error": "SERPAPI_KEY not found in environment variables."}
     
-    url = "https://serpapi.com/search"
-    
     params = {
         "engine": "google_scholar",
         "q": query,
@@ -1388,9 +2173,7 @@ def search_google_scholar_serpapi(
         params["as_yhi"] = as_yhi
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        results = response.json()
+        results, _ = _serpapi_fetch(params, f"Scholar: {query}", "organic_results", usage_limit, 10, force_refresh)
         
         organic_results = []
         for result in results.get("organic_results", []):
@@ -1405,6 +2188,8 @@ def search_google_scholar_serpapi(
         
         return organic_results
     
+    except QuotaExceeded as e:
+        return {"error": str(e), "limit_reached": True}
     except requests.exceptions.RequestException as e:
         return {"error": f"SerpAPI request failed: {str(e)}"}
     except Exception as e:
@@ -1416,37 +2201,35 @@ def search_google_scholar(
     year_start: int = None,
     year_end: int = None,
     max_results: int = 5,
-    usage_limit: int = 95
+    usage_limit: int = 95,
+    force_refresh: bool = False
 ):
     """
     Search Google Scholar using SerpAPI with usage tracking.
     
+    Repeated searches within 7 days come from the cache and don't use quota.
+    
     Args:
         query: Search query (e.g., "Acropora cervicornis restoration")
         year_start: Start year (optional)
         year_end: End year (optional)
         max_results: Number of results (default: 5)
         usage_limit: Stop searching when this many monthly searches reached (default: 95)
+        force_refresh: Ignore cached results and make a new (paid) search (default: False)
     
     Returns:
         Formatted string with search results
     """
-    # Check usage
-    usage_data = _load_serpapi_usage()
-    searches_this_month = _count_searches_this_month(usage_data)
-    
-    if searches_this_month >= usage_limit:
-        return f"⚠️ Usage limit reached ({searches_this_month}/{usage_data['monthly_limit']}). Search skipped."
+    # Perform search (usage is checked and logged for live requests only)
+    results = search_google_scholar_serpapi(query, year_start, year_end, max_results, usage_limit, force_refresh)
     
-    # Perform search
-    results = search_google_scholar_serpapi(query, year_start, year_end, max_results)
+    if isinstance(results, dict) and results.get("limit_reached"):
+        searches_this_month = _serpapi_ledger.count() + _serpapi_ledger.reserved
+        return f"⚠️ Usage limit reached ({searches_this_month}/{_serpapi_ledger.monthly_limit()}). Search skipped."
     
     if isinstance(results, dict) and "error" in results:
         return f"❌ Search failed: {results['error']}"
     
-    # Log usage
-    _log_serpapi_search(f"Scholar: {query}", len(results))
-    
     if not results:
         return "No results found."
     
@@ -1582,6 +2365,29 @@ async def generate_cover_letter(
             )
         "Cover letter generated successfully!
         Word: cover_letters/Google_ML_Engineer_2025-11-24.docx
+        PDF: cover_letters/Google_ML_Engineer_2025-11-24.pdf"
+    """
+    # Only the CV sections relevant to this job go into the prompt
+    cv_context = _cv_context(f"{position_title} {job_description} {custom_notes}", [cv_filename])
+    if not cv_context:
+        return f"Error: Could not read CV '{cv_filename}' from the documents folder."
+    
+    os.makedirs(COVER_LETTERS_FOLDER, exist_ok=True)
+    
+    prompt = f"""You are an expert career coach writing a cover letter for {candidate_name}.
+
+CANDIDATE BACKGROUND (relevant CV sections):
+{cv_context}
+
+TARGET POSITION: {position_title} at {company_name}
+
+JOB DESCRIPTION:
+{job_description}
+
+INSTRUCTIONS:
+- Write 3-4 concise paragraphs in a professional but warm tone
+- Connect specific experience, skills and results from the CV to the requirements in the job description
+- Explain why the candidate wants to work at {company_name} in particular
 - DO NOT include placeholder text like [Your Name], [Date], [Company Address] - just write the body paragraphs
 - Start directly with the salutation "Dear Hiring Manager," or similar
 
@@ -1627,17 +2433,15 @@ Generate the cover letter now (body paragraphs only):"""
             result_message += f"\n⚠️ {pdf_result}"
     
     # Update job application tracker if this application exists
-    data = _load_job_applications()
-    matching_apps = [app for app in data["applications"] 
-                    if app["company"].lower() == company_name.lower() 
-                    and app["position"].lower() == position_title.lower()]
+    matching_apps = [app for app in _tracker_store.find("applications", company=company_name)
+                    if app["position"].lower() == position_title.lower()]
     
     if matching_apps:
         # Update most recent matching application
         app_to_update = max(matching_apps, key=lambda x: x["last_updated"])
         app_to_update["cover_letter_generated"] = True
         app_to_update["last_updated"] = datetime.now().isoformat()
-        _save_job_applications(data)
+        _tracker_store.update("applications", app_to_update)
         result_message += f"\n\n📌 Updated application tracker for {company_name} - {position_title}"
     
     return result_message
@@ -1663,15 +2467,8 @@ async def interview_prep_master(company_name: str, role_title: str = "Candidate"
     if not os.path.exists(prep_dir):
         os.makedirs(prep_dir)
         
-    # Read CV and Resume
-    cv_text = read_document("Professional Curriculum Vitae.docx")
-    resume_text = read_document("Resume.docx")
-    
-    context = ""
-    if not cv_text.startswith("Error"):
-        context += f"\nCV Content:\n{cv_text}\n"
-    if not resume_text.startswith("Error"):
-        context += f"\nResume Content:\n{resume_text}\n"
+    # CV and resume sections relevant to the company and role
+    context = _cv_context(f"{company_name} {role_title}")
         
     if not context:
         return "Error: Could not read CV or Resume for context."
@@ -1722,7 +2519,11 @@ async def interview_prep_master(company_name: str, role_title: str = "Candidate"
 interview_prep_tool = FunctionTool(func=interview_prep_master)
 
 
-def read_document(filename: str = "Professional Curriculum Vitae.docx"):
+def read_document(
+    filename: str = "Professional Curriculum Vitae.docx",
+    max_pages: int = None,
+    structure_only: bool = False
+):
     """
     Reads a document (PDF or Word) from the local 'documents' folder and returns its text content.
 
@@ -1733,6 +2534,9 @@ def read_document(filename: str = "Professional Curriculum Vitae.docx"):
 
     Args:
         filename (str, optional): The name of the document to read. Defaults to None.
+        max_pages (int, optional): PDFs only - read just the first N pages, N >= 1 (much faster for long papers)
+        structure_only (bool, optional): Return only the outline instead of the text: title, page count
+                                         and bookmarks for PDFs, headings for Word documents
 
     Returns:
         str: Extracted text from the document, or an error message if the file doesn't exist
@@ -1746,22 +2550,52 @@ def read_document(filename: str = "Professional Curriculum Vitae.docx"):
     if not os.path.exists(filepath):
         return f"Error: File '{filename}' does not exist in the documents folder."
 
+    if not filename.lower().endswith((".pdf", ".docx")):
+        return "Error: Unsupported file type. Only .pdf and .docx are allowed."
+
+    if max_pages is not None and (isinstance(max_pages, bool) or not isinstance(max_pages, int) or max_pages < 1):
+        return f"Error: max_pages must be a whole number of at least 1 (got {max_pages!r}). Omit it to read the whole document."
+
+    is_pdf = filename.lower().endswith(".pdf")
     try:
-        if filename.lower().endswith(".pdf"):
-            reader = PdfReader(filepath)
-            text = "\n".join(page.extract_text() or "" for page in reader.pages)
-        elif filename.lower().endswith(".docx"):
-            doc = docx.Document(filepath)
-            text = "\n".join(p.text for p in doc.paragraphs)
+        if structure_only:
+            return _document_structure(filepath)
+        if max_pages is not None and is_pdf:
+            # Partial reads are cheap and not cached
+            text = pdf_extract.extract_text(filepath, max_pages=max_pages)
         else:
-            return "Error: Unsupported file type. Only .pdf and .docx are allowed."
-
+            # Parsed once per file version; later calls reuse the text until the file changes
+            text = document_text_cache.get(filepath, _extract_document_text)
         return text.strip() if text else "No text found in document."
     except Exception as e:
         return f"Failed to read document: {e}"
 
 
-papers_path = "chroma_db_research_papers_test"
+def _extract_document_text(filepath):
+    """Extract the text of a .pdf or .docx file."""
+    if filepath.lower().endswith(".pdf"):
+        # Long PDFs are split across the shared extraction process pool
+        return pdf_extract.extract_text(filepath)
+    doc = docx.Document(filepath)
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+def _document_structure(filepath):
+    """Outline of a .pdf (title, pages, bookmarks) or .docx (headings) without its body text."""
+    if filepath.lower().endswith(".pdf"):
+        return pdf_extract.extract_structure(filepath)
+    doc = docx.Document(filepath)
+    headings = []
+    for p in doc.paragraphs:
+        if p.style is None or not p.style.name.startswith("Heading") or not p.text.strip():
+            continue
+        level = p.style.name.split()[-1]
+        indent = "  " * (int(level) - 1) if level.isdigit() else ""
+        headings.append(f"{indent}- {p.text.strip()}")
+    return "Headings:\n" + "\n".join(headings) if headings else "Headings: (none)"
+
+
+papers_path = PAPERS_DB_PATH
 
 try:
     embedding_func = get_embedding_function()
@@ -1778,17 +2612,126 @@ except Exception as e:
     print(f"[WARNING] Failed to initialize ChromaDB: {e}")
     db_papers = None
 
+# Keyword prefilter + vector rerank with a per-query LRU cache
+paper_retriever = None
+if db_papers is not None:
+    from paper_search import HybridPaperRetriever
+    paper_retriever = HybridPaperRetriever(db_papers, papers_path)
+else:
+    # No Ollama / Chroma (e.g. GitHub Actions): use the prebuilt local index if there is one
+    try:
+        from local_paper_index import LOCAL_PAPER_INDEX_DIR, LocalPaperIndex
+        paper_retriever = LocalPaperIndex.open(LOCAL_PAPER_INDEX_DIR)
+    except ImportError:  # numpy not installed
+        paper_retriever = None
+    if paper_retriever is not None:
+        print(f"[INFO] Research paper search is using the local index {LOCAL_PAPER_INDEX_DIR} ({len(paper_retriever)} chunks)")
 
-def search_pdf(query: str):
-    if db_papers is None:
+
+def search_pdf(query: str, k: int = 8, fetch_k: int = 100):
+    """
+    Search the research paper database for passages relevant to a query.
+    
+    Args:
+        query (str): What to look for, e.g. "coral bleaching thermal tolerance"
+        k (int): Number of passages to return (default: 8). Passages are ranked by
+                 keyword match and meaning together, with no diversity step, so several
+                 may come from the same paper; raise k to see more papers
+        fetch_k (int): Keyword matches considered before reranking by meaning (default: 100, at least k)
+    
+    Returns:
+        list: Matching passages (with source paper and page), best first, or an error message
+    """
+    if paper_retriever is None:
         return "Error: Research paper database is not available in this environment."
-        
-    retriever = db_papers.as_retriever(search_kwargs={"k": 25,
-                                                      "fetch_k": 250,
-                                                      "lambda_mult": 0.8},
-                                       search_type="mmr")
+    
+    try:
+        return paper_retriever.search(query, k=k, fetch_k=fetch_k)
+    except ValueError as e:
+        return f"Error: {e}"
+
+
+# ---------------------------------------------------------------------
+# Async document / paper tools
+# ---------------------------------------------------------------------
+
+# Shared pool for blocking tool work (document parsing, embedding + retrieval).
+# Bounded so a burst of tool calls can't start an unbounded number of parses.
+BLOCKING_TOOL_WORKERS = 4
+READ_DOCUMENT_TIMEOUT = 60
+SEARCH_PDF_TIMEOUT = 30
+
+_blocking_tool_pool = ThreadPoolExecutor(max_workers=BLOCKING_TOOL_WORKERS, thread_name_prefix="blocking-tool")
+
+
+async def _run_blocking(func, *args, timeout=None, **kwargs):
+    """
+    Run a blocking function on the shared tool pool without blocking the event loop.
+    
+    Raises:
+        asyncio.TimeoutError: If it takes longer than timeout seconds. The worker
+        thread can't be interrupted and finishes in the background.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_blocking_tool_pool, functools.partial(func, *args, **kwargs))
+    return await asyncio.wait_for(future, timeout)
+
+
+async def read_document_async(
+    filename: str = "Professional Curriculum Vitae.docx",
+    max_pages: int = None,
+    structure_only: bool = False
+):
+    """
+    Reads a document (PDF or Word) from the local 'documents' folder and returns its text content,
+    without blocking other work while the file is parsed.
+
+    Supported file types: .pdf, .docx
+
+    Args:
+        filename (str, optional): The name of the document to read.
+                                  Defaults to 'Professional Curriculum Vitae.docx'.
+        max_pages (int, optional): PDFs only - read just the first N pages, N >= 1 (much faster for long papers)
+        structure_only (bool, optional): Return only the outline (PDF bookmarks / Word headings)
+
+    Returns:
+        str: Extracted text from the document, or an error message
+    """
+    try:
+        return await _run_blocking(read_document, filename, max_pages, structure_only, timeout=READ_DOCUMENT_TIMEOUT)
+    except asyncio.TimeoutError:
+        return f"Error: Reading '{filename}' timed out after {READ_DOCUMENT_TIMEOUT} seconds."
+
+
+async def search_pdf_async(query: str, k: int = 8, fetch_k: int = 100):
+    """
+    Search the user's research paper library for passages relevant to a query.
+    
+    Args:
+        query (str): What to look for, e.g. "coral bleaching thermal tolerance"
+        k (int): Number of passages to return (default: 8). Passages are ranked by
+                 keyword match and meaning together, with no diversity step, so several
+                 may come from the same paper; raise k to see more papers
+        fetch_k (int): Keyword matches considered before reranking by meaning (default: 100, at least k)
+    
+    Returns:
+        list: {"source", "page", "text"} dicts, best first, or an error message
+    """
+    try:
+        results = await _run_blocking(search_pdf, query, k, fetch_k, timeout=SEARCH_PDF_TIMEOUT)
+    except asyncio.TimeoutError:
+        return f"Error: Paper search timed out after {SEARCH_PDF_TIMEOUT} seconds."
+    except Exception as e:
+        return f"Error: Paper search failed: {e}"
+    if isinstance(results, str):
+        return results
+    return [
+        {"source": doc.metadata.get("source", ""), "page": doc.metadata.get("page"), "text": doc.page_content}
+        for doc in results
+    ]
+
 
-    return retriever.invoke(query)
+search_pdf_tool = FunctionTool(func=search_pdf_async)
 
 
 def create_gmail_tools(
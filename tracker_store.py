@@ -0,0 +1,904 @@
+"""
+Pluggable storage engines for the trackers in tools_2.py.
+
+The job application, cold email and job opportunity trackers are all
+documents of the form {"<records_key>": [ {"id": ..., ...}, ... ]}. This
+module hides where those records live behind a small TrackerStore API:
+
+- JsonTrackerStore:   the original behaviour - one JSON file per tracker,
+                      rewritten on every change.
+- JournaledJsonTrackerStore: JSON snapshot plus an append-only NDJSON
+                      mutation log per tracker. Mutations append one line;
+                      readers replay the log on top of the snapshot, and the
+                      log is folded into a new snapshot once it grows past
+                      TRACKER_JOURNAL_COMPACT_BYTES (and at process exit).
+- SqliteTrackerStore: one table per tracker with indexes on the fields the
+                      tools filter by. Mutations are single-row
+                      INSERT/UPDATE/DELETE statements.
+
+JSON documents are kept in a process-wide DocumentCache and only reparsed
+when the file's (mtime, size, inode) changes, so several tool calls in one
+agent turn share a single json.load.
+
+The backend is chosen with the TRACKER_BACKEND environment variable
+("json" by default, or "sqlite"). TRACKER_JOURNAL lists the JSON trackers
+that use the journal (comma separated, none by default, e.g. "emails").
+A journaled tracker's JSON file is a snapshot that lags behind the log
+until it is compacted; the log is not committed, so a process that is
+killed before compacting leaves the committed file stale until the next
+run. With the SQLite backend the JSON files
+are still the interchange format: each table is seeded from its file once,
+and export_json() (also run at exit for changed trackers) writes them back
+so the GitHub Actions commit step keeps producing diffable files.
+
+Usage:
+    python tracker_store.py export    # SQLite -> JSON files
+    python tracker_store.py import    # JSON files -> SQLite
+    python tracker_store.py compact   # fold journals into their JSON files
+"""
+
+import abc
+import atexit
+import json
+import os
+import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+TRACKER_BACKEND = os.getenv("TRACKER_BACKEND", "json").lower()
+TRACKER_DB_FILE = os.getenv("TRACKER_DB_FILE", "trackers.db")
+TRACKER_JOURNAL = [name.strip() for name in os.getenv("TRACKER_JOURNAL", "").split(",") if name.strip()]
+TRACKER_JOURNAL_COMPACT_BYTES = int(os.getenv("TRACKER_JOURNAL_COMPACT_BYTES", str(64 * 1024)))
+
+
+class TrackerSpec:
+    """
+    Describes one tracker document.
+
+    Args:
+        name (str): Tracker name used by the store API (e.g. "applications")
+        path (str): JSON file backing the tracker
+        records_key (str): Top-level key holding the record list
+        table (str): SQLite table name
+        indexed (list): Record fields mirrored into indexed SQLite columns
+    """
+
+    def __init__(self, name, path, records_key, table, indexed):
+        self.name = name
+        self.path = path
+        self.records_key = records_key
+        self.table = table
+        self.indexed = list(indexed)
+
+    def empty(self):
+        return {self.records_key: []}
+
+
+def default_specs(
+    applications_file="job_applications.json",
+    cold_emails_file="cold_emails.json",
+    opportunities_file="job_opportunities.json"
+):
+    """Build the tracker specs used by tools_2.py."""
+    return {
+        "applications": TrackerSpec(
+            "applications", applications_file, "applications", "job_applications",
+            ["status", "company", "date_applied"]
+        ),
+        "emails": TrackerSpec(
+            "emails", cold_emails_file, "emails", "cold_emails",
+            ["status", "recipient_email", "institution", "date_sent"]
+        ),
+        "opportunities": TrackerSpec(
+            "opportunities", opportunities_file, "opportunities", "job_opportunities",
+            ["company", "title", "location", "date_discovered"]
+        ),
+    }
+
+
+def _matches(record, filters):
+    """Case-insensitive equality match used by find()."""
+    for field, value in filters.items():
+        if str(record.get(field) or "").lower() != str(value).lower():
+            return False
+    return True
+
+
+class TrackerStore(abc.ABC):
+    """
+    Base class for tracker storage engines.
+
+    Records are plain dicts with a unique "id" field. load()/save() work on
+    the whole document; get/find/insert/update/delete work on single records
+    so backends that can do better than a full rewrite are free to.
+
+    Derived indexes can subscribe() to mutations made through the store and
+    compare revision() tokens to notice changes made by other processes.
+    """
+
+    def __init__(self, specs):
+        self.specs = specs
+        self._listeners = []
+
+    def spec(self, tracker):
+        return self.specs[tracker]
+
+    def subscribe(self, listener):
+        """
+        Register a change listener.
+
+        The listener is called after each write as
+        listener(tracker, upserted=[records], deleted=[ids], reset=bool);
+        reset=True means the whole document was replaced.
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, tracker, upserted=(), deleted=(), reset=False):
+        for listener in self._listeners:
+            listener(tracker, upserted=list(upserted), deleted=list(deleted), reset=reset)
+
+    @abc.abstractmethod
+    def revision(self, tracker):
+        """Token that changes whenever the tracker's stored data changes."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def load(self, tracker):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def save(self, tracker, data):
+        raise NotImplementedError
+
+    def get(self, tracker, record_id):
+        """Return the record with the given id, or None."""
+        for record in self.load(tracker)[self.spec(tracker).records_key]:
+            if record.get("id") == record_id:
+                return record
+        return None
+
+    def find(self, tracker, **filters):
+        """Return records whose fields equal the given values (case-insensitive)."""
+        records = self.load(tracker)[self.spec(tracker).records_key]
+        return [r for r in records if _matches(r, filters)]
+
+    def insert(self, tracker, record):
+        self.insert_many(tracker, [record])
+
+    @abc.abstractmethod
+    def insert_many(self, tracker, records):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def upsert_many(self, tracker, records):
+        """Replace stored records with the same id and append the rest, in one write."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, tracker, record):
+        """Replace the stored record that has the same id. Returns True if found."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, tracker, record_id):
+        """Delete a record by id. Returns True if a record was removed."""
+        raise NotImplementedError
+
+    def export_json(self, tracker=None):
+        """Write tracker(s) to their JSON files. No-op for the JSON backend."""
+        return []
+
+
+# ---------------------------------------------------------------------
+# Document cache - parsed JSON kept in memory, validated by file stat
+# ---------------------------------------------------------------------
+
+def _stat_key(path):
+    """Return the (mtime, size, inode) fingerprint of a file, or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class DocumentCache:
+    """
+    Process-wide cache of parsed JSON documents.
+
+    load() returns the cached object while the file's (mtime, size, inode)
+    fingerprint is unchanged and calls the loader otherwise. store() writes
+    through and refreshes the entry in place, so a save in this process
+    never causes a reparse.
+
+    The cached object is shared: callers that mutate it must save it.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path, loader):
+        """
+        Return the parsed document at path.
+
+        Args:
+            path (str): File the document is read from
+            loader (callable): Zero-argument function that parses the file
+
+        Returns:
+            The cached or freshly loaded document
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            fingerprint = _stat_key(path)
+            if entry is not None and fingerprint is not None and entry[0] == fingerprint:
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            data = loader()
+            # The loader may have created or renamed the file, so stat again
+            fingerprint = _stat_key(path)
+            if fingerprint is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (fingerprint, data)
+            return data
+
+    def store(self, path, data, writer):
+        """
+        Write a document with writer(path, data) and cache it.
+
+        Args:
+            path (str): File to write
+            data: Document to write and cache
+            writer (callable): Function that serializes data to path
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            writer(path, data)
+            fingerprint = _stat_key(path)
+            if fingerprint is None:
+                self._entries.pop(key, None)
+            else:
+                self._entries[key] = (fingerprint, data)
+
+    def invalidate(self, path=None):
+        """Drop one cached document, or all of them."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+
+document_cache = DocumentCache()
+
+
+# ---------------------------------------------------------------------
+# JSON backend
+# ---------------------------------------------------------------------
+
+def _write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _write_json_atomic(path, data):
+    """Write JSON to a temp file and rename it over path, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_json(spec):
+    """
+    Read a tracker JSON file. Create it if it doesn't exist and back up
+    corrupted files before starting fresh.
+    """
+    if not os.path.exists(spec.path):
+        initial_data = spec.empty()
+        _write_json(spec.path, initial_data)
+        return initial_data
+
+    try:
+        with open(spec.path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except json.JSONDecodeError:
+        print(f"[WARNING] Corrupted {spec.path}, creating backup and initializing fresh.")
+        if os.path.exists(spec.path):
+            stem, ext = os.path.splitext(spec.path)
+            backup_name = f"{stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}{ext}"
+            os.rename(spec.path, backup_name)
+        return spec.empty()
+
+
+class JsonTrackerStore(TrackerStore):
+    """
+    One JSON file per tracker, rewritten on every change and read through document_cache.
+
+    Mutations build a new document and only replace the cached one once it
+    has been written, so a failed write leaves what readers see unchanged.
+    """
+
+    def load(self, tracker):
+        spec = self.spec(tracker)
+        return document_cache.load(spec.path, lambda: _read_json(spec))
+
+    def _write(self, tracker, data):
+        document_cache.store(self.spec(tracker).path, data, _write_json)
+
+    def _replace_records(self, tracker, records):
+        """Write the tracker's document with a new record list."""
+        key = self.spec(tracker).records_key
+        data = dict(self.load(tracker))
+        data[key] = records
+        self._write(tracker, data)
+
+    def save(self, tracker, data):
+        self._write(tracker, data)
+        self._notify(tracker, reset=True)
+
+    def revision(self, tracker):
+        return _stat_key(self.spec(tracker).path)
+
+    def insert_many(self, tracker, records):
+        if not records:
+            return
+        stored = self.load(tracker)[self.spec(tracker).records_key]
+        self._replace_records(tracker, stored + list(records))
+        self._notify(tracker, upserted=records)
+
+    def upsert_many(self, tracker, records):
+        if not records:
+            return
+        stored = list(self.load(tracker)[self.spec(tracker).records_key])
+        positions = {r.get("id"): i for i, r in enumerate(stored)}
+        for record in records:
+            i = positions.get(record["id"])
+            if i is None:
+                positions[record["id"]] = len(stored)
+                stored.append(record)
+            else:
+                stored[i] = record
+        self._replace_records(tracker, stored)
+        self._notify(tracker, upserted=records)
+
+    def update(self, tracker, record):
+        stored = self.load(tracker)[self.spec(tracker).records_key]
+        for i, existing in enumerate(stored):
+            if existing.get("id") == record["id"]:
+                self._replace_records(tracker, stored[:i] + [record] + stored[i + 1:])
+                self._notify(tracker, upserted=[record])
+                return True
+        return False
+
+    def delete(self, tracker, record_id):
+        stored = self.load(tracker)[self.spec(tracker).records_key]
+        remaining = [r for r in stored if r.get("id") != record_id]
+        if len(remaining) == len(stored):
+            return False
+        self._replace_records(tracker, remaining)
+        self._notify(tracker, deleted=[record_id])
+        return True
+
+
+# ---------------------------------------------------------------------
+# Journaled JSON backend - snapshot + append-only NDJSON mutation log
+# ---------------------------------------------------------------------
+
+def journal_path(spec):
+    """Path of the mutation log kept next to a tracker's JSON snapshot."""
+    stem, _ = os.path.splitext(spec.path)
+    return f"{stem}.journal.ndjson"
+
+
+def journal_lock_path(spec):
+    """Path of the lock file that serializes journal writers across processes."""
+    stem, _ = os.path.splitext(spec.path)
+    return f"{stem}.journal.lock"
+
+
+def _lock_file(f):
+    """Block until this process holds an exclusive lock on the open file f."""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after ~10 seconds; keep waiting
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class JournaledJsonTrackerStore(JsonTrackerStore):
+    """
+    JSON store where the trackers listed in `journaled` are written as an
+    append-only log instead of full rewrites.
+
+    Each mutation appends one NDJSON record:
+        {"op": "upsert", "record": {...}}
+        {"op": "delete", "id": "..."}
+    Both operations are idempotent per id, so replaying a log over a snapshot
+    that already contains some of its entries (e.g. after a crash between
+    writing a snapshot and truncating the log) gives the same result. A torn
+    final line from a crash is skipped on replay.
+
+    The replayed view is kept in memory and only the new tail of the log is
+    read on later loads.
+
+    Writers hold a lock file (journal_lock_path) while they append, and
+    while a snapshot is written and the log truncated, so an append from
+    another process (the GUI and a scheduled run) can't land between those
+    two steps and be lost.
+    """
+
+    def __init__(self, specs, journaled=TRACKER_JOURNAL, compact_bytes=TRACKER_JOURNAL_COMPACT_BYTES):
+        super().__init__(specs)
+        self.journaled = {name for name in journaled if name in specs}
+        self.compact_bytes = compact_bytes
+        self._lock = threading.RLock()
+        self._views = {}
+        self._compacting = set()
+        self._held = {}  # tracker -> [lock file, depth] while this process holds the lock
+        if self.journaled:
+            atexit.register(self.compact_all)
+
+    @contextmanager
+    def _exclusive(self, tracker):
+        """Hold the thread lock and the tracker's cross-process lock file (reentrant)."""
+        with self._lock:
+            held = self._held.get(tracker)
+            if held is not None:
+                held[1] += 1
+            else:
+                f = open(journal_lock_path(self.spec(tracker)), "a+b")
+                try:
+                    _lock_file(f)
+                except BaseException:
+                    f.close()
+                    raise
+                held = self._held[tracker] = [f, 1]
+            try:
+                yield
+            finally:
+                held[1] -= 1
+                if held[1] == 0:
+                    del self._held[tracker]
+                    try:
+                        _unlock_file(held[0])
+                    finally:
+                        held[0].close()
+
+    def _apply(self, view, key, entry):
+        records = view["data"][key]
+        positions = view["positions"]
+        if entry.get("op") == "upsert":
+            record = entry["record"]
+            if record["id"] in positions:
+                records[positions[record["id"]]] = record
+            else:
+                positions[record["id"]] = len(records)
+                records.append(record)
+        elif entry.get("op") == "delete" and entry.get("id") in positions:
+            del records[positions.pop(entry["id"])]
+            view["positions"] = {r.get("id"): i for i, r in enumerate(records)}
+
+    def _view(self, tracker):
+        """Return the in-memory view, rebuilding or replaying the log tail as needed."""
+        spec = self.spec(tracker)
+        log = journal_path(spec)
+        log_size = os.path.getsize(log) if os.path.exists(log) else 0
+        view = self._views.get(tracker)
+        snapshot = _stat_key(spec.path)
+
+        if view is None or snapshot is None or view["snapshot"] != snapshot or view["offset"] > log_size:
+            data = _read_json(spec)
+            view = {
+                "snapshot": _stat_key(spec.path),
+                "offset": 0,
+                "data": data,
+                "positions": {r.get("id"): i for i, r in enumerate(data[spec.records_key])},
+            }
+            self._views[tracker] = view
+
+        if view["offset"] < log_size:
+            with open(log, "rb") as f:
+                f.seek(view["offset"])
+                chunk = f.read(log_size - view["offset"])
+            # Only consume complete lines; a partial line may still be being written
+            end = chunk.rfind(b"\n") + 1
+            for line in chunk[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    self._apply(view, spec.records_key, json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    print(f"[WARNING] Skipping unreadable entry in {log}")
+            view["offset"] += end
+        return view
+
+    def _append(self, tracker, entries):
+        spec = self.spec(tracker)
+        log = journal_path(spec)
+        lines = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries).encode("utf-8")
+        with open(log, "a+b") as f:
+            # Keep a torn line from an earlier crash separate from the new entries
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    lines = b"\n" + lines
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._view(tracker)
+        if os.path.getsize(log) > self.compact_bytes and tracker not in self._compacting:
+            self._compacting.add(tracker)
+            threading.Thread(target=self._compact_in_background, args=(tracker,), daemon=True).start()
+
+    def _compact_in_background(self, tracker):
+        try:
+            self.compact(tracker)
+        finally:
+            self._compacting.discard(tracker)
+
+    def load(self, tracker):
+        if tracker not in self.journaled:
+            return super().load(tracker)
+        with self._lock:
+            return self._view(tracker)["data"]
+
+    def revision(self, tracker):
+        if tracker not in self.journaled:
+            return super().revision(tracker)
+        log = journal_path(self.spec(tracker))
+        return (_stat_key(self.spec(tracker).path), os.path.getsize(log) if os.path.exists(log) else 0)
+
+    def _write(self, tracker, data):
+        if tracker not in self.journaled:
+            return super()._write(tracker, data)
+        spec = self.spec(tracker)
+        with self._exclusive(tracker):
+            _write_json_atomic(spec.path, data)
+            open(journal_path(spec), "w").close()
+            self._views[tracker] = {
+                "snapshot": _stat_key(spec.path),
+                "offset": 0,
+                "data": data,
+                "positions": {r.get("id"): i for i, r in enumerate(data[spec.records_key])},
+            }
+
+    def insert_many(self, tracker, records):
+        if tracker not in self.journaled:
+            return super().insert_many(tracker, records)
+        if records:
+            with self._exclusive(tracker):
+                self._append(tracker, [{"op": "upsert", "record": r} for r in records])
+            self._notify(tracker, upserted=records)
+
+    def upsert_many(self, tracker, records):
+        if tracker not in self.journaled:
+            return super().upsert_many(tracker, records)
+        # Journal entries are upserts already
+        self.insert_many(tracker, records)
+
+    def update(self, tracker, record):
+        if tracker not in self.journaled:
+            return super().update(tracker, record)
+        with self._exclusive(tracker):
+            if record["id"] not in self._view(tracker)["positions"]:
+                return False
+            self._append(tracker, [{"op": "upsert", "record": record}])
+        self._notify(tracker, upserted=[record])
+        return True
+
+    def delete(self, tracker, record_id):
+        if tracker not in self.journaled:
+            return super().delete(tracker, record_id)
+        with self._exclusive(tracker):
+            if record_id not in self._view(tracker)["positions"]:
+                return False
+            self._append(tracker, [{"op": "delete", "id": record_id}])
+        self._notify(tracker, deleted=[record_id])
+        return True
+
+    def compact(self, tracker):
+        """Fold the mutation log into a new JSON snapshot and truncate the log."""
+        spec = self.spec(tracker)
+        with self._exclusive(tracker):
+            if not os.path.exists(journal_path(spec)) or os.path.getsize(journal_path(spec)) == 0:
+                return
+            self._write(tracker, self._view(tracker)["data"])
+        # Content is unchanged; listeners only need the new revision
+        self._notify(tracker)
+
+    def compact_all(self):
+        """Compact every journaled tracker. Registered with atexit."""
+        for tracker in self.journaled:
+            try:
+                self.compact(tracker)
+            except Exception as e:
+                print(f"[WARNING] Failed to compact {tracker} journal: {e}")
+
+
+# ---------------------------------------------------------------------
+# SQLite backend
+# ---------------------------------------------------------------------
+
+class SqliteTrackerStore(TrackerStore):
+    """
+    One table per tracker. Each row keeps the full record as JSON in a
+    "data" column plus copies of the indexed fields; rowid preserves the
+    insertion order of the original JSON list.
+
+    A tracker is seeded from its JSON file once, the first time its table is
+    created; the import is recorded in the "meta" table, so a tracker whose
+    records were all deleted stays empty. Trackers changed through this
+    store are exported back to JSON at process exit.
+    """
+
+    def __init__(self, specs, db_file=TRACKER_DB_FILE):
+        super().__init__(specs)
+        self.db_file = db_file
+        self._writes = {name: 0 for name in specs}
+        self._exported = {name: 0 for name in specs}  # _writes count at the last export
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        for spec in specs.values():
+            self._create_table(spec)
+        self._exported = dict(self._writes)  # the initial import matches the JSON files
+        atexit.register(self.export_changed)
+
+    def _create_table(self, spec):
+        columns = "".join(f", {field} TEXT" for field in spec.indexed)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {spec.table} "
+                f"(id TEXT PRIMARY KEY{columns}, data TEXT NOT NULL)"
+            )
+            for field in spec.indexed:
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_{spec.table}_{field} "
+                    f"ON {spec.table} ({field} COLLATE NOCASE)"
+                )
+            imported = self._conn.execute(
+                "SELECT 1 FROM meta WHERE key = ?", (f"imported:{spec.table}",)
+            ).fetchone()
+            row_count = self._conn.execute(f"SELECT COUNT(*) FROM {spec.table}").fetchone()[0]
+        if imported:
+            return
+        if row_count == 0 and os.path.exists(spec.path):
+            self.import_json(spec.name)
+        else:
+            # A database from before the meta table, or no JSON file to seed from
+            self._mark_imported(spec)
+
+    def _mark_imported(self, spec):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (f"imported:{spec.table}", datetime.now().isoformat())
+            )
+
+    def _row(self, spec, record):
+        values = [record["id"]]
+        values.extend(None if record.get(f) is None else str(record.get(f)) for f in spec.indexed)
+        values.append(json.dumps(record, ensure_ascii=False))
+        return values
+
+    def _upsert(self, spec, records):
+        fields = ["id"] + spec.indexed + ["data"]
+        placeholders = ", ".join("?" for _ in fields)
+        assignments = ", ".join(f"{f} = excluded.{f}" for f in fields[1:])
+        self._conn.executemany(
+            f"INSERT INTO {spec.table} ({', '.join(fields)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}",
+            [self._row(spec, r) for r in records]
+        )
+
+    def _select(self, spec, where="", params=()):
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM {spec.table} {where} ORDER BY rowid", params
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def load(self, tracker):
+        spec = self.spec(tracker)
+        return {spec.records_key: self._select(spec)}
+
+    def revision(self, tracker):
+        # data_version changes on commits from other connections; _writes counts our own
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self._writes[tracker])
+
+    def save(self, tracker, data):
+        """Sync a whole document: upsert changed rows and delete missing ones."""
+        spec = self.spec(tracker)
+        records = data[spec.records_key]
+        with self._lock, self._conn:
+            stored = dict(self._conn.execute(f"SELECT id, data FROM {spec.table}").fetchall())
+            changed = [r for r in records
+                       if stored.get(r["id"]) != json.dumps(r, ensure_ascii=False)]
+            keep = {r["id"] for r in records}
+            stale = [(record_id,) for record_id in stored if record_id not in keep]
+            if stale:
+                self._conn.executemany(f"DELETE FROM {spec.table} WHERE id = ?", stale)
+            if changed:
+                self._upsert(spec, changed)
+            self._writes[tracker] += 1
+        self._notify(tracker, upserted=changed, deleted=[record_id for (record_id,) in stale])
+
+    def get(self, tracker, record_id):
+        records = self._select(self.spec(tracker), "WHERE id = ?", (record_id,))
+        return records[0] if records else None
+
+    def find(self, tracker, **filters):
+        spec = self.spec(tracker)
+        indexed = {f: v for f, v in filters.items() if f in spec.indexed}
+        where = " AND ".join(f"{f} = ? COLLATE NOCASE" for f in indexed)
+        records = self._select(spec, f"WHERE {where}" if where else "", tuple(indexed.values()))
+        rest = {f: v for f, v in filters.items() if f not in indexed}
+        return [r for r in records if _matches(r, rest)]
+
+    def insert_many(self, tracker, records):
+        if not records:
+            return
+        with self._lock, self._conn:
+            self._upsert(self.spec(tracker), records)
+            self._writes[tracker] += 1
+        self._notify(tracker, upserted=records)
+
+    def upsert_many(self, tracker, records):
+        # _upsert is INSERT ... ON CONFLICT DO UPDATE
+        self.insert_many(tracker, records)
+
+    def update(self, tracker, record):
+        spec = self.spec(tracker)
+        assignments = ", ".join(f"{f} = ?" for f in spec.indexed + ["data"])
+        row = self._row(spec, record)
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE {spec.table} SET {assignments} WHERE id = ?", row[1:] + row[:1]
+            )
+            self._writes[tracker] += 1
+        if cursor.rowcount > 0:
+            self._notify(tracker, upserted=[record])
+        return cursor.rowcount > 0
+
+    def delete(self, tracker, record_id):
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                f"DELETE FROM {self.spec(tracker).table} WHERE id = ?", (record_id,)
+            )
+            self._writes[tracker] += 1
+        if cursor.rowcount > 0:
+            self._notify(tracker, deleted=[record_id])
+        return cursor.rowcount > 0
+
+    def import_json(self, tracker):
+        """Replace a tracker's rows with the contents of its JSON file."""
+        spec = self.spec(tracker)
+        data = _read_json(spec)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {spec.table}")
+            self._upsert(spec, data[spec.records_key])
+            self._writes[tracker] += 1
+        self._mark_imported(spec)
+        self._notify(tracker, reset=True)
+        return len(data[spec.records_key])
+
+    def export_json(self, tracker=None):
+        trackers = [tracker] if tracker else list(self.specs)
+        written = []
+        for name in trackers:
+            spec = self.spec(name)
+            with self._lock:
+                writes = self._writes[name]
+                data = self.load(name)
+            _write_json(spec.path, data)
+            self._exported[name] = writes
+            written.append(spec.path)
+        return written
+
+    def export_changed(self):
+        """Export the trackers changed since their last export. Registered with atexit."""
+        for name in self.specs:
+            if self._writes[name] != self._exported[name]:
+                try:
+                    self.export_json(name)
+                except Exception as e:
+                    print(f"[WARNING] Failed to export {name} to JSON: {e}")
+
+
+def create_tracker_store(specs, backend=None, db_file=TRACKER_DB_FILE):
+    """
+    Create the storage engine selected by TRACKER_BACKEND.
+
+    Args:
+        specs (dict): Tracker name -> TrackerSpec
+        backend (str, optional): "json" or "sqlite". Defaults to TRACKER_BACKEND.
+        db_file (str): SQLite database file (sqlite backend only)
+
+    Returns:
+        TrackerStore: The configured store
+    """
+    backend = (backend or TRACKER_BACKEND).lower()
+    if backend == "sqlite":
+        return SqliteTrackerStore(specs, db_file)
+    if backend != "json":
+        print(f"[WARNING] Unknown TRACKER_BACKEND '{backend}', falling back to json.")
+    # Logs left by runs that journaled trackers which aren't journaled now
+    fold_journals(specs, [name for name in specs if name not in TRACKER_JOURNAL])
+    if TRACKER_JOURNAL:
+        return JournaledJsonTrackerStore(specs)
+    return JsonTrackerStore(specs)
+
+
+def fold_journals(specs, trackers=None):
+    """
+    Compact the journals of the given trackers (default: all) into their JSON files.
+
+    Returns:
+        list: Names of the trackers whose journal was folded in
+    """
+    pending = [
+        name for name in (specs if trackers is None else trackers)
+        if os.path.exists(journal_path(specs[name])) and os.path.getsize(journal_path(specs[name]))
+    ]
+    if pending:
+        store = JournaledJsonTrackerStore(specs, journaled=pending)
+        for name in pending:
+            store.compact(name)
+    return pending
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "export"
+    if command == "compact":
+        specs = default_specs()
+        for name in fold_journals(specs):
+            print(f"✅ Compacted {journal_path(specs[name])} into {specs[name].path}")
+        sys.exit(0)
+    store = SqliteTrackerStore(default_specs())
+
+    if command == "export":
+        for path in store.export_json():
+            print(f"✅ Exported {path}")
+    elif command == "import":
+        for name in store.specs:
+            print(f"✅ Imported {store.import_json(name)} {name} from {store.spec(name).path}")
+    else:
+        print(f"Unknown command '{command}'. Use 'export', 'import' or 'compact'.")
+        sys.exit(1)